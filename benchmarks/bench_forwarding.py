@@ -0,0 +1,120 @@
+"""Benchmark re-injection of grabbed, non-hotkey keys through the uinput clone.
+
+Compares the old forwarding loop (UInput.write_event() per event plus an
+extra syn() after every key) with KeyboardCapture's frame-batched path,
+which drops suppressed keys from the frame and writes each read batch with
+one os.write(). A keystroke is two kernel frames (MSC_SCAN, KEY, SYN_REPORT
+for press and release), delivered as one read() each like a real keyboard.
+Each UInput.write() is an fcntl(F_GETFL) access check plus a write(2).
+
+Writes go to /dev/null, which measures the Python and syscall overhead
+without a device (the input core's per-write cost comes on top on real
+hardware, so the gap there is larger).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_forwarding.py [keystrokes]
+"""
+
+import os
+import sys
+import time
+
+from evdev import InputEvent, UInput, ecodes
+
+from mouse_on_numpad.core import ErrorLogger
+from mouse_on_numpad.daemon.keyboard_capture import KeyboardCapture, _DeviceSlot
+
+
+class _ReplayDevice:
+    """Device stand-in returning prebuilt read() batches in rotation."""
+
+    def __init__(self, batches: list[list[InputEvent]]) -> None:
+        self.fd = -1
+        self.name = "bench"
+        self._batches = batches
+        self._index = 0
+
+    def read(self):
+        batch = self._batches[self._index]
+        self._index = (self._index + 1) % len(self._batches)
+        return iter(batch)
+
+
+def _keystroke_batches() -> list[list[InputEvent]]:
+    """Return press and release frames for a few ordinary keys."""
+    now = time.time()
+    sec, usec = int(now), int((now % 1) * 1_000_000)
+    batches = []
+    for code in (ecodes.KEY_A, ecodes.KEY_S, ecodes.KEY_D, ecodes.KEY_F):
+        for value in (1, 0):
+            batches.append([
+                InputEvent(sec, usec, ecodes.EV_MSC, ecodes.MSC_SCAN, 0x70000 + code),
+                InputEvent(sec, usec, ecodes.EV_KEY, code, value),
+                InputEvent(sec, usec, ecodes.EV_SYN, ecodes.SYN_REPORT, 0),
+            ])
+    return batches
+
+
+def _null_uinput() -> UInput:
+    """UInput bound to /dev/null: same Python call path, no device node."""
+    ui = UInput.__new__(UInput)
+    ui.fd = os.open("/dev/null", os.O_RDWR)
+    ui.path = "/dev/null"
+    return ui
+
+
+def _not_hotkey(code: int, pressed: bool) -> bool:
+    return False
+
+
+def bench_per_event(ui: UInput, keystrokes: int) -> tuple[float, float]:
+    """Old path: write_event() per event, plus syn() after each key."""
+    device = _ReplayDevice(_keystroke_batches())
+    start = time.perf_counter()
+    for _ in range(keystrokes * 2):
+        for event in list(device.read()):
+            if event.type == ecodes.EV_KEY:
+                pressed = event.value in (1, 2)
+                if not _not_hotkey(event.code, pressed):
+                    ui.write_event(event)
+                    ui.syn()
+            else:
+                ui.write_event(event)
+    elapsed = time.perf_counter() - start
+    # Per frame: MSC, KEY + syn, SYN = 4 writes, each fcntl() plus write(2)
+    return keystrokes / elapsed, 16.0
+
+
+def bench_batched(ui: UInput, keystrokes: int) -> tuple[float, float]:
+    """New path: KeyboardCapture buffers to SYN_REPORT and writes once per read."""
+    capture = KeyboardCapture(ErrorLogger(console_output=False))
+    capture._callback = _not_hotkey
+    slot = _DeviceSlot(_ReplayDevice(_keystroke_batches()), ui)
+    read_batch = capture._read_batch
+    start = time.perf_counter()
+    for _ in range(keystrokes * 2):
+        read_batch(slot)
+    elapsed = time.perf_counter() - start
+    capture.close()
+    return keystrokes / elapsed, capture.stats.forward_writes / keystrokes
+
+
+def main() -> None:
+    """Run both paths and print keystrokes/s, events/s and syscalls per keystroke."""
+    keystrokes = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    ui = _null_uinput()
+    try:
+        print(f"target: /dev/null, keystrokes: {keystrokes} (6 events each)")
+        for name, bench in (("per-event", bench_per_event), ("batched", bench_batched)):
+            bench(ui, keystrokes // 10)  # Warm up
+            rate, calls = bench(ui, keystrokes)
+            print(
+                f"{name:>10}: {rate:9.0f} keystrokes/s, {rate * 6:9.0f} events/s, "
+                f"{calls:.1f} syscalls/keystroke"
+            )
+    finally:
+        os.close(ui.fd)
+
+
+if __name__ == "__main__":
+    main()
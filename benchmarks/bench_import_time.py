@@ -0,0 +1,115 @@
+"""Benchmark import time of each CLI command path against a budget.
+
+Runs every command's imports in a fresh interpreter under -X importtime
+and sums the self time of all modules loaded after interpreter startup
+(the median of several runs). A command fails if it goes over its budget
+or loads a heavy dependency it does not use (GTK, Xlib, pynput, evdev,
+numpy).
+
+The --daemon path cannot be run without input devices, so it imports the
+modules run_daemon() imports instead of starting the daemon; it may load
+everything heavy except pynput, which only the legacy backends use.
+Budgets leave roughly 1.5x headroom over a warm run on a laptop; pass
+--scale to adjust them for slower machines.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_import_time.py [--runs N] [--scale F]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+HEAVY = ("gi", "Xlib", "pynput", "evdev", "numpy", "pystray")
+
+# Command -> (statements run after startup, budget in ms, heavy modules allowed)
+COMMANDS: dict[str, tuple[str, float, tuple[str, ...]]] = {
+    "--help": ("import mouse_on_numpad.main", 40.0, ()),
+    "--status/--toggle/--send": (
+        "import mouse_on_numpad.main\n"
+        "import mouse_on_numpad.core.control_channel",
+        100.0,
+        (),
+    ),
+    "--list-devices": (
+        "import mouse_on_numpad.main\n"
+        "import mouse_on_numpad.daemon.device_selector",
+        80.0,
+        ("evdev",),
+    ),
+    "--daemon": (
+        "import mouse_on_numpad.main\n"
+        "import mouse_on_numpad.core.error_logger\n"
+        "import mouse_on_numpad.core.config\n"
+        "import mouse_on_numpad.core.state_manager\n"
+        "import mouse_on_numpad.daemon.daemon_coordinator",
+        450.0,
+        ("gi", "Xlib", "evdev", "numpy", "pystray"),
+    ),
+}
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run code under -X importtime; return module -> self time (us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def measure(code: str, runs: int) -> tuple[float, set[str]]:
+    """Return (median import ms beyond startup, modules loaded)."""
+    startup = set(_import_times("pass"))
+    _import_times(code)  # Warm up (writes bytecode caches)
+    totals = []
+    modules: set[str] = set()
+    for _ in range(runs):
+        times = _import_times(code)
+        loaded = set(times) - startup
+        totals.append(sum(times[name] for name in loaded) / 1000)
+        modules = loaded
+    return statistics.median(totals), modules
+
+
+def main() -> int:
+    """Measure every command and report budget violations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per command (median)")
+    parser.add_argument("--scale", type=float, default=1.0, help="budget multiplier")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'command':26} {'import ms':>10} {'budget':>8}  heavy modules")
+    for command, (code, budget, allowed) in COMMANDS.items():
+        try:
+            elapsed, modules = measure(code, args.runs)
+        except RuntimeError as e:
+            failed = True
+            print(f"{command:26} {'-':>10} {budget:8.0f}  import failed: {e}")
+            continue
+        budget *= args.scale
+        heavy = sorted(
+            name for name in modules if name in HEAVY and name not in allowed
+        )
+        ok = elapsed <= budget and not heavy
+        failed |= not ok
+        print(
+            f"{command:26} {elapsed:10.1f} {budget:8.0f}  "
+            f"{', '.join(heavy) or '-'}{'' if ok else '  FAIL'}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Benchmark per-event UInput writes against batched FrameWriter frames.
+
+Compares the old UinputMouse emission (UInput.write() per axis plus syn())
+with FrameWriter's single packed write per frame. Each UInput.write() is an
+fcntl(F_GETFL) access check plus a write(2), so the old path costs six
+syscalls per pointer frame. Uses /dev/uinput when writable, otherwise
+/dev/null, which measures the same Python and syscall overhead without a
+device (the input core's per-write cost comes on top on real hardware).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_uinput_emit.py [frames]
+"""
+
+import os
+import sys
+import time
+
+from evdev import UInput, ecodes
+
+from mouse_on_numpad.input.uinput_frame import FrameWriter
+
+
+def _open_target() -> tuple[UInput, str, bool]:
+    """Return (device, label, owned) for the write target."""
+    if os.access("/dev/uinput", os.W_OK):
+        ui = UInput(
+            events={ecodes.EV_REL: [ecodes.REL_X, ecodes.REL_Y, ecodes.REL_WHEEL]},
+            name="mouse-on-numpad-bench",
+        )
+        return ui, "/dev/uinput", True
+    # UInput bound to /dev/null: same Python call path, no device node
+    ui = UInput.__new__(UInput)
+    ui.fd = os.open("/dev/null", os.O_RDWR)
+    ui.path = "/dev/null"
+    return ui, "/dev/null", False
+
+
+def bench_per_event(ui: UInput, frames: int) -> tuple[float, float]:
+    """Old path: UInput.write() per axis, then syn()."""
+    start = time.perf_counter()
+    for i in range(frames):
+        dx = (i & 7) + 1
+        ui.write(ecodes.EV_REL, ecodes.REL_X, dx)
+        ui.write(ecodes.EV_REL, ecodes.REL_Y, -dx)
+        ui.syn()
+    elapsed = time.perf_counter() - start
+    # Three writes, each an fcntl() access check plus write(2)
+    return elapsed / frames * 1e6, 6.0
+
+
+def bench_batched(ui: UInput, frames: int) -> tuple[float, float]:
+    """New path: FrameWriter.rel_frame() packs the frame and writes once."""
+    writer = FrameWriter(ui.fd)
+    frame = writer.rel_frame
+    start = time.perf_counter()
+    for i in range(frames):
+        dx = (i & 7) + 1
+        frame(dx, -dx)
+    elapsed = time.perf_counter() - start
+    return elapsed / frames * 1e6, writer.writes / frames
+
+
+def main() -> None:
+    """Run both paths and print µs and syscalls per frame."""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    ui, label, owned = _open_target()
+    try:
+        print(f"target: {label}, frames: {frames}")
+        for name, bench in (("per-event", bench_per_event), ("batched", bench_batched)):
+            bench(ui, frames // 10)  # Warm up
+            usec, calls = bench(ui, frames)
+            print(f"{name:>10}: {usec:6.2f} µs/frame, {calls:.1f} syscalls/frame")
+    finally:
+        if owned:
+            ui.close()
+        else:
+            os.close(ui.fd)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,7 @@ import gi  # type: ignore[import-untyped]
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gio, Gtk  # type: ignore[import-untyped]
 
-from .core.config import ConfigManager
+from .core.config import WRITE_BEHIND_DELAY, ConfigManager
 from .core.state_manager import StateManager
 from .ui.main_window import MainWindow
 
@@ -28,8 +28,8 @@ class Application(Gtk.Application):  # type: ignore[misc]
             flags=Gio.ApplicationFlags.DEFAULT_FLAGS,
         )
 
-        # Core components
-        self._config = ConfigManager()
+        # Core components (sliders change values continuously: coalesce writes)
+        self._config = ConfigManager(write_delay=WRITE_BEHIND_DELAY)
         self._state = StateManager()
 
         # UI components (initialized in do_activate)
@@ -39,6 +39,11 @@ class Application(Gtk.Application):  # type: ignore[misc]
         """Called once when application starts."""
         Gtk.Application.do_startup(self)
 
+    def do_shutdown(self) -> None:
+        """Write pending settings changes before exiting."""
+        self._config.flush()
+        Gtk.Application.do_shutdown(self)
+
     def do_activate(self) -> None:
         """Called when application is activated (e.g., settings requested).
 
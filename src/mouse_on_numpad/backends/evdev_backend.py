@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from collections.abc import Callable
 
 from .base import InputBackend
@@ -12,7 +13,11 @@ _logger = logging.getLogger(__name__)
 
 
 class EvdevBackend(InputBackend):
-    """Evdev backend — no hotkey/position support, requires input group + uinput."""
+    """Evdev backend — no hotkey/position support, requires input group + uinput.
+
+    Safe to call from any thread: every frame is built and written under a
+    lock, as in UinputMouse.
+    """
 
     def __init__(self) -> None:
         try:
@@ -60,6 +65,12 @@ class EvdevBackend(InputBackend):
         except Exception as e:
             raise RuntimeError(f"Failed to create virtual input device: {e}") from e
 
+        # Batched single-write emission shared with UinputMouse
+        from ..input.uinput_frame import FrameWriter
+
+        self._frame = FrameWriter(self._ui.fd)
+        self._lock = threading.Lock()  # One frame (add ... flush) at a time
+
         _logger.warning(
             "EvdevBackend initialized. Hotkey support DISABLED. "
             "This is a fallback backend with limited functionality."
@@ -74,9 +85,8 @@ class EvdevBackend(InputBackend):
 
     def move_mouse_relative(self, dx: int, dy: int) -> None:
         """Move mouse relative to current position."""
-        self._ui.write(self._ecodes.EV_REL, self._ecodes.REL_X, dx)
-        self._ui.write(self._ecodes.EV_REL, self._ecodes.REL_Y, dy)
-        self._ui.syn()
+        with self._lock:
+            self._frame.rel_frame(dx, dy)
 
     def click(self, button: str) -> None:
         """Perform mouse click (left/right/middle)."""
@@ -91,21 +101,18 @@ class EvdevBackend(InputBackend):
 
         btn_code = button_map[button]
 
-        # Press
-        self._ui.write(self._ecodes.EV_KEY, btn_code, 1)
-        self._ui.syn()
-
-        # Release
-        self._ui.write(self._ecodes.EV_KEY, btn_code, 0)
-        self._ui.syn()
+        # Press and release frames in one write
+        with self._lock:
+            self._frame.add(self._ecodes.EV_KEY, btn_code, 1)
+            self._frame.syn()
+            self._frame.add(self._ecodes.EV_KEY, btn_code, 0)
+            self._frame.syn()
+            self._frame.flush()
 
     def scroll(self, dx: int, dy: int) -> None:
         """Scroll mouse wheel."""
-        if dy != 0:
-            self._ui.write(self._ecodes.EV_REL, self._ecodes.REL_WHEEL, dy)
-        if dx != 0:
-            self._ui.write(self._ecodes.EV_REL, self._ecodes.REL_HWHEEL, dx)
-        self._ui.syn()
+        with self._lock:
+            self._frame.rel_frame(wheel=dy, hwheel=dx)
 
     def get_position(self) -> tuple[int, int]:
         """Get current mouse position (not supported)."""
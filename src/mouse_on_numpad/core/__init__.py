@@ -1,7 +1,27 @@
-"""Core infrastructure modules for Mouse on Numpad."""
+"""Core infrastructure modules for Mouse on Numpad.
 
-from .config import ConfigManager
-from .error_logger import ErrorLogger
-from .state_manager import StateManager
+Exports are imported on first access, so light submodules (e.g. the
+control channel client) load without the rest of the package.
+"""
 
-__all__ = ["ConfigManager", "StateManager", "ErrorLogger"]
+from typing import TYPE_CHECKING
+
+from ..lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import ConfigManager
+    from .config_watcher import ConfigWatcher
+    from .error_logger import ErrorLogger
+    from .state_manager import StateManager
+
+__all__ = ["ConfigManager", "ConfigWatcher", "StateManager", "ErrorLogger"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ConfigManager": "config",
+        "ConfigWatcher": "config_watcher",
+        "ErrorLogger": "error_logger",
+        "StateManager": "state_manager",
+    },
+)
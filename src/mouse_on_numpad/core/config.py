@@ -1,19 +1,42 @@
 """Configuration management with JSON persistence and XDG compliance."""
 
+import atexit
 import copy
 import json
 import os
 import shutil
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from .config_defaults import DEFAULT_CONFIG
+from .config_params import MovementParams, ScrollParams
 
+_P = TypeVar("_P", MovementParams, ScrollParams)
+
+# Write-behind window for interactive editors (seconds)
+WRITE_BEHIND_DELAY = 0.5
 
-class ConfigManager:
-    """Manage application configuration with JSON persistence (XDG-compliant)."""
 
-    def __init__(self, config_dir: Path | None = None) -> None:
+class ConfigManager:
+    """Manage application configuration with JSON persistence (XDG-compliant).
+
+    By default every change is written immediately. With write_delay set,
+    changes are kept in memory and written once per window (the first
+    unsaved change starts it), so dragging a slider in the settings GUI
+    costs one write and one backup instead of hundreds. Pending changes are
+    written by flush() and at interpreter exit, and survive reloads: they
+    are applied on top of the reloaded file.
+    """
+
+    def __init__(self, config_dir: Path | None = None, write_delay: float | None = None) -> None:
+        """Initialize ConfigManager.
+
+        Args:
+            config_dir: Config directory (defaults to $XDG_CONFIG_HOME/mouse-on-numpad)
+            write_delay: Coalesce writes over this many seconds (None: write on every change)
+        """
         if config_dir is None:
             xdg_config = os.environ.get("XDG_CONFIG_HOME", str(Path.home() / ".config"))
             self._config_dir = Path(xdg_config) / "mouse-on-numpad"
@@ -22,7 +45,19 @@ class ConfigManager:
 
         self._config_file = self._config_dir / "config.json"
         self._config: dict[str, Any] = {}
+        self._version = 0  # Bumped on every in-memory change
+        self._snapshots: dict[type, tuple[int, Any]] = {}
+        self._file_signature: tuple[int, int, int] | None = None
+        self._write_delay = write_delay
+        self._lock = threading.Lock()  # Guards in-memory edits against flushes
+        self._io_lock = threading.Lock()  # Keeps reloads out of a save in progress
+        self._dirty = False  # Changes not written yet (write-behind)
+        self._pending: dict[str, Any] = {}  # Unsaved set() values by key
+        self._replaced = False  # Unsaved reset() or load_profile()
+        self._timer: threading.Timer | None = None
         self._load()
+        if write_delay is not None:
+            atexit.register(self.flush)
 
     @property
     def config_dir(self) -> Path:
@@ -34,27 +69,90 @@ class ConfigManager:
         """Return the configuration file path."""
         return self._config_file
 
+    @property
+    def version(self) -> int:
+        """Return a counter that changes whenever the configuration changes."""
+        return self._version
+
+    @property
+    def pending(self) -> bool:
+        """Return True if changes are waiting to be written."""
+        return self._dirty
+
+    @property
+    def movement_params(self) -> MovementParams:
+        """Return an immutable snapshot of movement settings."""
+        return self._snapshot(MovementParams)
+
+    @property
+    def scroll_params(self) -> ScrollParams:
+        """Return an immutable snapshot of scroll settings."""
+        return self._snapshot(ScrollParams)
+
+    def _snapshot(self, cls: type[_P]) -> _P:
+        """Return a cached snapshot of cls, rebuilt when the version changes."""
+        cached = self._snapshots.get(cls)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        snapshot = cls.from_config(self)
+        self._snapshots[cls] = (self._version, snapshot)
+        return snapshot
+
     def _load(self) -> None:
-        """Load configuration from disk or create defaults."""
-        if self._config_file.exists():
+        """Load configuration from disk, or create defaults if unreadable."""
+        if self._read():
+            return
+        with self._lock:
+            self._config = copy.deepcopy(DEFAULT_CONFIG)
+            self._version += 1
+        self._save()
+
+    def _read(self) -> bool:
+        """Replace the configuration with the contents of config.json.
+
+        The signature is taken from the open file before reading, so a write
+        that lands during the read is seen as a change on the next check.
+        A missing or corrupt file leaves the current configuration in place.
+        Unsaved set() values are applied on top of the file (and stay
+        pending); an unsaved reset() or load_profile() keeps the file out.
+
+        Returns:
+            True if the file was read and applied
+        """
+        with self._io_lock:
             try:
                 with open(self._config_file, encoding="utf-8") as f:
-                    self._config = json.load(f)
-                # Merge with defaults to handle new keys
-                self._config = self._merge_defaults(self._config, DEFAULT_CONFIG)
-            except (json.JSONDecodeError, OSError):
-                # Corrupted file, use defaults
-                self._config = copy.deepcopy(DEFAULT_CONFIG)
-                self._save()
-        else:
-            self._config = copy.deepcopy(DEFAULT_CONFIG)
-            self._save()
+                    st = os.fstat(f.fileno())
+                    self._file_signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+                    loaded = json.load(f)
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+                return False
+            if not isinstance(loaded, dict):
+                return False
+            with self._lock:
+                if self._replaced:
+                    return False  # The pending write replaces the file anyway
+                # Merge with defaults to handle new keys (single swap for readers)
+                config = self._merge_defaults(loaded, DEFAULT_CONFIG)
+                for key, value in self._pending.items():
+                    _set_path(config, key, value)
+                self._config = config
+                self._version += 1
+        return True
+
+    def _stat_signature(self) -> tuple[int, int, int] | None:
+        """Return (mtime_ns, size, inode) of the config file, or None if missing."""
+        try:
+            st = os.stat(self._config_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
 
     def _merge_defaults(
         self, config: dict[str, Any], defaults: dict[str, Any]
     ) -> dict[str, Any]:
         """Deep merge config with defaults, preserving user values."""
-        result = defaults.copy()
+        result = copy.deepcopy(defaults)  # Edits must never reach DEFAULT_CONFIG
         for key, value in config.items():
             if key in result and isinstance(result[key], dict) and isinstance(value, dict):
                 result[key] = self._merge_defaults(value, result[key])
@@ -63,7 +161,21 @@ class ConfigManager:
         return result
 
     def _save(self) -> None:
-        """Save configuration to disk with backup."""
+        """Save configuration to disk with backup.
+
+        Writes a temp file and renames it over config.json, so readers (the
+        daemon's watcher) never see a partly written file.
+        """
+        with self._io_lock:
+            with self._lock:
+                data = json.dumps(self._config, indent=2)
+                self._dirty = False
+                self._pending.clear()
+                self._replaced = False
+            self._write(data)
+
+    def _write(self, data: str) -> None:
+        """Write data to config.json (backup, temp file, rename)."""
         # Ensure directory exists with secure permissions
         self._config_dir.mkdir(parents=True, exist_ok=True)
         os.chmod(self._config_dir, 0o700)
@@ -73,14 +185,65 @@ class ConfigManager:
             backup_path = self._config_file.with_suffix(".json.bak")
             shutil.copy2(self._config_file, backup_path)
 
-        # Write new config with secure permissions
-        with open(self._config_file, "w", encoding="utf-8") as f:
-            json.dump(self._config, f, indent=2)
-        os.chmod(self._config_file, 0o600)
+        # mkstemp creates the file with mode 0600
+        fd, tmp = tempfile.mkstemp(dir=self._config_dir, prefix=".config-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self._config_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        # Our own writes should not look like external changes
+        self._file_signature = self._stat_signature()
+
+    def _persist(self) -> None:
+        """Write now, or within the write-behind window."""
+        if self._write_delay is None:
+            self._save()
+            return
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                return  # Coalesced into the pending write
+            self._timer = threading.Timer(self._write_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending write-behind changes now."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+            dirty = self._dirty
+        if timer is not None:
+            timer.cancel()
+        if dirty:
+            self._save()
 
     def reload(self) -> None:
-        """Reload config from file (picks up external changes)."""
-        self._load()
+        """Reload config from file (picks up external changes).
+
+        Keeps the current configuration if the file is missing or corrupt
+        (e.g. caught mid-save by an editor); the file is never rewritten.
+        """
+        self._read()
+
+    def changed_on_disk(self) -> bool:
+        """Check whether config.json changed since it was last loaded or saved.
+
+        Only stats the file (mtime, size, inode); nothing is read or parsed.
+        """
+        return self._stat_signature() != self._file_signature
+
+    def reload_if_changed(self) -> bool:
+        """Reload config only if the file changed on disk.
+
+        Returns:
+            True if the configuration was reloaded
+        """
+        if not self.changed_on_disk():
+            return False
+        return self._read()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get config value by dot-notation key (e.g., 'movement.base_speed')."""
@@ -95,23 +258,29 @@ class ConfigManager:
 
     def set(self, key: str, value: Any) -> None:
         """Set config value by dot-notation key and persist to disk."""
-        keys = key.split(".")
-        config = self._config
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        config[keys[-1]] = value
-        self._save()
+        with self._lock:
+            _set_path(self._config, key, value)
+            self._pending[key] = value
+            self._version += 1
+        self._persist()
 
     def get_all(self) -> dict[str, Any]:
         """Return a deep copy of the entire configuration."""
-        return copy.deepcopy(self._config)
+        with self._lock:
+            return copy.deepcopy(self._config)
 
     def reset(self) -> None:
         """Reset configuration to defaults."""
-        self._config = copy.deepcopy(DEFAULT_CONFIG)
-        self._save()
+        self._replace(copy.deepcopy(DEFAULT_CONFIG))
+
+    def _replace(self, config: dict[str, Any]) -> None:
+        """Swap in a whole new configuration and persist it."""
+        with self._lock:
+            self._config = config
+            self._pending.clear()
+            self._replaced = True
+            self._version += 1
+        self._persist()
 
     # Profile management — delegated to ProfileManager mixin
 
@@ -133,8 +302,7 @@ class ConfigManager:
         loaded = _load_profile(self.profiles_dir, name)
         if loaded is None:
             return False
-        self._config = self._merge_defaults(loaded, DEFAULT_CONFIG)
-        self._save()
+        self._replace(self._merge_defaults(loaded, DEFAULT_CONFIG))
         return True
 
     def delete_profile(self, name: str) -> bool:
@@ -142,6 +310,16 @@ class ConfigManager:
         return _delete_profile(self.profiles_dir, name)
 
 
+def _set_path(config: dict[str, Any], key: str, value: Any) -> None:
+    """Set a dot-notation key in a nested config dict, creating sections."""
+    keys = key.split(".")
+    for k in keys[:-1]:
+        if k not in config:
+            config[k] = {}
+        config = config[k]
+    config[keys[-1]] = value
+
+
 def _list_profiles(profiles_dir: Path) -> list[str]:
     """List available profile names (without .json extension)."""
     if not profiles_dir.exists():
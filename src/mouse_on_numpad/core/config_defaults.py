@@ -8,7 +8,10 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "acceleration_rate": 1.08,  # Gentler acceleration
         "max_speed": 40,  # Lower cap for precision
         "move_delay": 20,  # Matches Windows MoveDelay=20ms
-        "curve": "exponential",  # linear, exponential, s-curve
+        "curve": "exponential",  # linear, exponential, s-curve, ease-in-out, logarithmic, spline
+        "curve_points": [],  # Spline curve: [[ms, multiplier], ...]
+        "physics": "tick",  # tick (per move_delay step) or time (px/s over real dt)
+        "tick_rate": 250,  # Hz, loop rate in time physics mode
     },
     "audio": {
         "enabled": True,
@@ -30,9 +33,28 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "acceleration_rate": 1.1,
         "max_speed": 10,
         "delay": 30,  # ms between scroll ticks
+        "hi_res": True,  # Smooth 1/120-notch scrolling (REL_WHEEL_HI_RES)
+        "hi_res_rate": 120,  # Hz, scroll tick rate in hi-res mode
+        "momentum": False,  # Coast after key release (kinetic scrolling)
+        "friction": 4.0,  # Momentum decay rate per second (higher = shorter coast)
+        "momentum_min_speed": 2.0,  # Notches/s at which momentum stops
+    },
+    "capture": {
+        # always: grab keyboards for the daemon's lifetime (all typing is proxied)
+        # enabled: grab only in mouse mode; typing is untouched otherwise, but
+        # the toggle key then also reaches the focused app when enabling
+        "grab": "always",
+        # Allowlist: "vvvv:pppp", "phys:<glob>", "name:<glob>", "uniq:<glob>"
+        # (empty = every keyboard with numpad keys; see --list-devices)
+        "devices": [],
+        "exclusive": False,  # Consume selected devices; don't re-inject other keys
+        "hotplug": True,  # Capture keyboards plugged in while the daemon runs
+        # Kernel autorepeat of captured keyboards (None = leave device settings)
+        "repeat_delay": None,  # ms before a held key repeats
+        "repeat_rate": None,  # Repeats per second
     },
     "undo": {
-        "max_levels": 10,  # Max undo history entries
+        "max_levels": 10,  # Max undo history strokes (press to release)
     },
     "hotkeys": {
         # Evdev keycodes for numpad keys
@@ -0,0 +1,110 @@
+"""Immutable typed config snapshots for per-tick hot paths.
+
+ConfigManager.get() splits the dotted key and walks nested dicts on every
+call. Controllers that run every few milliseconds read these snapshots
+instead and only rebuild them when ConfigManager.version changes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import ConfigManager
+
+
+@dataclass(frozen=True, slots=True)
+class MovementParams:
+    """Snapshot of movement.* and undo.* settings."""
+
+    base_speed: float
+    acceleration_rate: float
+    max_speed: float
+    max_mult: float  # max_speed / base_speed (speed multiplier cap)
+    move_delay: float  # Nominal tick period in seconds (curve time base)
+    curve: str
+    curve_points: tuple[tuple[float, float], ...]  # (ms, multiplier), sorted by ms
+    undo_levels: int
+    physics: str  # "tick" or "time"
+    tick_period: float  # Loop period in seconds (1 / tick_rate in time mode)
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> MovementParams:
+        """Build a snapshot from the current configuration."""
+        base = config.get("movement.base_speed", 10)
+        max_speed = config.get("movement.max_speed", 100)
+        # At least 1 ms: move_delay is the time base of the speed curves
+        move_delay = max(config.get("movement.move_delay", 10), 1) / 1000.0
+        physics = config.get("movement.physics", "tick")
+        tick_rate = config.get("movement.tick_rate", 250)
+        if physics == "time" and tick_rate > 0:
+            tick_period = 1.0 / tick_rate
+        else:
+            tick_period = move_delay
+        return cls(
+            base_speed=base,
+            acceleration_rate=config.get("movement.acceleration_rate", 1.02),
+            max_speed=max_speed,
+            max_mult=max_speed / base if base > 0 else 1.0,
+            move_delay=move_delay,
+            curve=config.get("movement.curve", "exponential"),
+            curve_points=_curve_points(config.get("movement.curve_points", [])),
+            undo_levels=config.get("undo.max_levels", 10),
+            physics=physics,
+            tick_period=tick_period,
+        )
+
+
+def _curve_points(raw: list) -> tuple[tuple[float, float], ...]:
+    """Normalize movement.curve_points to unique, sorted (ms, multiplier) pairs."""
+    points: dict[float, float] = {}
+    for entry in raw or []:
+        try:
+            ms, mult = entry
+            points[float(ms)] = float(mult)
+        except (TypeError, ValueError):
+            continue  # Skip malformed entries
+    return tuple(sorted(points.items()))
+
+
+@dataclass(frozen=True, slots=True)
+class ScrollParams:
+    """Snapshot of scroll.* settings."""
+
+    step: float
+    acceleration_rate: float
+    max_speed: float
+    max_mult: float  # max_speed / step, never below 1.0
+    delay: float  # Notch tick period in seconds (speed and acceleration time base)
+    hi_res: bool  # Emit 1/120-notch REL_WHEEL_HI_RES steps when supported
+    hi_res_period: float  # Tick period in seconds in hi-res mode
+    momentum: bool  # Keep scrolling with friction after key release
+    friction: float  # Momentum velocity decay rate (1/s)
+    momentum_min_speed: float  # Momentum ends below this speed (notches/s)
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> ScrollParams:
+        """Build a snapshot from the current configuration."""
+        step = config.get("scroll.step", 3)
+        max_speed = config.get("scroll.max_speed", 10)
+        # At least 1 ms: delay is the time base of every scroll speed
+        delay = max(config.get("scroll.delay", 30), 1) / 1000.0
+        hi_res_rate = config.get("scroll.hi_res_rate", 120)
+        # Positive friction and end speed: an exponential coast only ends by
+        # dropping below the end speed, and without friction it never slows
+        friction = max(config.get("scroll.friction", 4.0), 0.1)
+        min_speed = max(config.get("scroll.momentum_min_speed", 2.0), 0.1)
+        # Guard against division by zero or invalid config
+        return cls(
+            step=step,
+            acceleration_rate=config.get("scroll.acceleration_rate", 1.1),
+            max_speed=max_speed,
+            max_mult=max(max_speed / step, 1.0) if step > 0 else 1.0,
+            delay=delay,
+            hi_res=bool(config.get("scroll.hi_res", True)),
+            hi_res_period=1.0 / hi_res_rate if hi_res_rate > 0 else delay,
+            momentum=bool(config.get("scroll.momentum", False)),
+            friction=friction,
+            momentum_min_speed=min_speed,
+        )
@@ -0,0 +1,113 @@
+"""Background watcher that reloads config.json only when it changes."""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+
+from .config import ConfigManager
+
+# Module logger for callback error reporting
+_logger = logging.getLogger(__name__)
+
+# How often the config file is stat()ed for changes (seconds)
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Type alias for config change callbacks
+ConfigCallback = Callable[[ConfigManager], None]
+
+
+class ConfigWatcher:
+    """Reload configuration on file change and notify subscribers.
+
+    Runs on its own thread so file I/O, JSON parsing and default merging never
+    happen on latency-critical threads (motion, key capture). Each poll is a
+    single os.stat() compared against the (mtime, size, inode) recorded at the
+    last load/save; the file is only re-read when that signature changes.
+    Under the asyncio runtime, run_async() polls from the event loop instead.
+    """
+
+    def __init__(
+        self, config: ConfigManager, interval: float = DEFAULT_POLL_INTERVAL
+    ) -> None:
+        """Initialize ConfigWatcher.
+
+        Args:
+            config: ConfigManager to reload
+            interval: Seconds between change checks
+        """
+        self._config = config
+        self._interval = interval
+        self._subscribers: list[ConfigCallback] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, callback: ConfigCallback) -> None:
+        """Subscribe to config changes.
+
+        Args:
+            callback: Function called with the reloaded ConfigManager
+        """
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: ConfigCallback) -> None:
+        """Unsubscribe from config changes.
+
+        Args:
+            callback: Previously registered callback
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def check(self) -> bool:
+        """Reload and notify if the config file changed.
+
+        Returns:
+            True if a change was detected and subscribers were notified
+        """
+        try:
+            if not self._config.reload_if_changed():
+                return False
+        except OSError:
+            _logger.exception("Config reload failed")
+            return False
+
+        with self._lock:
+            subscribers = self._subscribers.copy()
+        for callback in subscribers:
+            try:
+                callback(self._config)
+            except Exception:
+                # Log but don't let one bad callback break others
+                _logger.exception("Config change callback failed")
+        return True
+
+    def start(self) -> None:
+        """Start the watcher thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval + 1.0)
+            self._thread = None
+
+    async def run_async(self) -> None:
+        """Poll for changes on the running event loop until cancelled."""
+        while True:
+            await asyncio.sleep(self._interval)
+            self.check()
+
+    def _run(self) -> None:
+        """Poll loop (runs in separate thread)."""
+        while not self._stop.wait(self._interval):
+            self.check()
@@ -0,0 +1,237 @@
+"""Daemon control socket: line-based requests, JSON responses.
+
+Each request is one line of space-separated words (command, then
+arguments); each response is one line of JSON with "ok" set, plus the
+command's result or an "error" message. A connection may carry any number
+of requests, so scripts and window-manager keybindings can also drive the
+daemon with a plain Unix socket client:
+
+    echo status | socat - UNIX-CONNECT:$XDG_RUNTIME_DIR/mouse-on-numpad/control.sock
+
+The client side imports nothing beyond the standard library, so a CLI
+round trip does not pay for GTK, evdev or X11 imports.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import selectors
+import socket
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .status_channel import bind_socket, runtime_dir
+
+_logger = logging.getLogger(__name__)
+
+CONTROL_SOCKET = "control.sock"
+MAX_REQUEST = 1024  # Longest accepted request line (bytes)
+CLIENT_TIMEOUT = 2.0  # Seconds a client waits for a response
+
+# Handler(args) -> result fields; raise ValueError for bad arguments
+CommandHandler = Callable[[list[str]], dict[str, Any]]
+
+
+class ControlError(Exception):
+    """Daemon unreachable or request rejected."""
+
+
+def control_socket_path() -> Path:
+    """Return the path of the control socket."""
+    return runtime_dir() / CONTROL_SOCKET
+
+
+def send_command(
+    *words: str, path: Path | None = None, timeout: float = CLIENT_TIMEOUT
+) -> dict[str, Any]:
+    """Send one request to the running daemon.
+
+    Args:
+        words: Command and arguments (e.g. "move", "10", "-5")
+        path: Socket path (defaults to control_socket_path())
+        timeout: Seconds to wait for connect and response
+
+    Returns:
+        Response fields (without "ok")
+
+    Raises:
+        ControlError: Daemon not running, no response, or request rejected
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_CLOEXEC)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(str(path or control_socket_path()))
+        except OSError as e:
+            raise ControlError(f"daemon not running ({e.strerror or e})") from None
+        sock.sendall(" ".join(words).encode() + b"\n")
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    except OSError as e:
+        raise ControlError(f"no response from daemon ({e})") from None
+    finally:
+        sock.close()
+    try:
+        response = json.loads(data)
+    except ValueError:
+        raise ControlError("malformed response from daemon") from None
+    if not isinstance(response, dict):
+        raise ControlError("malformed response from daemon")
+    if not response.pop("ok", False):
+        raise ControlError(response.get("error", "request failed"))
+    return response
+
+
+class ControlServer:
+    """Serve control requests on a Unix stream socket.
+
+    One thread multiplexes the listener and all clients with selectors and
+    blocks while idle. Handlers run on that thread, one request at a time.
+    """
+
+    def __init__(self, handlers: dict[str, CommandHandler], path: Path | None = None) -> None:
+        """Initialize ControlServer.
+
+        Args:
+            handlers: Command name -> handler
+            path: Socket path (defaults to control_socket_path())
+        """
+        self.handlers = handlers
+        self.path = path or control_socket_path()
+        self.requests = 0  # Requests served
+        self._listener: socket.socket | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._buffers: dict[socket.socket, bytes] = {}
+        self._thread: threading.Thread | None = None
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+
+    def start(self) -> bool:
+        """Bind the socket and start serving.
+
+        Returns:
+            True if the control socket is listening
+        """
+        try:
+            self._listener = bind_socket(self.path, socket.SOCK_STREAM)
+        except OSError as e:
+            _logger.warning("Control socket unavailable (%s): %s", self.path, e)
+            return False
+        self._listener.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, None)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread = threading.Thread(target=self._serve, name="control", daemon=True)
+        self._thread.start()
+        return True
+
+    def close(self) -> None:
+        """Stop serving and remove the socket."""
+        if self._thread is not None:
+            os.write(self._wake_w, b"\0")
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            self.path.unlink(missing_ok=True)
+        for fd in (self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._wake_r = self._wake_w = -1
+
+    def handle(self, line: str) -> dict[str, Any]:
+        """Run one request line and build its response."""
+        words = line.split()
+        if not words:
+            return {"ok": False, "error": "empty request"}
+        handler = self.handlers.get(words[0].lower())
+        if handler is None:
+            return {"ok": False, "error": f"unknown command: {words[0]}"}
+        self.requests += 1
+        try:
+            return {"ok": True, **handler(words[1:])}
+        except ValueError as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            _logger.exception("Control command failed: %s", line)
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    def _serve(self) -> None:
+        """Accept clients and answer their requests until close()."""
+        selector = self._selector
+        if selector is None:
+            return
+        try:
+            while True:
+                for key, _ in selector.select():
+                    obj = key.fileobj
+                    if obj == self._wake_r:
+                        return
+                    if obj is self._listener:
+                        self._accept()
+                    elif isinstance(obj, socket.socket):
+                        self._read(obj)
+        finally:
+            for client in list(self._buffers):
+                client.close()
+            self._buffers.clear()
+            selector.close()
+            self._selector = None
+
+    def _accept(self) -> None:
+        """Register a new client."""
+        listener, selector = self._listener, self._selector
+        if listener is None or selector is None:
+            return
+        try:
+            client, _ = listener.accept()
+        except OSError:
+            return
+        client.setblocking(False)
+        self._buffers[client] = b""
+        selector.register(client, selectors.EVENT_READ, None)
+
+    def _read(self, client: socket.socket) -> None:
+        """Read from a client and answer every complete request line."""
+        try:
+            data = client.recv(MAX_REQUEST)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+        buffer = self._buffers[client] + data
+        *lines, buffer = buffer.split(b"\n")
+        if len(buffer) > MAX_REQUEST:
+            self._drop(client)
+            return
+        self._buffers[client] = buffer
+        for line in lines:
+            response = self.handle(line.decode(errors="replace"))
+            try:
+                client.settimeout(CLIENT_TIMEOUT)  # Bounded wait on a slow reader
+                client.sendall(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                client.setblocking(False)
+            except OSError:
+                self._drop(client)
+                return
+
+    def _drop(self, client: socket.socket) -> None:
+        """Unregister and close a client."""
+        self._buffers.pop(client, None)
+        if self._selector is not None:
+            try:
+                self._selector.unregister(client)
+            except (KeyError, ValueError):
+                pass
+        client.close()
@@ -0,0 +1,228 @@
+"""Push-based daemon status channel over a Unix domain socket.
+
+The daemon publishes a small JSON status object on a SOCK_SEQPACKET socket
+(one datagram per update, message boundaries preserved). Subscribers get the
+current status on connect and every change after that, so the indicator can
+sit in its main loop with an IO watch instead of polling a file.
+
+Status fields:
+    enabled       Mouse mode on
+    mode          Position memory mode: "normal", "save" or "load"
+    held_buttons  Mouse buttons held via hold keys (sorted)
+    base_speed    Configured movement base speed (px per tick), not the
+                  accelerated speed of a stroke in progress
+    status_bar    The status_bar config section (indicator position, size,
+                  opacity, theme)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+STATUS_SOCKET = "status.sock"
+# Datagram size limit for a status message (a few hundred bytes in practice)
+MAX_MESSAGE = 4096
+
+
+def runtime_dir() -> Path:
+    """Return the per-user directory for daemon sockets.
+
+    $XDG_RUNTIME_DIR/mouse-on-numpad, or a private directory under the
+    system temp dir when no runtime dir is set.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base:
+        return Path(base) / "mouse-on-numpad"
+    return Path(tempfile.gettempdir()) / f"mouse-on-numpad-{os.getuid()}"
+
+
+def status_socket_path() -> Path:
+    """Return the path of the status socket."""
+    return runtime_dir() / STATUS_SOCKET
+
+
+def bind_socket(path: Path, sock_type: int = socket.SOCK_SEQPACKET) -> socket.socket:
+    """Create a listening Unix socket, replacing a stale socket file.
+
+    Args:
+        path: Socket path (the parent directory is created with mode 0700)
+        sock_type: Socket type
+
+    Returns:
+        Listening socket (close-on-exec)
+
+    Raises:
+        PermissionError: The parent directory is not private to this user
+    """
+    _private_dir(path.parent)
+    sock = socket.socket(socket.AF_UNIX, sock_type | socket.SOCK_CLOEXEC)
+    try:
+        path.unlink(missing_ok=True)
+        sock.bind(str(path))
+        os.chmod(path, 0o600)
+        sock.listen(8)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _private_dir(path: Path) -> None:
+    """Create a directory with mode 0700 and check that it is ours.
+
+    mkdir(exist_ok=True) accepts a directory someone else created first,
+    which the shared-temp fallback of runtime_dir() makes possible.
+
+    Raises:
+        PermissionError: path is not a directory owned by this user with mode 0700
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"{path} is not a private directory owned by this user")
+
+
+def encode_status(status: dict[str, Any]) -> bytes:
+    """Serialize a status object for the wire."""
+    return json.dumps(status, separators=(",", ":"), sort_keys=True).encode()
+
+
+def decode_status(data: bytes) -> dict[str, Any] | None:
+    """Parse one status message, or None if it is malformed."""
+    try:
+        status = json.loads(data)
+    except ValueError:
+        return None
+    return status if isinstance(status, dict) else None
+
+
+def connect_status(path: Path | None = None) -> socket.socket | None:
+    """Subscribe to the daemon's status channel.
+
+    Args:
+        path: Socket path (defaults to status_socket_path())
+
+    Returns:
+        Connected non-blocking socket, or None if the daemon is not running
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET | socket.SOCK_CLOEXEC)
+    try:
+        sock.connect(str(path or status_socket_path()))
+    except OSError:
+        sock.close()
+        return None
+    sock.setblocking(False)
+    return sock
+
+
+class StatusPublisher:
+    """Fan out status updates to connected subscribers.
+
+    Accepting runs on a thread blocked in accept(), so an idle channel costs
+    no wakeups. publish() is safe from any thread; a subscriber that has
+    gone away, or is too far behind to take a message, is dropped.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize StatusPublisher.
+
+        Args:
+            path: Socket path (defaults to status_socket_path())
+        """
+        self.path = path or status_socket_path()
+        self._lock = threading.Lock()
+        self._status: dict[str, Any] = {}
+        self._message = encode_status(self._status)
+        self._clients: list[socket.socket] = []
+        self._listener: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def subscribers(self) -> int:
+        """Return the number of connected subscribers."""
+        with self._lock:
+            return len(self._clients)
+
+    @property
+    def status(self) -> dict[str, Any]:
+        """Return a copy of the last published status."""
+        with self._lock:
+            return dict(self._status)
+
+    def start(self) -> bool:
+        """Bind the socket and start accepting subscribers.
+
+        Returns:
+            True if the channel is listening
+        """
+        try:
+            self._listener = bind_socket(self.path)
+        except OSError as e:
+            _logger.warning("Status channel unavailable (%s): %s", self.path, e)
+            return False
+        self._thread = threading.Thread(
+            target=self._accept_loop, name="status-accept", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def publish(self, **changes: Any) -> None:
+        """Merge changes into the status and push it if anything changed."""
+        with self._lock:
+            status = {**self._status, **changes}
+            if status == self._status:
+                return
+            self._status = status
+            self._message = message = encode_status(status)
+            self._clients = [c for c in self._clients if self._send(c, message)]
+
+    def close(self) -> None:
+        """Disconnect subscribers and remove the socket."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            try:
+                listener.shutdown(socket.SHUT_RDWR)  # Wakes accept()
+            except OSError:
+                pass
+            listener.close()
+            self.path.unlink(missing_ok=True)
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+
+    def _accept_loop(self) -> None:
+        """Accept subscribers and send each the current status."""
+        listener = self._listener
+        while True:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                return  # Closed
+            client.setblocking(False)
+            with self._lock:
+                if self._send(client, self._message):
+                    self._clients.append(client)
+
+    @staticmethod
+    def _send(client: socket.socket, message: bytes) -> bool:
+        """Send one message; close the client and return False on failure."""
+        try:
+            client.send(message)
+            return True
+        except OSError:  # Gone (EPIPE) or not reading (EAGAIN)
+            client.close()
+            return False
@@ -2,8 +2,18 @@
 
 Provides backward compatibility for existing imports:
     from .daemon import Daemon
+
+Daemon is imported on first access, so submodules such as
+device_selector load without the tray icon, Xlib or GTK.
 """
 
-from .daemon_coordinator import Daemon
+from typing import TYPE_CHECKING
+
+from ..lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .daemon_coordinator import Daemon
 
 __all__ = ["Daemon"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {"Daemon": "daemon_coordinator"})
@@ -0,0 +1,177 @@
+"""Persistent cache of input device capabilities for fast startup.
+
+Deciding whether a device is a numpad keyboard needs its capability bits,
+which means opening the node and querying the kernel (including absinfo for
+every axis of joysticks and touchpads). Identity, on the other hand, can be
+read from sysfs without opening anything. The cache maps identity to the few
+capability facts the daemon needs, so at startup only unknown or changed
+devices are opened and probed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from .device_selector import DeviceIdentity
+
+_logger = logging.getLogger(__name__)
+
+SYSFS_INPUT = "/sys/class/input"
+CACHE_VERSION = 1
+# Entries kept (devices seen over time, including ones no longer attached)
+MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceCaps:
+    """Capability facts used for device selection."""
+
+    has_keys: bool  # Reports EV_KEY
+    numpad: bool  # Has numpad keys (KP5/KP8)
+
+
+@dataclass(frozen=True, slots=True)
+class SysfsDevice:
+    """An event node with identity read from sysfs."""
+
+    path: str  # /dev/input/eventN
+    identity: DeviceIdentity
+    version: int  # Device version (firmware/driver revision)
+
+    @property
+    def key(self) -> str:
+        """Return the cache key (bus/vendor/product/version plus physical path)."""
+        i = self.identity
+        return (
+            f"{i.bustype:04x}:{i.vendor:04x}:{i.product:04x}:{self.version:04x}"
+            f"|{i.phys}|{i.name}|{i.uniq}"
+        )
+
+
+def read_sysfs(path: str, root: str = SYSFS_INPUT) -> SysfsDevice | None:
+    """Read a node's identity from sysfs without opening the device.
+
+    Args:
+        path: /dev/input/eventN
+        root: sysfs input class directory
+
+    Returns:
+        SysfsDevice, or None if sysfs has no (readable) entry
+    """
+    device_dir = os.path.join(root, os.path.basename(path), "device")
+    try:
+        bustype, vendor, product, version = (
+            int(_read(device_dir, "id", field), 16)
+            for field in ("bustype", "vendor", "product", "version")
+        )
+        name = _read(device_dir, "name")
+        phys = _read_optional(device_dir, "phys")
+        uniq = _read_optional(device_dir, "uniq")
+    except (OSError, ValueError):
+        return None
+    identity = DeviceIdentity(bustype, vendor, product, name, phys, uniq)
+    return SysfsDevice(path, identity, version)
+
+
+def default_cache_path() -> Path:
+    """Return the XDG cache location of the capability cache."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache"))
+    return Path(xdg_cache) / "mouse-on-numpad" / "devices.json"
+
+
+class CapabilityCache:
+    """JSON-backed map of device identity to DeviceCaps."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize CapabilityCache.
+
+        Args:
+            path: Cache file (defaults to $XDG_CACHE_HOME/mouse-on-numpad/devices.json)
+        """
+        self.path = path or default_cache_path()
+        self._entries: dict[str, DeviceCaps] = {}
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        """Return the number of cached devices."""
+        return len(self._entries)
+
+    def get(self, key: str) -> DeviceCaps | None:
+        """Return cached capabilities for a device key, if known."""
+        return self._entries.get(key)
+
+    def put(self, key: str, caps: DeviceCaps) -> None:
+        """Record probed capabilities for a device key."""
+        if self._entries.get(key) != caps:
+            self._entries.pop(key, None)  # Re-insert as newest
+            self._entries[key] = caps
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed (atomic replace; errors are logged)."""
+        if not self._dirty:
+            return
+        while len(self._entries) > MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]  # Oldest first
+        data = {
+            "version": CACHE_VERSION,
+            "devices": {
+                key: {"keys": caps.has_keys, "numpad": caps.numpad}
+                for key, caps in self._entries.items()
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".devices-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            _logger.warning("Failed to save device cache: %s", e)
+            return
+        self._dirty = False
+
+    def _load(self) -> None:
+        """Load the cache file (a missing or stale file starts empty)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _logger.warning("Ignoring unreadable device cache: %s", e)
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return
+        devices = data.get("devices")
+        if not isinstance(devices, dict):
+            return
+        for key, entry in devices.items():
+            if isinstance(entry, dict):
+                self._entries[key] = DeviceCaps(
+                    bool(entry.get("keys")), bool(entry.get("numpad"))
+                )
+
+
+def _read(directory: str, *parts: str) -> str:
+    """Read one sysfs attribute, stripped."""
+    with open(os.path.join(directory, *parts), encoding="utf-8", errors="replace") as f:
+        return f.read().strip()
+
+
+def _read_optional(directory: str, name: str) -> str:
+    """Read a sysfs attribute that may be absent."""
+    try:
+        return _read(directory, name)
+    except FileNotFoundError:
+        return ""
@@ -0,0 +1,139 @@
+"""Commands served on the daemon control socket."""
+
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from ..core.control_channel import CommandHandler
+
+if TYPE_CHECKING:
+    from ..core import StateManager
+
+BUTTONS = ("left", "right", "middle")
+MAX_SLOT = 9
+READ_ONLY = ("status", "stats")  # Commands that may run on the server thread
+
+
+class ControlCommands:
+    """Handlers for toggle, status, move, click, slot, reload and stats."""
+
+    def __init__(
+        self,
+        *,
+        state: "StateManager",
+        mouse,
+        toggle: Callable[[], None],
+        status: Callable[[], dict[str, Any]],
+        load_slot: Callable[[int], None],
+        reload: Callable[[], None],
+        stats: Callable[[], dict[str, Any]],
+        call: Callable[..., Any] | None = None,
+    ) -> None:
+        """Initialize ControlCommands.
+
+        Args:
+            state: StateManager instance
+            mouse: Mouse controller instance
+            toggle: Toggle mouse mode (with the daemon's side effects)
+            status: Return the current status fields
+            load_slot: Move the cursor to a saved position slot
+            reload: Reload config and hotkeys
+            stats: Return runtime statistics
+            call: Run a handler on the key handling loop and return its
+                result (KeyboardCapture.call); None runs handlers directly
+        """
+        self._state = state
+        self._mouse = mouse
+        self._toggle = toggle
+        self._status = status
+        self._load_slot = load_slot
+        self._reload = reload
+        self._stats = stats
+        self._call = call
+        self._started = time.monotonic()
+
+    @property
+    def handlers(self) -> dict[str, CommandHandler]:
+        """Return the command table for ControlServer.
+
+        Commands that change daemon state go through call(), so they run on
+        the same loop as key handling instead of the server thread.
+        """
+        table: dict[str, CommandHandler] = {
+            "toggle": self.toggle,
+            "status": self.status,
+            "move": self.move,
+            "click": self.click,
+            "slot": self.slot,
+            "reload": self.reload,
+            "stats": self.stats,
+        }
+        if self._call is None:
+            return table
+        return {
+            name: handler if name in READ_ONLY else partial(self._call, handler)
+            for name, handler in table.items()
+        }
+
+    def toggle(self, args: list[str]) -> dict[str, Any]:
+        """toggle [on|off]: flip mouse mode, or set it."""
+        if args and args[0] not in ("on", "off"):
+            raise ValueError("usage: toggle [on|off]")
+        if not args or (args[0] == "on") != self._state.is_enabled:
+            self._toggle()
+        return {"enabled": self._state.is_enabled}
+
+    def status(self, args: list[str]) -> dict[str, Any]:
+        """status: mouse mode, save/load mode, held buttons, base speed."""
+        return self._status()
+
+    def move(self, args: list[str]) -> dict[str, Any]:
+        """move DX DY: move the pointer by a relative offset."""
+        dx, dy = _ints(args, 2, "usage: move DX DY")
+        self._mouse.move(dx, dy)
+        return {}
+
+    def click(self, args: list[str]) -> dict[str, Any]:
+        """click [left|right|middle]: click a mouse button."""
+        button = args[0] if args else "left"
+        if button not in BUTTONS or len(args) > 1:
+            raise ValueError("usage: click [left|right|middle]")
+        self._mouse.click(button)
+        return {}
+
+    def slot(self, args: list[str]) -> dict[str, Any]:
+        """slot N: jump to a saved position."""
+        (slot,) = _ints(args, 1, "usage: slot N")
+        if not 1 <= slot <= MAX_SLOT:
+            raise ValueError(f"slot must be 1-{MAX_SLOT}")
+        self._load_slot(slot)
+        return {}
+
+    def reload(self, args: list[str]) -> dict[str, Any]:
+        """reload: re-read config.json and hotkeys."""
+        self._reload()
+        return {}
+
+    def stats(self, args: list[str]) -> dict[str, Any]:
+        """stats: uptime plus capture and tick statistics."""
+        return {"uptime": round(time.monotonic() - self._started, 3), **self._stats()}
+
+
+def stats_dict(stats) -> dict[str, Any]:
+    """Convert a stats dataclass to JSON-friendly fields."""
+    return {
+        key: round(value, 6) if isinstance(value, float) else value
+        for key, value in asdict(stats).items()
+    }
+
+
+def _ints(args: list[str], count: int, usage: str) -> list[int]:
+    """Parse exactly count integer arguments."""
+    if len(args) != count:
+        raise ValueError(usage)
+    try:
+        return [int(arg) for arg in args]
+    except ValueError:
+        raise ValueError(usage) from None
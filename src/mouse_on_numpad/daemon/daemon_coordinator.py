@@ -1,23 +1,30 @@
 """Main daemon coordinator for mouse-on-numpad."""
 
+import asyncio
 import signal
 import time
-import threading
+from functools import partial
 
-from ..core import ConfigManager, StateManager, ErrorLogger
+from ..core import ConfigManager, ConfigWatcher, StateManager, ErrorLogger
+from ..core.control_channel import ControlServer
+from ..core.state_manager import MouseMode
 from ..input import MonitorManager, PositionMemory, AudioFeedback, ScrollController
+from ..input.motion_engine import MotionEngine
 from ..input.movement_controller import MovementController
 from ..tray_icon import TrayIcon
 
+from .capability_cache import CapabilityCache
+from .control_commands import ControlCommands, stats_dict
+from .device_selector import DeviceSelector
 from .keyboard_capture import KeyboardCapture
 from .hotkey_dispatcher import HotkeyDispatcher
 from .ipc_manager import IPCManager
 from .position_manager import PositionManager
 from .mouse_factory import create_mouse_controller
+from .startup_stages import StartupStages
 
 
-# Main loop timing
-MAIN_LOOP_INTERVAL = 0.1  # seconds
+# Shutdown timing
 SHUTDOWN_GRACE_PERIOD = 0.1  # seconds
 
 
@@ -37,34 +44,153 @@ class Daemon:
         self.logger = logger or ErrorLogger(console_output=True)
         self.config = config or ConfigManager()
         self.state = state or StateManager()
-        self.mouse = create_mouse_controller(self.logger)  # UInput preferred, ydotool fallback
-        self.monitors = MonitorManager()
-        self.positions = PositionMemory(self.config, self.monitors)
-        self.audio = AudioFeedback(self.config)
-        self.movement = MovementController(self.config, self.mouse)
-        self.scroll = ScrollController(self.config, self.mouse)
+        # X11 monitor queries, position memory and audio probing only serve a
+        # few hotkeys: build them in the background while input comes up
+        self.startup = StartupStages(self.logger)
+        self.startup.submit("monitors", MonitorManager)
+        self.startup.submit(
+            "positions", partial(PositionMemory, self.config), after=("monitors",)
+        )
+        self.startup.submit("audio", partial(AudioFeedback, self.config))
+        self._position_mgr: PositionManager | None = None
+        # UInput preferred, ydotool fallback
+        self.mouse = self.startup.run("mouse", create_mouse_controller, self.logger)
+        # One persistent motion thread for both controllers (shared SYN frames)
+        self.motion = MotionEngine(self.mouse, self.logger)
+        self.movement = MovementController(self.config, self.mouse, self.motion)
+        self.scroll = ScrollController(self.config, self.mouse, self.motion)
         self.tray = TrayIcon(on_toggle=self._toggle_mode, on_quit=self.stop)
 
         # Delegate components
-        self.keyboard = KeyboardCapture(self.logger)
+        self.keyboard = KeyboardCapture(
+            self.logger, DeviceSelector.from_config(self.config), CapabilityCache()
+        )
         self.hotkeys = HotkeyDispatcher(self.config, self.logger)
         self.ipc = IPCManager()
-        self.position_mgr = PositionManager(self.monitors, self.positions)
+        self.config_watcher = ConfigWatcher(self.config)
+        self.config_watcher.subscribe(self._on_config_changed)
+        self.state.subscribe(self._on_state_changed)
 
         self._running = False
+        self._asyncio = False  # Running under the asyncio runtime
         self._devices: list = []
-        self._threads: list[threading.Thread] = []
         self._held_buttons: set[str] = set()  # Mouse buttons held via toggle (left, middle)
-        self._save_mode = {"active": False}  # Position save mode active
-        self._load_mode = {"active": False}  # Position load mode active
+        self.hotkeys.bind(
+            state=self.state,
+            mouse=self.mouse,
+            movement=self.movement,
+            scroll=self.scroll,
+            tray=self.tray,
+            publish_status=self._publish_status,
+            held_buttons=self._held_buttons,
+            save_position=self._save_position,
+            load_position=self._load_position,
+            cycle_monitor=self._cycle_monitor,
+        )
+        self.control = ControlServer(
+            ControlCommands(
+                state=self.state,
+                mouse=self.mouse,
+                toggle=self._toggle_mode,
+                status=self._status,
+                load_slot=self._load_position,
+                reload=self.reload_config,
+                stats=self._stats,
+                call=self.keyboard.call,
+            ).handlers
+        )
+
+    @property
+    def monitors(self) -> MonitorManager | None:
+        """Monitor manager (waits for its startup stage; None if it failed)."""
+        return self.startup.get("monitors")
+
+    @property
+    def positions(self) -> PositionMemory | None:
+        """Saved position slots (waits for its startup stage; None if it failed)."""
+        return self.startup.get("positions")
+
+    @property
+    def audio(self) -> AudioFeedback | None:
+        """Audio feedback (waits for its startup stage; None if it failed)."""
+        return self.startup.get("audio")
+
+    @property
+    def position_mgr(self) -> PositionManager | None:
+        """Position operations, once monitors and position memory are up."""
+        if self._position_mgr is None and self.positions is not None:
+            self._position_mgr = PositionManager(self.monitors, self.positions)
+        return self._position_mgr
+
+    def _position_ops(self) -> PositionManager | None:
+        """Return position operations, or None (with a note) if unavailable."""
+        if self.position_mgr is None:
+            print("Position memory unavailable (see log)")
+        return self.position_mgr
+
+    def _save_position(self, slot: int) -> None:
+        """Save the cursor position to a slot."""
+        if mgr := self._position_ops():
+            mgr.save_position_to_slot(slot)
+
+    def _load_position(self, slot: int) -> None:
+        """Move the cursor to a saved slot."""
+        if mgr := self._position_ops():
+            mgr.load_position_from_slot(slot)
+
+    def _cycle_monitor(self) -> None:
+        """Move the cursor to the next monitor."""
+        if mgr := self._position_ops():
+            mgr.cycle_monitor()
 
     def reload_hotkeys(self) -> None:
         """Reload hotkeys from config (called after settings change)."""
-        self._save_mode["active"] = False
-        self._load_mode["active"] = False
         self.hotkeys.reload_hotkeys(
             self.movement, self.scroll, self._release_all_held_buttons
         )
+        self._apply_capture_config()
+        self._publish_status()
+
+    def reload_config(self) -> None:
+        """Re-read config.json and apply it (control socket "reload")."""
+        self.config.reload()
+        self._on_config_changed(self.config)
+
+    def _apply_capture_config(self) -> None:
+        """Set the keyboard grab policy and autorepeat from capture.*."""
+        if self.config.get("capture.grab", "always") == "enabled":
+            # Grab only in mouse mode; the toggle key is all we watch otherwise
+            self.keyboard.set_passthrough((self.hotkeys.keys.key_toggle,))
+        else:
+            self.keyboard.set_passthrough(None)
+        self.keyboard.set_repeat_filter(self.hotkeys.keys.continuous_keys)
+        self.keyboard.set_repeat(
+            self.config.get("capture.repeat_delay"), self.config.get("capture.repeat_rate")
+        )
+
+    def _on_state_changed(self, key: str, value: object) -> None:
+        """Follow mouse mode with the keyboard grab (passthrough mode)."""
+        if key == "mouse_mode":
+            self.keyboard.set_grab(value == MouseMode.ENABLED)
+
+    def _on_config_changed(self, config: ConfigManager) -> None:
+        """Apply config.json changes (runs on the config watcher thread).
+
+        Settings snapshots and acceleration tables are rebuilt here, off the
+        key path; hotkey tables and capture settings are swapped on the
+        capture loop, so key dispatch never sees them half-applied.
+        """
+        self.movement.reload_params()
+        self.scroll.reload_params()
+        self.keyboard.call(self._apply_config)
+
+    def _apply_config(self) -> None:
+        """Apply hotkey and capture settings (runs on the capture loop)."""
+        self.hotkeys.apply_config(
+            self.movement, self.scroll, self._release_all_held_buttons
+        )
+        self._apply_capture_config()
+        self._publish_status()  # Mode may be reset, base speed may change
 
     def _toggle_mode(self) -> None:
         """Toggle mouse mode (called from tray menu)."""
@@ -74,7 +200,7 @@ class Daemon:
             self.scroll.stop_all()
             self._release_all_held_buttons()
         self.tray.update(enabled)
-        self.ipc.write_status(enabled)
+        self._publish_status()
         self.logger.info("Mouse mode: %s", "enabled" if enabled else "disabled")
         print(f"Mouse mode: {'ENABLED' if enabled else 'DISABLED'}")
 
@@ -84,45 +210,75 @@ class Daemon:
             self.mouse.release(button)
         self._held_buttons.clear()
 
-    def _handle_key(self, keycode: int, pressed: bool) -> bool:
-        """Handle a key event. Returns True if key should be suppressed."""
-        return self.hotkeys.handle_key(
-            keycode,
-            pressed,
-            self.state,
-            self.mouse,
-            self.movement,
-            self.scroll,
-            self.tray,
-            self.ipc.write_status,
-            self._held_buttons,
-            self._save_mode,
-            self._load_mode,
-            self.position_mgr.save_position_to_slot,
-            self.position_mgr.load_position_from_slot,
-            self.position_mgr.cycle_monitor,
+    def _status(self) -> dict:
+        """Return mouse mode, save/load mode, held buttons and base speed."""
+        return {
+            "enabled": self.state.is_enabled,
+            "mode": self.hotkeys.mode,
+            "held_buttons": sorted(self._held_buttons),
+            "base_speed": self.config.movement_params.base_speed,
+        }
+
+    def _publish_status(self) -> None:
+        """Push the current status to status channel subscribers (indicator).
+
+        The status_bar settings go along, so the indicator never has to read
+        or watch config.json; config reloads re-publish them.
+        """
+        self.ipc.publish_status(
+            **self._status(), status_bar=dict(self.config.get("status_bar", {}))
         )
 
-    def start(self) -> None:
-        """Start the daemon."""
+    def _stats(self) -> dict:
+        """Return capture, tick and control statistics (control socket "stats")."""
+        return {
+            "capture": stats_dict(self.keyboard.stats),
+            "movement": stats_dict(self.movement.tick_stats),
+            "scroll": stats_dict(self.scroll.tick_stats),
+            "control_requests": self.control.requests,
+            "startup_ms": {
+                name: round(secs * 1000, 1) for name, secs in self.startup.durations.items()
+            },
+        }
+
+    def start(self, use_asyncio: bool = False) -> None:
+        """Start the daemon.
+
+        Args:
+            use_asyncio: Run capture, motion ticks, config watching and
+                signal handling on one asyncio event loop instead of threads
+        """
         self._running = True
+        self._asyncio = use_asyncio
 
-        # Find keyboards
-        self._devices = self.keyboard.find_keyboards()
-        if not self._devices:
+        # Find keyboards; with hotplug, later (re)connected ones are added live
+        self._devices = self.startup.run("keyboards", self.keyboard.find_keyboards)
+        hotplug = self.config.get("capture.hotplug", True) and self.keyboard.enable_hotplug()
+        if not self._devices and not hotplug:
             print("ERROR: No keyboard devices found. Make sure you're in 'input' group.")
             print("Run: sudo usermod -aG input $USER && reboot")
+            self.keyboard.close()
             return
+        if not self._devices:
+            print("No keyboard found yet; waiting for one to be plugged in.")
 
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, lambda *_: self.stop())
-        signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        if not use_asyncio:
+            # Set up signal handlers
+            signal.signal(signal.SIGINT, lambda *_: self.stop())
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
 
         # Start system tray icon
         self.tray.start()
 
-        # Write initial status (disabled)
-        self.ipc.write_status(False)
+        if not use_asyncio:
+            # Pick up settings changes (GUI, manual edits) without polling per tick
+            self.config_watcher.start()
+
+        # Publish the initial status before the indicator subscribes
+        self.ipc.start_status()
+        self._publish_status()
+        # Serve --toggle/--status and scripted commands
+        self.control.start()
 
         # Start indicator subprocess
         self.ipc.start_indicator()
@@ -134,36 +290,56 @@ class Daemon:
         print("System tray + overlay indicator active.")
         print("Press Ctrl+C to stop.")
 
-        # Start reader threads for each device
-        for dev in self._devices:
-            thread = threading.Thread(
-                target=self.keyboard.read_device,
-                args=(dev, self._handle_key, lambda: self._running),
-                daemon=True,
-            )
-            thread.start()
-            self._threads.append(thread)
+        self._apply_capture_config()
+        self.keyboard.set_grab(self.state.is_enabled)
+        self.logger.info(
+            "Input ready in %.1f ms (%s)", self.startup.elapsed(), self.startup.summary()
+        )
+        self.startup.report_when_done()
+        try:
+            if use_asyncio:
+                asyncio.run(self._run_async())
+            else:
+                # Multiplex all keyboards on this thread until stop()
+                self.keyboard.run(self._devices, self.hotkeys.handle_key)
+        finally:
+            # Not in stop(): that may run on the capture thread, inside the loop
+            self.keyboard.close()
 
-        # Keep running
-        while self._running:
-            time.sleep(MAIN_LOOP_INTERVAL)
+    async def _run_async(self) -> None:
+        """Run capture, motion and config watching on one event loop."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
+        self.motion.bind_loop(loop)
+        watcher = asyncio.create_task(self.config_watcher.run_async())
+        try:
+            await self.keyboard.run_async(self._devices, self.hotkeys.handle_key)
+        finally:
+            watcher.cancel()
+            self.motion.bind_loop(None)
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
 
     def stop(self) -> None:
         """Stop the daemon."""
         self._running = False
-        # Stop movement and scroll threads
+        self.keyboard.stop()  # Wakes the capture loop
+        # Stop movement, scroll and the motion thread
         self.movement.stop_all()
         self.scroll.stop_all()
-        time.sleep(SHUTDOWN_GRACE_PERIOD)  # Allow threads to exit gracefully
+        self.motion.stop()
+        if not self._asyncio:
+            time.sleep(SHUTDOWN_GRACE_PERIOD)  # Allow threads to exit gracefully
+        self.config_watcher.stop()
         self.tray.stop()
         # Stop indicator subprocess
         self.ipc.stop_indicator()
-        # Clean up status file
-        self.ipc.cleanup_status_file()
-        for dev in self._devices:
-            try:
-                dev.close()
-            except OSError:
-                pass
+        # Disconnect status subscribers and control clients, remove the sockets
+        self.ipc.close_status()
+        self.control.close()
+        self.startup.shutdown()
+        # KeyboardCapture closes its devices once the loop has detached them
+        # (restoring grabs and autorepeat settings first)
         self.logger.info("Daemon stopped.")
         print("\nDaemon stopped.")
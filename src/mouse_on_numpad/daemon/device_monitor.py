@@ -0,0 +1,114 @@
+"""Input device hotplug notifications via inotify on /dev/input.
+
+udev creates /dev/input/eventN when a device appears and then adjusts its
+permissions, so both IN_CREATE and IN_ATTRIB are reported as "added"; the
+consumer probes the node and ignores duplicates. The inotify fd is meant to
+be multiplexed on the capture loop, so a replugged device is picked up
+without polling and without an extra thread.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import struct
+
+DEV_INPUT = "/dev/input"
+
+# linux/inotify.h
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = IN_CREATE | IN_ATTRIB | IN_DELETE | IN_MOVED_TO | IN_MOVED_FROM
+_ADDED = IN_CREATE | IN_ATTRIB | IN_MOVED_TO
+
+# struct inotify_event: int wd, uint32 mask, uint32 cookie, uint32 len, char name[]
+_EVENT = struct.Struct("iIII")
+
+# Device change: (node path, True if added / False if removed)
+DeviceChange = tuple[str, bool]
+
+_libc = None
+
+
+def _load_libc():
+    """Return libc with inotify symbols (loaded on first use)."""
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    return _libc
+
+
+class DeviceMonitor:
+    """Non-blocking inotify watch reporting eventN nodes added or removed."""
+
+    def __init__(self, fd: int, directory: str) -> None:
+        """Initialize DeviceMonitor (use create()).
+
+        Args:
+            fd: inotify file descriptor with the directory watch added
+            directory: Watched directory
+        """
+        self._fd = fd
+        self.directory = directory
+
+    @classmethod
+    def create(cls, directory: str = DEV_INPUT) -> DeviceMonitor | None:
+        """Start watching a directory for input device nodes.
+
+        Args:
+            directory: Directory holding eventN nodes
+
+        Returns:
+            DeviceMonitor, or None if inotify is unavailable
+        """
+        try:
+            libc = _load_libc()
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd, directory)
+
+    def fileno(self) -> int:
+        """Return the inotify fd (readable when changes are pending)."""
+        return self._fd
+
+    def read_changes(self) -> list[DeviceChange]:
+        """Drain pending notifications.
+
+        Returns:
+            (path, added) for each eventN node change, oldest first
+        """
+        changes: list[DeviceChange] = []
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return changes
+            if not data:
+                return changes
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                _, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + length].split(b"\0", 1)[0].decode(errors="replace")
+                offset += length
+                if name.startswith("event"):
+                    changes.append((os.path.join(self.directory, name), bool(mask & _ADDED)))
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,134 @@
+"""Choose which input devices the daemon captures.
+
+Devices are matched on stable identity (vendor:product, physical path, name)
+rather than /dev/input/eventN, which changes across reconnects and reboots.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import evdev
+
+    from ..core import ConfigManager
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceIdentity:
+    """Persistent identity of an input device."""
+
+    bustype: int
+    vendor: int
+    product: int
+    name: str
+    phys: str
+    uniq: str = ""
+
+    @classmethod
+    def from_device(cls, device: evdev.InputDevice) -> DeviceIdentity:
+        """Build the identity of an open evdev device."""
+        info = device.info
+        return cls(
+            bustype=info.bustype,
+            vendor=info.vendor,
+            product=info.product,
+            name=device.name or "",
+            phys=device.phys or "",
+            uniq=getattr(device, "uniq", "") or "",
+        )
+
+    @property
+    def usb_id(self) -> str:
+        """Return the "vvvv:pppp" vendor:product id."""
+        return f"{self.vendor:04x}:{self.product:04x}"
+
+    def __str__(self) -> str:
+        return f"{self.usb_id} phys={self.phys!r} name={self.name!r}"
+
+
+class DeviceSelector:
+    """Allowlist of devices to capture, with optional exclusive routing.
+
+    Rules (any match selects the device):
+        "046d:c52b"          vendor:product (hex)
+        "phys:usb-*-2/input0"  physical path (glob)
+        "name:*Numpad*"      device name (glob)
+        "uniq:ABC123"        serial / unique id (glob)
+
+    With no rules every keyboard with numpad keys is captured. In exclusive
+    mode selected devices are consumed entirely: keys that are not hotkeys
+    are dropped instead of being re-injected through a uinput clone, and
+    other keyboards are never opened for capture. Exclusive mode needs
+    rules: without them it is ignored (exclusive_ignored is set), since it
+    would swallow every keyboard with numpad keys.
+    """
+
+    def __init__(self, rules: list[str] | None = None, exclusive: bool = False) -> None:
+        """Initialize DeviceSelector.
+
+        Args:
+            rules: Match rules (see class docstring)
+            exclusive: Consume selected devices without re-injection
+        """
+        self.rules = [rule.strip() for rule in rules or [] if rule and rule.strip()]
+        self.exclusive = exclusive and bool(self.rules)
+        self.exclusive_ignored = exclusive and not self.rules
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> DeviceSelector:
+        """Build a selector from capture.devices and capture.exclusive."""
+        rules = config.get("capture.devices", [])
+        if isinstance(rules, str):
+            rules = [rules]
+        return cls(list(rules), bool(config.get("capture.exclusive", False)))
+
+    @property
+    def has_rules(self) -> bool:
+        """Return True if an allowlist is configured."""
+        return bool(self.rules)
+
+    def matches(self, identity: DeviceIdentity) -> bool:
+        """Check a device against the allowlist.
+
+        Args:
+            identity: Device identity
+
+        Returns:
+            True if any rule matches (always True without rules)
+        """
+        if not self.rules:
+            return True
+        return any(_rule_matches(rule, identity) for rule in self.rules)
+
+
+def list_key_devices() -> list[tuple[str, DeviceIdentity]]:
+    """Return (path, identity) for every readable input device with keys."""
+    import evdev
+
+    found = []
+    for path in evdev.list_devices():
+        try:
+            device = evdev.InputDevice(path)
+        except OSError:
+            continue
+        try:
+            if evdev.ecodes.EV_KEY in device.capabilities():
+                found.append((path, DeviceIdentity.from_device(device)))
+        except OSError:
+            pass
+        finally:
+            device.close()
+    return found
+
+
+def _rule_matches(rule: str, identity: DeviceIdentity) -> bool:
+    """Return True if one rule matches the identity."""
+    kind, sep, pattern = rule.partition(":")
+    if sep and kind in ("phys", "name", "uniq"):
+        return fnmatchcase(getattr(identity, kind), pattern)
+    if sep and len(kind) == 4 and len(pattern) == 4:
+        return rule.lower() == identity.usb_id
+    return False
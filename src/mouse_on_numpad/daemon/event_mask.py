@@ -0,0 +1,80 @@
+"""Per-client evdev event filtering (EVIOCSMASK).
+
+A mask only affects the file descriptor it is set on: other readers of the
+device (the compositor, X) keep receiving everything. Filtered events never
+wake the reader, and SYN_REPORTs of fully filtered frames are dropped by the
+kernel too.
+"""
+
+import ctypes
+import fcntl
+import struct
+from collections.abc import Iterable
+
+# _IOW('E', 0x93, struct input_mask)
+EVIOCSMASK = 0x40104593
+# struct input_mask: __u32 type, __u32 codes_size, __u64 codes_ptr
+_INPUT_MASK = struct.Struct("IIQ")
+
+# linux/input-event-codes.h
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_CNT = 0x20
+KEY_CNT = 0x300
+
+
+def set_event_mask(fd: int, etype: int, codes: Iterable[int] | None, count: int) -> bool:
+    """Set which codes of one event type are delivered to fd.
+
+    Args:
+        fd: evdev device file descriptor
+        etype: Event type, or EV_SYN to mask event types themselves
+        codes: Codes to deliver, or None to deliver all
+        count: Number of codes for etype (EV_CNT, KEY_CNT, ...)
+
+    Returns:
+        True if the kernel accepted the mask
+    """
+    size = (count + 63) // 64 * 8  # Whole longs, as the kernel copies them
+    if codes is None:
+        bits = bytearray(b"\xff" * size)
+    else:
+        bits = bytearray(size)
+        for code in codes:
+            if 0 <= code < count:
+                bits[code >> 3] |= 1 << (code & 7)
+    buf = ctypes.create_string_buffer(bytes(bits), size)
+    try:
+        fcntl.ioctl(fd, EVIOCSMASK, _INPUT_MASK.pack(etype, size, ctypes.addressof(buf)))
+    except OSError:
+        return False  # Not an evdev node, or kernel < 4.4
+    return True
+
+
+def watch_keys_only(fd: int, keys: Iterable[int]) -> bool:
+    """Deliver only the given key codes (plus their SYN_REPORTs) to fd.
+
+    Args:
+        fd: evdev device file descriptor
+        keys: Key codes to keep receiving
+
+    Returns:
+        True if the mask was applied
+    """
+    return set_event_mask(fd, EV_SYN, (EV_SYN, EV_KEY), EV_CNT) and set_event_mask(
+        fd, EV_KEY, keys, KEY_CNT
+    )
+
+
+def watch_all(fd: int) -> bool:
+    """Remove the filter set by watch_keys_only().
+
+    Args:
+        fd: evdev device file descriptor
+
+    Returns:
+        True if the mask was cleared
+    """
+    return set_event_mask(fd, EV_SYN, None, EV_CNT) and set_event_mask(
+        fd, EV_KEY, None, KEY_CNT
+    )
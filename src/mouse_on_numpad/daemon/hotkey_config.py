@@ -15,6 +15,9 @@ class HotkeyConfig:
 
     def _load(self) -> None:
         """Load hotkey mappings from config."""
+        # Remember the source section so config-watcher reloads can skip no-ops
+        self._source = dict(self.config.get("hotkeys", {}))
+
         # Mode toggle keys
         self.key_toggle = self.config.get("hotkeys.toggle_mode", 78)
         self.key_save_mode = self.config.get("hotkeys.save_mode", 55)
@@ -61,7 +64,20 @@ class HotkeyConfig:
         # Modifier combo keys (require Alt held)
         self.key_secondary_monitor = self.config.get("hotkeys.secondary_monitor", 73)
 
+    @property
+    def continuous_keys(self) -> frozenset[int]:
+        """Return keys bound to continuous actions (movement and scrolling)."""
+        return frozenset(self.movement_keys) | frozenset(self.scroll_keys)
+
     def reload(self) -> None:
         """Reload hotkey mappings from config."""
         self.config.reload()
         self._load()
+
+    def is_stale(self) -> bool:
+        """Check if the loaded config has hotkeys that differ from these mappings."""
+        return self.config.get("hotkeys", {}) != self._source
+
+    def refresh(self) -> None:
+        """Rebuild mappings from the already-loaded config (no file read)."""
+        self._load()
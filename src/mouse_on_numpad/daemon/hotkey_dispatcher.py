@@ -1,15 +1,48 @@
-"""Hotkey mapping and dispatch logic."""
+"""Hotkey mapping and dispatch logic.
 
+HotkeyConfig mappings are compiled into one dispatch table per mode
+(normal, save, load, each with an Alt-held variant) mapping keycode to a
+pre-bound handler. Overlapping bindings are resolved by precedence while
+compiling, so handling an event is one dict lookup and one call.
+"""
+
+from collections.abc import Callable
+from functools import partial
 from typing import TYPE_CHECKING
 
 from ..core import ErrorLogger
 from .hotkey_config import HotkeyConfig
+from .keyboard_capture import KEY_LEFTALT, KEY_RIGHTALT
 
 if TYPE_CHECKING:
-    from ..core import ConfigManager
+    from ..core import ConfigManager, StateManager
     from ..input.movement_controller import MovementController
     from ..input.scroll_controller import ScrollController
-    from .keyboard_capture import KEY_LEFTALT, KEY_RIGHTALT
+
+# Handler(pressed) -> True if the key should be suppressed
+KeyHandler = Callable[[bool], bool]
+
+# Position memory modes
+MODE_NORMAL = "normal"
+MODE_SAVE = "save"
+MODE_LOAD = "load"
+
+
+def _pass(pressed: bool) -> bool:
+    """Let the key through."""
+    return False
+
+
+def _suppress(pressed: bool) -> bool:
+    """Swallow the key without an action."""
+    return True
+
+
+def _on_press(action: KeyHandler, fallback: KeyHandler) -> KeyHandler:
+    """Bind an action to presses, leaving releases to the binding below it."""
+    if fallback is _pass:
+        return lambda pressed: action(pressed) if pressed else False
+    return lambda pressed: action(pressed) if pressed else fallback(pressed)
 
 
 class HotkeyDispatcher:
@@ -19,6 +52,53 @@ class HotkeyDispatcher:
         self.logger = logger
         self._held_keys: set[int] = set()
         self.keys = HotkeyConfig(config)
+        self.mode = MODE_NORMAL  # Position memory mode
+        self._alt = False
+        self._tables: dict[tuple[str, bool], dict[int, KeyHandler]] = {}
+        self._disabled: dict[int, KeyHandler] = {}
+        self._active: dict[int, KeyHandler] = {}
+        self._bound = False
+
+    def bind(
+        self,
+        *,
+        state: "StateManager",
+        mouse,
+        movement: "MovementController",
+        scroll: "ScrollController",
+        tray,
+        publish_status: Callable[[], None],
+        held_buttons: set[str],
+        save_position: Callable[[int], None],
+        load_position: Callable[[int], None],
+        cycle_monitor: Callable[[], None],
+    ) -> None:
+        """Attach the components key handlers act on and compile the tables.
+
+        Args:
+            state: StateManager instance
+            mouse: Mouse controller instance
+            movement: MovementController instance
+            scroll: ScrollController instance
+            tray: TrayIcon instance
+            publish_status: Callback to push mode/button changes to the status channel
+            held_buttons: Set of currently held mouse buttons (shared)
+            save_position: Callback(slot) to save position
+            load_position: Callback(slot) to load position
+            cycle_monitor: Callback to cycle monitor
+        """
+        self._state = state
+        self._mouse = mouse
+        self._movement = movement
+        self._scroll = scroll
+        self._tray = tray
+        self._publish_status = publish_status
+        self._held_buttons = held_buttons
+        self._save_position = save_position
+        self._load_position = load_position
+        self._cycle_monitor = cycle_monitor
+        self._bound = True
+        self._compile()
 
     def reload_hotkeys(
         self, movement, scroll, release_all_held_buttons_callback
@@ -37,160 +117,210 @@ class HotkeyDispatcher:
 
         # Reload config and update key mappings
         self.keys.reload()
+        self._compile()
+        self.reset_mode()
         self.logger.info("Hotkeys reloaded from config")
 
-    def _is_alt_held(self) -> bool:
-        """Check if Alt modifier is currently held."""
-        from .keyboard_capture import KEY_LEFTALT, KEY_RIGHTALT
+    def apply_config(
+        self, movement, scroll, release_all_held_buttons_callback
+    ) -> bool:
+        """Apply hotkey changes from a config the watcher already reloaded.
 
-        return KEY_LEFTALT in self._held_keys or KEY_RIGHTALT in self._held_keys
+        Args:
+            movement: MovementController instance
+            scroll: ScrollController instance
+            release_all_held_buttons_callback: Callback to release held mouse buttons
 
-    def handle_key(
-        self,
-        keycode: int,
-        pressed: bool,
-        state,
-        mouse,
-        movement,
-        scroll,
-        tray,
-        write_status_callback,
-        held_buttons: set[str],
-        save_mode: dict,
-        load_mode: dict,
-        save_position_callback,
-        load_position_callback,
-        cycle_monitor_callback,
-    ) -> bool:
+        Returns:
+            True if the hotkey mappings changed
+        """
+        if not self.keys.is_stale():
+            return False
+        movement.stop_all()
+        scroll.stop_all()
+        release_all_held_buttons_callback()
+        self.keys.refresh()
+        self._compile()
+        self.reset_mode()  # Stale slot keys must not be used
+        self.logger.info("Hotkeys updated from config change")
+        return True
+
+    def reset_mode(self) -> None:
+        """Leave save/load mode."""
+        self._set_mode(MODE_NORMAL)
+
+    def handle_key(self, keycode: int, pressed: bool) -> bool:
         """Handle a key event. Returns True if key should be suppressed.
 
         Args:
             keycode: evdev keycode
-            pressed: True if pressed, False if released
-            state: StateManager instance
-            mouse: Mouse controller instance
-            movement: MovementController instance
-            scroll: ScrollController instance
-            tray: TrayIcon instance
-            write_status_callback: Callback to write status file
-            held_buttons: Set of currently held mouse buttons
-            save_mode: Dict with 'active' key for save mode state
-            load_mode: Dict with 'active' key for load mode state
-            save_position_callback: Callback(slot) to save position
-            load_position_callback: Callback(slot) to load position
-            cycle_monitor_callback: Callback to cycle monitor
+            pressed: True if pressed (or repeated), False if released
         """
-        from .keyboard_capture import KEY_LEFTALT, KEY_RIGHTALT
-
-        # Track modifier keys (Alt)
-        if keycode in (KEY_LEFTALT, KEY_RIGHTALT):
-            if pressed:
-                self._held_keys.add(keycode)
-            else:
-                self._held_keys.discard(keycode)
-            return False  # Don't suppress modifier keys
-
-        # Toggle mouse mode with configured key (default: Numpad+)
-        if keycode == self.keys.key_toggle and pressed:
-            enabled = state.toggle()
-            if not enabled:
-                # Stop all movement, scroll, and release held buttons when disabling
-                movement.stop_all()
-                scroll.stop_all()
-                self._release_all_held_buttons(mouse, held_buttons)
-            # Update tray icon and status file
-            tray.update(enabled)
-            write_status_callback(enabled)
-            self.logger.info("Mouse mode: %s", "enabled" if enabled else "disabled")
-            print(f"Mouse mode: {'ENABLED' if enabled else 'DISABLED'}")
-            return True  # Suppress this key
-
-        # Only process movement/click keys when enabled
-        if not state.is_enabled:
-            return False  # Let key pass through
-
-        # Handle position memory modes
-        if keycode == self.keys.key_save_mode and pressed:
-            save_mode["active"] = not save_mode["active"]
-            load_mode["active"] = False  # Mutual exclusion
-            print(f"Save mode: {'ON' if save_mode['active'] else 'OFF'}")
-            return True
-
-        if keycode == self.keys.key_load_mode and pressed:
-            load_mode["active"] = not load_mode["active"]
-            save_mode["active"] = False  # Mutual exclusion
-            print(f"Load mode: {'ON' if load_mode['active'] else 'OFF'}")
-            return True
-
-        # Handle slot keys when in save/load mode
-        if keycode in self.keys.slot_keys and pressed:
-            if save_mode["active"]:
-                save_position_callback(self.keys.slot_keys[keycode])
-                save_mode["active"] = False
-                return True
-            elif load_mode["active"]:
-                load_position_callback(self.keys.slot_keys[keycode])
-                load_mode["active"] = False
+        # Any key press ends a scroll momentum phase
+        if pressed:
+            self._scroll.cancel_momentum()
+        table = self._active if self._state.is_enabled else self._disabled
+        handler = table.get(keycode)
+        return handler(pressed) if handler is not None else False
+
+    def _set_mode(self, mode: str) -> None:
+        """Switch position memory mode and its dispatch table."""
+        self.mode = mode
+        self._active = self._tables.get((mode, self._alt), {})
+
+    def _compile(self) -> None:
+        """Build the per-mode dispatch tables from the current key mappings."""
+        if not self._bound:
+            return
+        self._tables = {
+            (mode, alt): self._compile_table(mode, alt)
+            for mode in (MODE_NORMAL, MODE_SAVE, MODE_LOAD)
+            for alt in (False, True)
+        }
+        # Disabled: only the toggle and modifier tracking are live
+        disabled: dict[int, KeyHandler] = {}
+        disabled[self.keys.key_toggle] = _on_press(self._toggle, _pass)
+        for key in (KEY_LEFTALT, KEY_RIGHTALT):
+            disabled[key] = partial(self._track_alt, key)
+        self._disabled = disabled
+        self._set_mode(self.mode)
+
+    def _compile_table(self, mode: str, alt: bool) -> dict[int, KeyHandler]:
+        """Build one mode's table, binding lowest precedence first.
+
+        Later bindings replace earlier ones for the same keycode; press-only
+        actions keep the replaced handler for releases.
+        """
+        keys = self.keys
+        table: dict[int, KeyHandler] = {}
+
+        def press(key: int, action: KeyHandler) -> None:
+            table[key] = _on_press(action, table.get(key, _pass))
+
+        press(keys.key_undo, self._redo if alt else self._undo)
+        for key, button in keys.hold_keys.items():
+            press(key, partial(self._toggle_hold, button))
+        for key, directions in keys.scroll_keys.items():
+            table[key] = self._directions(self._scroll, directions)
+        if alt:
+            if keys.key_secondary_monitor in keys.scroll_keys:
+                table[keys.key_secondary_monitor] = _suppress  # Release of Alt+key
+            press(keys.key_secondary_monitor, self._cycle)
+        for key, directions in keys.movement_keys.items():
+            table[key] = self._directions(self._movement, directions)
+        for key, button in keys.click_actions.items():
+            table[key] = partial(self._click, button)
+        if mode != MODE_NORMAL:
+            on_slot = self._save_slot if mode == MODE_SAVE else self._load_slot
+            for key, slot in keys.slot_keys.items():
+                press(key, partial(on_slot, slot))
+        press(keys.key_load_mode, partial(self._toggle_mode, MODE_LOAD))
+        press(keys.key_save_mode, partial(self._toggle_mode, MODE_SAVE))
+        press(keys.key_toggle, self._toggle)
+        for key in (KEY_LEFTALT, KEY_RIGHTALT):
+            table[key] = partial(self._track_alt, key)
+        return table
+
+    @staticmethod
+    def _directions(controller, directions: tuple[str, ...]) -> KeyHandler:
+        """Bind start/stop of a controller's direction(s) to press/release."""
+        start, stop = controller.start_direction, controller.stop_direction
+        if len(directions) == 1:
+            (direction,) = directions
+
+            def handler(pressed: bool) -> bool:
+                (start if pressed else stop)(direction)
                 return True
 
-        # Handle click actions
-        if keycode in self.keys.click_actions:
-            if pressed:
-                button = self.keys.click_actions[keycode]
-                mouse.click(button)
-            return True  # Suppress click keys
-
-        # Handle movement keys
-        if keycode in self.keys.movement_keys:
-            directions = self.keys.movement_keys[keycode]
-            if pressed:
-                # Start moving in direction(s)
-                for direction in directions:
-                    movement.start_direction(direction)
-            else:
-                # Stop moving in direction(s)
+        else:
+
+            def handler(pressed: bool) -> bool:
+                action = start if pressed else stop
                 for direction in directions:
-                    movement.stop_direction(direction)
-            return True  # Suppress movement keys
-
-        # Handle Alt+secondary_monitor to cycle monitors (before scroll check)
-        if keycode == self.keys.key_secondary_monitor and pressed and self._is_alt_held():
-            cycle_monitor_callback()
-            return True  # Suppress this key
-
-        # Handle scroll keys (only if Alt not held for secondary_monitor key)
-        if keycode in self.keys.scroll_keys:
-            # Skip if this is secondary_monitor key with Alt (handled above)
-            if keycode == self.keys.key_secondary_monitor and self._is_alt_held():
+                    action(direction)
                 return True
-            directions = self.keys.scroll_keys[keycode]
-            if pressed:
-                for direction in directions:
-                    scroll.start_direction(direction)
-            else:
-                for direction in directions:
-                    scroll.stop_direction(direction)
-            return True  # Suppress scroll keys
-
-        # Handle hold keys (toggle mouse button hold for drag operations)
-        if keycode in self.keys.hold_keys and pressed:
-            button = self.keys.hold_keys[keycode]
-            if button in held_buttons:
-                # Release the button
-                mouse.release(button)
-                held_buttons.discard(button)
-            else:
-                # Press and hold the button
-                mouse.press(button)
-                held_buttons.add(button)
-            return True  # Suppress hold keys
-
-        # Handle undo with configured key (default: NumpadSlash)
-        if keycode == self.keys.key_undo and pressed:
-            movement.undo()
-            return True  # Suppress undo key
-
-        return False  # Don't suppress other keys
+
+        return handler
+
+    def _track_alt(self, keycode: int, pressed: bool) -> bool:
+        """Track Alt state and switch to the matching table."""
+        if pressed:
+            self._held_keys.add(keycode)
+        else:
+            self._held_keys.discard(keycode)
+        alt = KEY_LEFTALT in self._held_keys or KEY_RIGHTALT in self._held_keys
+        if alt != self._alt:
+            self._alt = alt
+            self._set_mode(self.mode)
+        return False  # Don't suppress modifier keys
+
+    def _toggle(self, pressed: bool) -> bool:
+        """Toggle mouse mode with configured key (default: Numpad+)."""
+        enabled = self._state.toggle()
+        if not enabled:
+            # Stop all movement, scroll, and release held buttons when disabling
+            self._movement.stop_all()
+            self._scroll.stop_all()
+            self._release_all_held_buttons(self._mouse, self._held_buttons)
+        # Update tray icon and status subscribers
+        self._tray.update(enabled)
+        self._publish_status()
+        self.logger.info("Mouse mode: %s", "enabled" if enabled else "disabled")
+        print(f"Mouse mode: {'ENABLED' if enabled else 'DISABLED'}")
+        return True  # Suppress this key
+
+    def _toggle_mode(self, mode: str, pressed: bool) -> bool:
+        """Enter or leave save/load mode (mutually exclusive)."""
+        self._set_mode(MODE_NORMAL if self.mode == mode else mode)
+        print(f"{mode.capitalize()} mode: {'ON' if self.mode == mode else 'OFF'}")
+        self._publish_status()
+        return True
+
+    def _save_slot(self, slot: int, pressed: bool) -> bool:
+        """Save the position to a slot and leave save mode."""
+        self._save_position(slot)
+        self._set_mode(MODE_NORMAL)
+        self._publish_status()
+        return True
+
+    def _load_slot(self, slot: int, pressed: bool) -> bool:
+        """Load the position from a slot and leave load mode."""
+        self._load_position(slot)
+        self._set_mode(MODE_NORMAL)
+        self._publish_status()
+        return True
+
+    def _click(self, button: str, pressed: bool) -> bool:
+        """Click on press; suppress both press and release."""
+        if pressed:
+            self._mouse.click(button)
+        return True
+
+    def _toggle_hold(self, button: str, pressed: bool) -> bool:
+        """Toggle a mouse button hold for drag operations."""
+        if button in self._held_buttons:
+            self._mouse.release(button)
+            self._held_buttons.discard(button)
+        else:
+            self._mouse.press(button)
+            self._held_buttons.add(button)
+        self._publish_status()
+        return True
+
+    def _undo(self, pressed: bool) -> bool:
+        """Undo the last stroke (default: NumpadSlash)."""
+        self._movement.undo()
+        return True
+
+    def _redo(self, pressed: bool) -> bool:
+        """Redo the last undone stroke (Alt+undo key)."""
+        self._movement.redo()
+        return True
+
+    def _cycle(self, pressed: bool) -> bool:
+        """Cycle monitors (Alt+secondary_monitor key)."""
+        self._cycle_monitor()
+        return True
 
     def _release_all_held_buttons(self, mouse, held_buttons: set[str]) -> None:
         """Release all held mouse buttons."""
@@ -1,25 +1,25 @@
-"""IPC management for status file and GUI indicator subprocess."""
+"""IPC management for the status channel and GUI indicator subprocess."""
 
 import subprocess
-from pathlib import Path
+from typing import Any
 
-
-# Status file for IPC with GUI indicator
-STATUS_FILE = Path("/tmp/mouse-on-numpad-status")
+from ..core.status_channel import StatusPublisher
 
 
 class IPCManager:
-    """Manages IPC with GUI indicator (status file and subprocess)."""
+    """Manages IPC with GUI indicator (status channel and subprocess)."""
 
     def __init__(self) -> None:
         self._indicator_proc: subprocess.Popen[bytes] | None = None
+        self.status = StatusPublisher()
+
+    def start_status(self) -> bool:
+        """Start the status channel (before the indicator is launched)."""
+        return self.status.start()
 
-    def write_status(self, enabled: bool) -> None:
-        """Write status to file for GUI indicator IPC."""
-        try:
-            STATUS_FILE.write_text("enabled" if enabled else "disabled")
-        except OSError:
-            pass  # Ignore file write errors
+    def publish_status(self, **changes: Any) -> None:
+        """Push status changes to subscribers (no-op if nothing changed)."""
+        self.status.publish(**changes)
 
     def start_indicator(self) -> None:
         """Start indicator as subprocess (GTK 4 layer shell, separate from GTK 3 tray)."""
@@ -41,9 +41,6 @@ class IPCManager:
         if self._indicator_proc:
             self._indicator_proc.terminate()
 
-    def cleanup_status_file(self) -> None:
-        """Clean up status file."""
-        try:
-            STATUS_FILE.unlink(missing_ok=True)
-        except OSError:
-            pass
+    def close_status(self) -> None:
+        """Disconnect subscribers and remove the status socket."""
+        self.status.close()
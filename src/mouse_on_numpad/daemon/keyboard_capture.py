@@ -1,9 +1,49 @@
-"""Keyboard device discovery and event reading for evdev."""
+"""Keyboard device discovery and event reading for evdev.
 
+All grabbed keyboards are multiplexed on one selectors (epoll) loop: each
+wakeup drains a batch of events per ready device with a single read() and
+dispatches them on the capture thread, instead of one blocking reader thread
+per device. run_async() does the same on an asyncio loop via add_reader().
+
+With hotplug enabled, an inotify watch on /dev/input is multiplexed on the
+same loop: new nodes are probed on a worker thread (open + capabilities)
+and attached to the running loop; removed ones are torn down.
+
+Forwarded (non-suppressed) events are buffered per device up to the
+device's own SYN_REPORT, with suppressed keys removed, and each read batch
+is re-injected with a single write to the uinput clone.
+
+Kernel autorepeat (value 2) is never forwarded: the clone inherits EV_REP
+and repeats held keys itself, at the physical device's rate. Repeats of
+keys whose press was consumed by a continuous action (set_repeat_filter)
+are not dispatched either; movement and scrolling run on their own ticks.
+
+In passthrough mode (set_passthrough) devices are only grabbed while mouse
+mode is enabled. While ungrabbed, the kernel filters each device down to the
+watched keys (EVIOCSMASK), so ordinary typing never wakes the daemon.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import selectors
 import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+
 import evdev
 
 from ..core import ErrorLogger
+from .capability_cache import CapabilityCache, DeviceCaps, SysfsDevice, read_sysfs
+from .device_monitor import DeviceMonitor
+from .device_selector import DeviceIdentity, DeviceSelector
+from .event_mask import watch_all, watch_keys_only
 
 
 # Modifier keycodes
@@ -18,76 +58,766 @@ KEY_KP8 = 72
 KEY_PRESSED = 1
 KEY_REPEAT = 2
 
+# linux/input-event-codes.h
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_MSC = 0x04
+SYN_REPORT = 0
+SYN_DROPPED = 3
+
+# Parallel probes of unknown devices at startup
+MAX_PROBE_WORKERS = 8
+
+# Max time call() waits for the capture loop to run a call (seconds)
+CALL_TIMEOUT = 5.0
+
+# Name prefix of our own uinput clones (never captured: they copy the
+# source keyboard's numpad keys and would be cloned again on hotplug)
+CLONE_PREFIX = "mouse-on-numpad-"
+
+# Selector data marking the hotplug fd (device fds carry their slot)
+_HOTPLUG = object()
+
+
+@dataclass
+class CaptureStats:
+    """Counters collected by the capture loop.
+
+    Latency is measured from the kernel event timestamp to dispatch of the
+    first event of each batch (seconds).
+    """
+
+    devices: int = 0  # Devices currently attached
+    threads: int = 0  # Process threads when the loop started
+    wakeups: int = 0  # select() returns with at least one ready device
+    batches: int = 0  # read() calls that returned events
+    events: int = 0  # Events dispatched
+    max_batch: int = 0  # Largest batch returned by one read()
+    grabs: int = 0  # Grab/ungrab transitions (passthrough mode)
+    attached: int = 0  # Devices attached by hotplug
+    forwarded: int = 0  # Frames re-injected through uinput clones
+    forward_writes: int = 0  # write(2) calls issued for forwarded frames
+    repeats: int = 0  # Kernel autorepeat events read (never forwarded)
+    repeats_filtered: int = 0  # Autorepeats of consumed continuous keys not dispatched
+    detached: int = 0  # Devices removed or disconnected
+    latency_mean: float = 0.0
+    latency_max: float = 0.0
+
+
+class _DeviceSlot:
+    """A captured device and its passthrough UInput clone."""
+
+    __slots__ = (
+        "fd", "device", "ui", "frame", "pending", "dropping", "consumed", "saved_repeat",
+        "grabbed", "masked",
+    )
+
+    def __init__(self, device: evdev.InputDevice[str], ui: evdev.UInput | None) -> None:
+        self.fd = device.fd  # Kept: device.fd is invalidated by close()
+        self.device = device
+        self.ui = ui
+        self.frame = None  # FrameWriter on the clone's fd
+        if ui is not None:
+            from ..input.uinput_frame import FrameWriter
+
+            self.frame = FrameWriter(ui.fd)
+        self.pending: list[tuple[int, int, int]] = []  # Current frame so far
+        self.dropping = False  # After SYN_DROPPED, until the next SYN_REPORT
+        self.consumed: set[int] = set()  # Held continuous keys whose press was suppressed
+        self.saved_repeat: tuple[int, int] | None = None  # Device repeat before set_repeat()
+        self.grabbed = False
+        self.masked = False  # Kernel filter limits delivery to watched keys
+
 
 class KeyboardCapture:
     """Handles keyboard device discovery and event reading."""
 
-    def __init__(self, logger: ErrorLogger) -> None:
+    def __init__(
+        self,
+        logger: ErrorLogger,
+        selector: DeviceSelector | None = None,
+        cache: CapabilityCache | None = None,
+    ) -> None:
         self.logger = logger
+        self.selector = selector or DeviceSelector()
+        if self.selector.exclusive_ignored:
+            self.logger.warning(
+                "capture.exclusive ignored: set capture.devices to choose the devices to consume"
+            )
+        self.cache = cache
         self._running = False
-        self._devices: list[evdev.InputDevice] = []
-        self._threads: list[threading.Thread] = []
+        self._stop_requested = False
+        self._selector: selectors.BaseSelector | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._callback: Callable[[int, bool], bool] | None = None
+        self._thread_id: int | None = None
+        self._pending: deque[tuple[Callable[..., Any], tuple[Any, ...]]] = deque()
+        self._watch_keys: frozenset[int] | None = None  # None = always grabbed
+        self._want_grab = False  # Passthrough mode: grab (mouse mode enabled)
+        self._repeat_keys: frozenset[int] = frozenset()  # Continuous-action keys
+        self._repeat: tuple[int, int] | None = None  # (delay ms, period ms) to apply
+        self._slots: dict[int, _DeviceSlot] = {}
+        self._monitor: DeviceMonitor | None = None
+        self._probe_pool: ThreadPoolExecutor | None = None
+        self._probing: set[str] = set()  # Paths being probed off-thread
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        self._latency_total = 0.0
+        self._stats = CaptureStats()
+
+    @property
+    def stats(self) -> CaptureStats:
+        """Return a copy of the capture statistics."""
+        return replace(self._stats, devices=len(self._slots))
+
+    @property
+    def running(self) -> bool:
+        """Return True while the capture loop is running."""
+        return self._running
+
+    def set_passthrough(self, watch_keys: Iterable[int] | None) -> None:
+        """Choose between permanent grabs and grabbing only in mouse mode.
+
+        Safe to call from any thread; takes effect on the capture thread.
+
+        Args:
+            watch_keys: Keys observed while ungrabbed (the toggle key), or
+                None to grab devices for the daemon's whole lifetime
+        """
+        keys = frozenset(watch_keys) if watch_keys is not None else None
+        self._call_soon(self._apply_passthrough, keys)
+
+    def set_grab(self, grab: bool) -> None:
+        """Grab or release devices in passthrough mode (no-op otherwise).
+
+        The change is applied per device once none of its keys are held, so
+        a key pressed before the switch is also released on the same side.
+        Safe to call from any thread.
+
+        Args:
+            grab: True when mouse mode is enabled
+        """
+        self._call_soon(self._apply_grab, grab)
+
+    def set_repeat_filter(self, keys: Iterable[int]) -> None:
+        """Drop autorepeat of continuous-action keys before dispatch.
 
-    def find_keyboards(self) -> list[evdev.InputDevice]:
-        """Find all keyboard devices."""
-        keyboards = []
-        for path in evdev.list_devices():
+        A repeat is only dropped while the key's press was suppressed, so
+        the same key still repeats normally when it is passed through.
+        Safe to call from any thread.
+
+        Args:
+            keys: Keys bound to continuous actions (movement, scrolling)
+        """
+        self._repeat_keys = frozenset(keys)  # Read once per batch
+
+    def set_repeat(self, delay: int | None, rate: int | None) -> None:
+        """Set the kernel autorepeat of captured devices (EVIOCSREP).
+
+        Devices get their previous setting back when they are released.
+        Safe to call from any thread.
+
+        Args:
+            delay: Milliseconds before a held key starts repeating
+            rate: Repeats per second; with delay None, restore device defaults
+        """
+        repeat = None
+        if delay is not None and rate:
+            repeat = (max(int(delay), 0), max(round(1000 / rate), 1))
+        self._call_soon(self._apply_repeat_all, repeat)
+
+    def call(self, func: Callable[..., Any], *args: Any, timeout: float = CALL_TIMEOUT) -> Any:
+        """Run func on the capture loop and wait for its result.
+
+        Lets other threads (the control socket) act on state that key
+        handling owns without racing the capture thread. Runs func directly
+        when the loop is not running or the caller is already on it.
+
+        Args:
+            func: Function to call
+            *args: Arguments for func
+            timeout: Seconds to wait for the loop to run func
+
+        Returns:
+            func's result (its exception is re-raised in the caller)
+
+        Raises:
+            TimeoutError: The loop did not run func in time
+        """
+        future: Future[Any] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return  # Caller gave up waiting
             try:
-                dev = evdev.InputDevice(path)
-                caps = dev.capabilities()
-                # Check if device has key events and numpad keys
-                if evdev.ecodes.EV_KEY in caps:
-                    keys = caps[evdev.ecodes.EV_KEY]
-                    # Check for numpad keys
-                    if KEY_KP5 in keys or KEY_KP8 in keys:
-                        keyboards.append(dev)
-                        self.logger.info("Found keyboard: %s", dev.name)
-            except (OSError, IOError):
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        self._call_soon(run)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError("capture loop did not respond") from None
+
+    def enable_hotplug(self) -> bool:
+        """Watch /dev/input so devices plugged in later are captured too.
+
+        Call before run().
+
+        Returns:
+            True if hotplug notifications are available
+        """
+        if self._monitor is None:
+            self._monitor = DeviceMonitor.create()
+        return self._monitor is not None
+
+    def find_keyboards(self) -> list[evdev.InputDevice[str]]:
+        """Find the keyboard devices to capture.
+
+        Without an allowlist, every device with numpad keys; otherwise every
+        key device the selector matches. Devices not captured are closed.
+        With a capability cache, devices known to be unwanted are never
+        opened, and unknown ones are probed in parallel.
+        """
+        start = time.perf_counter()
+        paths = evdev.list_devices()
+        cache = self.cache
+        found: dict[str, evdev.InputDevice[str]] = {}
+        unknown: list[tuple[str, SysfsDevice | None]] = []
+        cached = 0
+        for path in paths:
+            info = read_sysfs(path) if cache is not None else None
+            caps = cache.get(info.key) if cache is not None and info is not None else None
+            if info is None or caps is None:
+                unknown.append((path, info))
                 continue
+            cached += 1
+            if self._selects(info.identity, caps):
+                try:
+                    found[path] = evdev.InputDevice(path)
+                except OSError:
+                    continue
+
+        if len(unknown) > 1:
+            workers = min(len(unknown), MAX_PROBE_WORKERS)
+            with ThreadPoolExecutor(workers, thread_name_prefix="device-probe") as pool:
+                results = list(pool.map(self._probe_startup, unknown))
+        else:
+            results = [self._probe_startup(item) for item in unknown]
+        for (path, _), device in zip(unknown, results):
+            if device is not None:
+                found[path] = device
+        if cache is not None:
+            cache.save()
+
+        keyboards = [found[path] for path in paths if path in found]
+        for dev in keyboards:
+            self.logger.info("Found keyboard: %s", dev.name)
+        self.logger.info(
+            "Device scan: %d devices (%d cached, %d probed), %d selected in %.1f ms",
+            len(paths),
+            cached,
+            len(unknown),
+            len(keyboards),
+            (time.perf_counter() - start) * 1000.0,
+        )
+        if not keyboards and self.selector.has_rules:
+            self.logger.warning(
+                "No input device matches capture.devices %s", self.selector.rules
+            )
         return keyboards
 
-    def read_device(
-        self, device: evdev.InputDevice, handle_key_callback, running_check
+    def _probe_startup(
+        self, item: tuple[str, SysfsDevice | None]
+    ) -> evdev.InputDevice[str] | None:
+        """Open and probe one unknown device (probe worker thread).
+
+        Returns:
+            The open device if it should be captured, else None (closed)
+        """
+        path, info = item
+        try:
+            device = evdev.InputDevice(path)
+        except OSError:
+            return None
+        try:
+            caps = self._device_caps(device)
+            if self.cache is not None and info is not None:
+                self.cache.put(info.key, caps)
+            if self._selects(DeviceIdentity.from_device(device), caps):
+                return device
+        except OSError:
+            pass
+        device.close()
+        return None
+
+    def _wanted(self, device: evdev.InputDevice[str]) -> bool:
+        """Return True if an open device should be captured."""
+        return self._selects(DeviceIdentity.from_device(device), self._device_caps(device))
+
+    @staticmethod
+    def _device_caps(device: evdev.InputDevice[str]) -> DeviceCaps:
+        """Query the capability facts used for selection."""
+        # absinfo=False skips one ioctl per absolute axis (joysticks, touchpads)
+        caps = device.capabilities(absinfo=False)
+        keys = caps.get(evdev.ecodes.EV_KEY)
+        if keys is None:
+            return DeviceCaps(has_keys=False, numpad=False)
+        # Check for numpad keys
+        return DeviceCaps(has_keys=True, numpad=KEY_KP5 in keys or KEY_KP8 in keys)
+
+    def _selects(self, identity: DeviceIdentity, caps: DeviceCaps) -> bool:
+        """Return True if a device with these facts should be captured."""
+        if not caps.has_keys or identity.name.startswith(CLONE_PREFIX):
+            return False
+        if self.selector.has_rules:
+            return self.selector.matches(identity)
+        return caps.numpad
+
+    def run(
+        self,
+        devices: list[evdev.InputDevice[str]],
+        handle_key_callback: Callable[[int, bool], bool],
     ) -> None:
-        """Read events from a device in a thread.
+        """Grab devices and dispatch their events until stop() is called.
+
+        Blocks the calling thread, which becomes the only capture thread.
 
         Args:
-            device: evdev InputDevice to read from
+            devices: evdev InputDevices to read from
             handle_key_callback: Function(keycode, pressed) -> bool for handling key events
-            running_check: Function() -> bool to check if daemon is still running
         """
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        if self._monitor is not None:
+            self._selector.register(self._monitor.fileno(), selectors.EVENT_READ, _HOTPLUG)
+        self._callback = handle_key_callback
+        self._thread_id = threading.get_ident()
+        self._running = not self._stop_requested
         try:
-            # Grab device to prevent keys from reaching other apps
-            device.grab()
-            self.logger.info("Grabbed device: %s", device.name)
-        except OSError:
-            self.logger.warning("Could not grab device: %s", device.name)
+            self._attach_all(devices)
+            while self._running:
+                ready = self._selector.select()
+                if ready:
+                    self._stats.wakeups += 1
+                for key, _ in ready:
+                    slot = key.data
+                    if slot is None:
+                        self._drain_wake_pipe()
+                        self._run_pending()
+                    elif slot is _HOTPLUG:
+                        self._on_hotplug()
+                    else:
+                        self._read_batch(slot)
+        finally:
+            self._detach_all()
+            self._run_pending()  # Calls queued while stopping
+            self._selector.close()
+            self._selector = None
+            self._thread_id = None
+
+    async def run_async(
+        self,
+        devices: list[evdev.InputDevice[str]],
+        handle_key_callback: Callable[[int, bool], bool],
+    ) -> None:
+        """Grab devices and dispatch their events on the running event loop.
+
+        Each device fd gets a loop reader that drains one read() batch per
+        wakeup, like run(). Returns once stop() is called.
+
+        Args:
+            devices: evdev InputDevices to read from
+            handle_key_callback: Function(keycode, pressed) -> bool for handling key events
+        """
+        loop = asyncio.get_running_loop()
+        stopped = loop.create_future()
+
+        def on_wake() -> None:
+            self._drain_wake_pipe()
+            self._run_pending()
+            if not self._running and not stopped.done():
+                stopped.set_result(None)
+
+        self._loop = loop
+        self._callback = handle_key_callback
+        self._thread_id = threading.get_ident()
+        loop.add_reader(self._wake_r, on_wake)
+        if self._monitor is not None:
+            loop.add_reader(self._monitor.fileno(), self._on_hotplug)
+        self._running = not self._stop_requested
+        try:
+            self._attach_all(devices)
+            if self._running:
+                await stopped
+        finally:
+            loop.remove_reader(self._wake_r)
+            if self._monitor is not None:
+                loop.remove_reader(self._monitor.fileno())
+            self._detach_all()
+            self._run_pending()  # Calls queued while stopping
+            self._loop = None
+            self._thread_id = None
+
+    def stop(self) -> None:
+        """Wake the capture loop and make it return (safe from any thread)."""
+        self._stop_requested = True
+        self._running = False
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Pipe full (already woken) or closed
+
+    def close(self) -> None:
+        """Release the wake pipe and hotplug watch (after run() has returned).
+
+        Safe to call more than once; later stop() calls become no-ops.
+        """
+        if self._monitor is not None:
+            self._monitor.close()
+            self._monitor = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd < 0:
+                continue  # Already closed; the number may belong to another file now
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_r = self._wake_w = -1
+
+    def _attach_all(self, devices: list[evdev.InputDevice[str]]) -> None:
+        """Attach the initial devices and log the capture setup."""
+        for device in devices:
+            self._attach(device)
+        self._stats.threads = threading.active_count()
+        self.logger.info(
+            "Capture loop: %d device(s) on one thread (%d threads in process)",
+            len(self._slots),
+            self._stats.threads,
+        )
+
+    def _detach_all(self) -> None:
+        """Detach every device and log the capture statistics."""
+        self._running = False
+        if self._probe_pool is not None:
+            self._probe_pool.shutdown(wait=False, cancel_futures=True)
+            self._probe_pool = None
+        self._probing.clear()
+        for slot in list(self._slots.values()):
+            self._detach(slot)
+        stats = self.stats
+        self.logger.info(
+            "Capture loop stopped: %d events in %d batches, %d wakeups, "
+            "%d/%d autorepeats filtered, latency mean %.3f ms / max %.3f ms",
+            stats.events,
+            stats.batches,
+            stats.wakeups,
+            stats.repeats_filtered,
+            stats.repeats,
+            stats.latency_mean * 1000.0,
+            stats.latency_max * 1000.0,
+        )
+
+    def _call_soon(self, func: Callable[..., Any], *args: Any) -> None:
+        """Run func on the capture thread (directly if already on it)."""
+        if not self._running or threading.get_ident() == self._thread_id:
+            func(*args)
+            return
+        self._pending.append((func, args))
+        try:
+            os.write(self._wake_w, b"\1")
+        except (BlockingIOError, OSError):
+            pass  # Already woken
+
+    def _run_pending(self) -> None:
+        """Run calls queued by other threads."""
+        while self._pending:
+            func, args = self._pending.popleft()
+            func(*args)
+
+    def _apply_repeat_all(self, repeat: tuple[int, int] | None) -> None:
+        """Record the wanted repeat setting and apply it (capture thread)."""
+        self._repeat = repeat
+        for slot in list(self._slots.values()):
+            self._apply_repeat(slot)
+
+    def _apply_repeat(self, slot: _DeviceSlot) -> None:
+        """Apply the repeat setting to a device and mirror it on its clone."""
+        device = slot.device
+        try:
+            if self._repeat is not None:
+                if slot.saved_repeat is None:
+                    slot.saved_repeat = tuple(device.repeat)
+                device.repeat = self._repeat
+            elif slot.saved_repeat is not None:
+                device.repeat = slot.saved_repeat
+                slot.saved_repeat = None
+            if slot.ui is not None:
+                # The clone's own soft repeat replaces forwarded repeats
+                slot.ui.device.repeat = tuple(device.repeat)
+        except (OSError, AttributeError):
+            pass  # No EV_REP (or no clone event node)
+
+    def _apply_passthrough(self, watch_keys: frozenset[int] | None) -> None:
+        """Switch grab policy (capture thread)."""
+        self._watch_keys = watch_keys
+        for slot in list(self._slots.values()):
+            self._sync_grab(slot)
 
+    def _apply_grab(self, grab: bool) -> None:
+        """Record the wanted grab state and apply it (capture thread)."""
+        self._want_grab = grab
+        for slot in list(self._slots.values()):
+            self._sync_grab(slot)
+
+    def _sync_grab(self, slot: _DeviceSlot) -> None:
+        """Move a device towards the wanted grab state.
+
+        Deferred while any key on the device is down: grabbing mid-press would
+        leave the press with the desktop and the release with us (stuck key).
+        """
+        want = self._watch_keys is None or self._want_grab
+        if slot.grabbed == want:
+            if not want and not slot.masked:
+                self._mask(slot, self._watch_keys)
+            return
+        if self._keys_down(slot):
+            if slot.masked:
+                self._mask(slot, None)  # Watch for the releases
+            return
+        device = slot.device
         try:
-            ui = evdev.UInput.from_device(device, name=f"mouse-on-numpad-{device.name}")
+            if want:
+                # Grab device to prevent keys from reaching other apps
+                device.grab()
+                self.logger.info("Grabbed device: %s", device.name)
+            else:
+                device.ungrab()
+                self.logger.info("Released device: %s", device.name)
         except OSError:
-            ui = None
+            action = "grab" if want else "release"
+            self.logger.warning("Could not %s device: %s", action, device.name)
+            return
+        slot.grabbed = want
+        self._stats.grabs += 1
+        self._mask(slot, None if want else self._watch_keys)
+
+    def _mask(self, slot: _DeviceSlot, keys: frozenset[int] | None) -> None:
+        """Limit kernel delivery to keys (None = everything)."""
+        if keys is None:
+            if slot.masked:
+                watch_all(slot.fd)
+                slot.masked = False
+        else:
+            slot.masked = watch_keys_only(slot.fd, keys)
 
+    @staticmethod
+    def _keys_down(slot: _DeviceSlot) -> bool:
+        """Return True if any key on the device is currently held."""
         try:
-            for event in device.read_loop():
-                if not running_check():
-                    break
-                if event.type == evdev.ecodes.EV_KEY:
-                    pressed = event.value in (KEY_PRESSED, KEY_REPEAT)
-                    suppress = handle_key_callback(event.code, pressed)
-                    # Forward non-suppressed keys back to system
-                    if not suppress and ui:
-                        ui.write_event(event)
-                        ui.syn()
-                elif ui:
-                    # Forward other events (SYN, etc.)
-                    ui.write_event(event)
+            return bool(slot.device.active_keys())
         except OSError:
-            self.logger.warning("Device disconnected: %s", device.name)
-        finally:
+            return False
+
+    def _attach(self, device: evdev.InputDevice[str]) -> None:
+        """Clone a device for passthrough, grab it if wanted and register its fd."""
+        ui = None
+        if not self.selector.exclusive:
             try:
-                device.ungrab()
+                ui = evdev.UInput.from_device(device, name=f"{CLONE_PREFIX}{device.name}")
             except OSError:
                 pass
-            if ui:
-                ui.close()
+
+        slot = _DeviceSlot(device, ui)
+        self._apply_repeat(slot)
+        self._sync_grab(slot)
+        if self._loop is not None:
+            self._loop.add_reader(slot.fd, self._on_readable, slot)
+        elif self._selector is not None:
+            self._selector.register(slot.fd, selectors.EVENT_READ, slot)
+        self._slots[slot.fd] = slot
+
+    def _detach(self, slot: _DeviceSlot) -> None:
+        """Unregister a device, release its grab and close its clone."""
+        if self._slots.pop(slot.fd, None) is not None:
+            if self._loop is not None:
+                self._loop.remove_reader(slot.fd)
+            elif self._selector is not None:
+                try:
+                    self._selector.unregister(slot.fd)
+                except (KeyError, ValueError):
+                    pass
+        if slot.grabbed:
+            try:
+                slot.device.ungrab()
+            except OSError:
+                pass
+            slot.grabbed = False
+        if slot.saved_repeat is not None:
+            try:
+                slot.device.repeat = slot.saved_repeat
+            except OSError:
+                pass  # Disconnected
+        if slot.ui:
+            slot.ui.close()
+            slot.ui = None
+        try:
+            slot.device.close()
+        except OSError:
+            pass
+
+    def _on_hotplug(self) -> None:
+        """Handle /dev/input changes (capture thread)."""
+        if self._monitor is None:
+            return
+        for path, added in self._monitor.read_changes():
+            slot = self._slot_for_path(path)
+            if not added:
+                if slot is not None:
+                    self.logger.info("Device removed: %s", slot.device.name)
+                    self._detach(slot)
+                    self._stats.detached += 1
+            elif slot is None and path not in self._probing:
+                # Opening and probing a device can take milliseconds; keep it
+                # off the capture thread so typing on other devices never stalls
+                if self._probe_pool is None:
+                    self._probe_pool = ThreadPoolExecutor(1, thread_name_prefix="device-probe")
+                self._probing.add(path)
+                self._probe_pool.submit(self._probe, path)
+
+    def _probe(self, path: str) -> None:
+        """Open and classify a new device node (probe thread)."""
+        device = None
+        try:
+            device = evdev.InputDevice(path)
+            if not self._wanted(device):
+                device.close()
+                device = None
+        except OSError:
+            # Not ready yet (udev still setting permissions); IN_ATTRIB retries
+            if device is not None:
+                device.close()
+            device = None
+        self._call_soon(self._attach_probed, path, device)
+
+    def _attach_probed(self, path: str, device: evdev.InputDevice[str] | None) -> None:
+        """Attach a device accepted by _probe (capture thread)."""
+        self._probing.discard(path)
+        if device is None:
+            return
+        if not self._running or self._slot_for_path(path) is not None:
+            device.close()
+            return
+        self._attach(device)
+        self._stats.attached += 1
+        self.logger.info("Attached keyboard: %s", device.name)
+
+    def _slot_for_path(self, path: str) -> _DeviceSlot | None:
+        """Return the slot of the device at a /dev/input path."""
+        for slot in self._slots.values():
+            if slot.device.path == path:
+                return slot
+        return None
+
+    def _drain_wake_pipe(self) -> None:
+        """Consume pending wake bytes."""
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _on_readable(self, slot: _DeviceSlot) -> None:
+        """Event loop reader callback for a device fd."""
+        self._stats.wakeups += 1
+        self._read_batch(slot)
+
+    def _read_batch(self, slot: _DeviceSlot) -> None:
+        """Read one batch from a ready device and dispatch it."""
+        device = slot.device
+        try:
+            events = list(device.read())
+        except BlockingIOError:
+            return  # Spurious wakeup
+        except OSError:
+            self.logger.warning("Device disconnected: %s", device.name)
+            self._detach(slot)
+            self._stats.detached += 1
+            return
+        if not events:
+            return
+
+        stats = self._stats
+        stats.batches += 1
+        stats.events += len(events)
+        if len(events) > stats.max_batch:
+            stats.max_batch = len(events)
+        latency = max(time.time() - events[0].timestamp(), 0.0)
+        self._latency_total += latency
+        stats.latency_mean = self._latency_total / stats.batches
+        if latency > stats.latency_max:
+            stats.latency_max = latency
+
+        handle_key_callback = self._callback
+        if handle_key_callback is None:
+            return  # Not running
+        watch_keys = self._watch_keys
+        if watch_keys is not None and not slot.grabbed:
+            # Passthrough: the desktop already has these events; only observe
+            for event in events:
+                if event.type == EV_KEY and event.code in watch_keys:
+                    handle_key_callback(event.code, event.value in (KEY_PRESSED, KEY_REPEAT))
+            self._sync_grab(slot)
+            return
+
+        frame = slot.frame
+        pending = slot.pending
+        consumed = slot.consumed
+        repeat_keys = self._repeat_keys
+        for event in events:
+            etype = event.type
+            if etype == EV_KEY:
+                code = event.code
+                value = event.value
+                if value == KEY_REPEAT:
+                    stats.repeats += 1
+                    if code in consumed:
+                        stats.repeats_filtered += 1
+                    else:
+                        handle_key_callback(code, True)
+                    continue  # The clone repeats held keys itself
+                suppress = handle_key_callback(code, value == KEY_PRESSED)
+                if value:
+                    if suppress and code in repeat_keys:
+                        consumed.add(code)
+                elif consumed:
+                    consumed.discard(code)
+                if suppress:
+                    continue  # Dropped from the forwarded frame
+                pending.append((etype, code, value))
+            elif etype == EV_SYN:
+                if event.code == SYN_REPORT:
+                    if frame is not None and not slot.dropping:
+                        # Skip frames left empty (or only MSC_SCAN) by suppression
+                        for pending_type, _, _ in pending:
+                            if pending_type != EV_MSC:
+                                for pending_event in pending:
+                                    frame.add(*pending_event)
+                                frame.syn()
+                                stats.forwarded += 1
+                                break
+                    pending.clear()
+                    slot.dropping = False
+                elif event.code == SYN_DROPPED:
+                    # Kernel buffer overrun: the partial frame is incomplete
+                    pending.clear()
+                    slot.dropping = True
+            else:
+                pending.append((etype, event.code, event.value))
+        if frame is not None:
+            writes = frame.writes
+            frame.flush()  # One write for every complete frame in the batch
+            stats.forward_writes += frame.writes - writes
+        if watch_keys is not None and not self._want_grab:
+            self._sync_grab(slot)  # Release once the last key is up
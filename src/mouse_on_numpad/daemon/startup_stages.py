@@ -0,0 +1,131 @@
+"""Staged daemon startup: run slow, non-critical setup off the key path.
+
+Components that key handling needs right away (uinput mouse, keyboard
+capture) are built in the foreground with run(). Components only a few
+hotkeys use (monitor queries, position memory, audio probing) are built by
+submit() on a thread pool, so time to the first usable keypress no longer
+includes X11 round trips or a pactl subprocess. Every stage is timed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from ..core.error_logger import ErrorLogger
+
+T = TypeVar("T")
+
+
+class StartupStages:
+    """Run and time startup stages, some of them concurrently."""
+
+    def __init__(self, logger: ErrorLogger, max_workers: int = 3) -> None:
+        """Initialize StartupStages.
+
+        Args:
+            logger: Logger for failed stages and the startup summary
+            max_workers: Background stages that may run at once
+        """
+        self.logger = logger
+        self.durations: dict[str, float] = {}  # Stage -> seconds
+        self._started = time.perf_counter()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="startup")
+        self._futures: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._pending = 0  # Background stages not finished yet
+        self._report = False  # Log the summary when the last one finishes
+
+    def run(self, name: str, factory: Callable[..., T], *args: Any) -> T:
+        """Run a stage on the calling thread and return its result."""
+        return self._timed(name, factory, args)
+
+    def submit(
+        self, name: str, factory: Callable[..., Any], *, after: tuple[str, ...] = ()
+    ) -> None:
+        """Run a stage in the background.
+
+        Args:
+            name: Stage name (key for get() and durations)
+            factory: Builds the stage's result; called with the results of
+                the stages named in after, in order
+            after: Stages whose results factory needs
+        """
+        deps = [self._futures[dep] for dep in after]
+
+        def stage() -> Any:
+            args = [dep.result() for dep in deps]  # Raises if a dependency failed
+            return self._timed(name, factory, args)
+
+        with self._lock:
+            self._pending += 1
+        future = self._pool.submit(stage)
+        future.add_done_callback(lambda f: self._finished(name, f))
+        self._futures[name] = future
+
+    def get(self, name: str, timeout: float | None = None) -> Any:
+        """Wait for a background stage and return its result.
+
+        Returns:
+            The stage's result, or None if it failed (the error is logged)
+        """
+        try:
+            return self._futures[name].result(timeout)
+        except Exception:
+            return None
+
+    def report_when_done(self) -> None:
+        """Log all stage durations once every submitted stage has finished."""
+        with self._lock:
+            self._report = True
+            done = self._pending == 0
+        if done:
+            self._log_summary()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for every background stage to finish."""
+        for name in list(self._futures):
+            self.get(name, timeout)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Release the worker threads once queued stages are done.
+
+        Args:
+            wait: Block until running stages (and their logging) finish
+        """
+        self._pool.shutdown(wait=wait)
+
+    def summary(self) -> str:
+        """Format stage durations, e.g. "mouse 12.1 ms, monitors 40.3 ms"."""
+        stages = list(self.durations.items())  # Stages may finish meanwhile
+        return ", ".join(f"{name} {secs * 1000:.1f} ms" for name, secs in stages)
+
+    def elapsed(self) -> float:
+        """Return milliseconds since startup began."""
+        return (time.perf_counter() - self._started) * 1000
+
+    def _timed(self, name: str, factory: Callable[..., T], args) -> T:
+        """Call factory and record how long it took."""
+        start = time.perf_counter()
+        try:
+            return factory(*args)
+        finally:
+            self.durations[name] = time.perf_counter() - start
+
+    def _finished(self, name: str, future: Future) -> None:
+        """Log a failed stage, and the summary once the last one is done."""
+        if future.exception() is not None:
+            self.logger.error("Startup stage %s failed: %s", name, future.exception())
+        with self._lock:
+            self._pending -= 1
+            done = self._report and self._pending == 0
+        if done:
+            self._log_summary()
+
+    def _log_summary(self) -> None:
+        """Log total startup time and every stage's duration."""
+        self.logger.info("Startup complete in %.1f ms (%s)", self.elapsed(), self.summary())
@@ -1,12 +1,21 @@
-"""Input control layer for mouse and keyboard management."""
+"""Input control layer for mouse and keyboard management.
 
-from mouse_on_numpad.input.audio_feedback import AudioFeedback
-from mouse_on_numpad.input.hotkey_manager import HotkeyManager
-from mouse_on_numpad.input.monitor_manager import MonitorManager
-from mouse_on_numpad.input.mouse_controller import MouseController
-from mouse_on_numpad.input.movement_controller import MovementController
-from mouse_on_numpad.input.position_memory import PositionMemory
-from mouse_on_numpad.input.scroll_controller import ScrollController
+Exports are imported on first access; pynput and Xlib load only with the
+controllers that use them.
+"""
+
+from typing import TYPE_CHECKING
+
+from mouse_on_numpad.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from mouse_on_numpad.input.audio_feedback import AudioFeedback
+    from mouse_on_numpad.input.hotkey_manager import HotkeyManager
+    from mouse_on_numpad.input.monitor_manager import MonitorManager
+    from mouse_on_numpad.input.mouse_controller import MouseController
+    from mouse_on_numpad.input.movement_controller import MovementController
+    from mouse_on_numpad.input.position_memory import PositionMemory
+    from mouse_on_numpad.input.scroll_controller import ScrollController
 
 __all__ = [
     "AudioFeedback",
@@ -17,3 +26,16 @@ __all__ = [
     "PositionMemory",
     "ScrollController",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AudioFeedback": "audio_feedback",
+        "HotkeyManager": "hotkey_manager",
+        "MonitorManager": "monitor_manager",
+        "MouseController": "mouse_controller",
+        "MovementController": "movement_controller",
+        "PositionMemory": "position_memory",
+        "ScrollController": "scroll_controller",
+    },
+)
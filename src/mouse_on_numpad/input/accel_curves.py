@@ -0,0 +1,161 @@
+"""Acceleration curves as functions of elapsed time.
+
+The tick-based curves in MovementController compound the speed once per
+move_delay tick. These closed forms give the same profile as a function of
+elapsed seconds, so speed no longer depends on how often the loop runs.
+Time is measured in nominal ticks (t / period) to keep existing
+acceleration_rate tuning unchanged. The s-curve has no closed form that
+matches its per-tick recurrence, so it is the recurrence itself,
+interpolated between ticks.
+
+These scalar forms are the reference implementation; the hot path samples
+them once into lookup tables (see accel_lut).
+"""
+
+import math
+from collections.abc import Sequence
+from itertools import pairwise
+
+CURVES = ("linear", "exponential", "s-curve", "ease-in-out", "logarithmic", "spline")
+
+# Curve points: (stroke time in ms, speed multiplier)
+CurvePoints = Sequence[tuple[float, float]]
+
+
+def speed_multiplier(
+    curve: str,
+    t: float,
+    rate: float,
+    max_mult: float,
+    period: float,
+    points: CurvePoints = (),
+) -> float:
+    """Return the speed multiplier after t seconds of continuous motion.
+
+    Args:
+        curve: One of CURVES
+        t: Elapsed time since the stroke started (seconds)
+        rate: movement.acceleration_rate
+        max_mult: Multiplier cap (max_speed / base_speed)
+        period: Nominal tick period the rate was tuned for (seconds)
+        points: movement.curve_points for the "spline" curve
+
+    Returns:
+        Multiplier in [1.0, max_mult] (1.0 = base speed)
+    """
+    if max_mult <= 1.0:
+        return max_mult
+    n = max(t, 0.0) / period  # Elapsed nominal ticks
+
+    if curve == "linear":
+        # Linear: constant increment of (rate - 1) per tick
+        mult = 1.0 + (rate - 1.0) * n
+    elif curve == "exponential":
+        # Exponential: multiply by rate per tick (matches Windows AHK)
+        # Compare in log space so long strokes cannot overflow exp()
+        exponent = n * math.log(rate) if rate > 0 else 0.0
+        mult = max_mult if exponent >= math.log(max_mult) else math.exp(exponent)
+    elif curve == "s-curve":
+        mult = _s_curve(n, rate, max_mult)
+    elif curve == "ease-in-out":
+        # Smoothstep over the time linear would need to reach max_mult
+        x = min(n / ramp_ticks(rate, max_mult), 1.0)
+        mult = 1.0 + (max_mult - 1.0) * x * x * (3.0 - 2.0 * x)
+    elif curve == "logarithmic":
+        # Fast start, gentle approach to max_mult over the same ramp time
+        x = min(n / ramp_ticks(rate, max_mult), 1.0)
+        mult = 1.0 + (max_mult - 1.0) * math.log1p((math.e - 1.0) * x)
+    elif curve == "spline":
+        mult = _spline(max(t, 0.0) * 1000.0, points)
+    else:
+        mult = 1.0
+    return min(mult, max_mult)
+
+
+def ramp_ticks(rate: float, max_mult: float) -> float:
+    """Return the nominal ticks the linear curve needs to reach max_mult."""
+    if rate <= 1.0:
+        return math.inf
+    return (max_mult - 1.0) / (rate - 1.0)
+
+
+def s_curve_ticks(rate: float, max_mult: float, limit: int) -> list[float]:
+    """Return the s-curve multiplier after 0, 1, 2, ... ticks.
+
+    Each tick adds rate * (1 - |2s/M - 1|): slow start, fast middle, slow
+    end. The list stops once the curve is within one part per million of
+    max_mult, stops growing, or has limit entries.
+
+    Args:
+        rate: movement.acceleration_rate
+        max_mult: Multiplier cap (max_speed / base_speed)
+        limit: Maximum number of entries
+
+    Returns:
+        Multipliers, starting at 1.0
+    """
+    values = [1.0]
+    s = 1.0
+    while len(values) < limit and s < max_mult * (1.0 - 1e-6):
+        increment = rate * (1.0 - abs(2.0 * s / max_mult - 1.0))
+        if increment <= 0.0:
+            break
+        s = min(s + increment, max_mult)
+        values.append(s)
+    return values
+
+
+def _s_curve(n: float, rate: float, max_mult: float) -> float:
+    """Evaluate the per-tick s-curve recurrence at n ticks (linear in between)."""
+    ticks = s_curve_ticks(rate, max_mult, int(n) + 2)
+    i = int(n)
+    if i + 1 >= len(ticks):
+        return ticks[-1]
+    return ticks[i] + (ticks[i + 1] - ticks[i]) * (n - i)
+
+
+def spline_slopes(points: CurvePoints) -> list[float]:
+    """Return monotone (Fritsch-Carlson) Hermite slopes for curve points.
+
+    Monotone slopes keep the interpolated speed from overshooting between
+    points, so a rising profile never dips or exceeds its next point.
+
+    Args:
+        points: (x, y) pairs sorted by x, at least two
+
+    Returns:
+        Slope at each point
+    """
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    secants = [(ys[i + 1] - ys[i]) / (xs[i + 1] - xs[i]) for i in range(len(xs) - 1)]
+    slopes = [secants[0]]
+    for left, right in pairwise(secants):
+        # Flat at local extrema, harmonic mean of the secants otherwise
+        slopes.append(0.0 if left * right <= 0 else 2.0 / (1.0 / left + 1.0 / right))
+    slopes.append(secants[-1])
+    return slopes
+
+
+def _spline(x: float, points: CurvePoints) -> float:
+    """Evaluate the monotone cubic through points at x (held flat outside)."""
+    if not points:
+        return 1.0
+    if len(points) == 1 or x <= points[0][0]:
+        return points[0][1]
+    if x >= points[-1][0]:
+        return points[-1][1]
+    slopes = spline_slopes(points)
+    i = 0
+    while points[i + 1][0] < x:
+        i += 1
+    (x0, y0), (x1, y1) = points[i], points[i + 1]
+    h = x1 - x0
+    s = (x - x0) / h
+    s2, s3 = s * s, s * s * s
+    return (
+        (2 * s3 - 3 * s2 + 1) * y0
+        + (s3 - 2 * s2 + s) * h * slopes[i]
+        + (-2 * s3 + 3 * s2) * y1
+        + (s3 - s2) * h * slopes[i + 1]
+    )
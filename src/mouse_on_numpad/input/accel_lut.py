@@ -0,0 +1,224 @@
+"""Precomputed acceleration lookup tables.
+
+Each profile's speed-versus-time curve is sampled once (vectorized with
+NumPy when it is installed) into a compact array('f'). The per-tick hot path
+then does one interpolated table read instead of branching on the curve name
+and calling exp/log, so every curve, including user-defined splines, costs
+the same per tick. Tables are cached per settings snapshot.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .accel_curves import (
+    CurvePoints,
+    ramp_ticks,
+    s_curve_ticks,
+    speed_multiplier,
+    spline_slopes,
+)
+
+if TYPE_CHECKING:
+    from ..core.config_params import MovementParams
+
+try:
+    import numpy as np
+except ImportError:  # Optional: tables are sampled in pure Python instead
+    np = None  # type: ignore[assignment]
+
+# Table size limits (samples); 4096 float32 = 16 KiB per table
+MAX_SAMPLES = 4096
+# Finest sampling step (nominal ticks)
+MIN_STEP = 1.0 / 16.0
+# Longest sampled stroke for curves that never saturate (nominal ticks)
+MAX_HORIZON = 3000.0
+# Samples for the legacy pynput MouseController curves
+LEGACY_SAMPLES = 256
+
+
+class AccelTable:
+    """Speed multipliers sampled on a uniform grid, read with interpolation.
+
+    Inputs past the end of the table return the last sample (the curve's
+    plateau).
+    """
+
+    __slots__ = ("_values", "_scale", "_end")
+
+    def __init__(self, values: array[float], step: float) -> None:
+        """Initialize AccelTable.
+
+        Args:
+            values: Samples at x = 0, step, 2*step, ...
+            step: Grid spacing in input units
+        """
+        self._values = values
+        self._scale = 1.0 / step
+        self._end = len(values) - 1
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self._values)
+
+    def __call__(self, x: float) -> float:
+        """Return the interpolated multiplier at x."""
+        pos = x * self._scale
+        if pos >= self._end:
+            return self._values[self._end]
+        if pos <= 0.0:
+            return self._values[0]
+        i = int(pos)
+        low = self._values[i]
+        return low + (self._values[i + 1] - low) * (pos - i)
+
+
+@lru_cache(maxsize=8)
+def movement_table(params: MovementParams) -> AccelTable:
+    """Return the cached table for a movement settings snapshot.
+
+    The table is indexed by elapsed nominal ticks (stroke seconds divided by
+    move_delay), which serves both tick and time physics. The s-curve is a
+    sequential recurrence, so its table holds one sample per tick.
+
+    Args:
+        params: Movement settings snapshot
+
+    Returns:
+        AccelTable of the speed multiplier
+    """
+    if params.curve == "s-curve" and params.max_mult > 1.0:
+        ticks = s_curve_ticks(params.acceleration_rate, params.max_mult, MAX_SAMPLES)
+        return AccelTable(array("f", ticks), 1.0)
+
+    period = params.move_delay if params.move_delay > 0 else 0.001
+    horizon = _horizon(params, period)
+    step = max(horizon / (MAX_SAMPLES - 1), MIN_STEP)
+    count = min(int(math.ceil(horizon / step)) + 1, MAX_SAMPLES)
+
+    if np is not None:
+        if params.max_mult <= 1.0:
+            values = np.full(count, params.max_mult)
+        else:
+            n = np.arange(count, dtype=np.float64) * step
+            values = np.minimum(_curve_np(params, n, period), params.max_mult)
+        return AccelTable(array("f", values.astype(np.float32).tobytes()), step)
+
+    samples = array(
+        "f",
+        (
+            speed_multiplier(
+                params.curve,
+                i * step * period,
+                params.acceleration_rate,
+                params.max_mult,
+                period,
+                params.curve_points,
+            )
+            for i in range(count)
+        ),
+    )
+    return AccelTable(samples, step)
+
+
+@lru_cache(maxsize=8)
+def legacy_table(curve: str, accel_factor: float) -> AccelTable:
+    """Return the cached table for MouseController's continuity curves.
+
+    Indexed by t in [0, 1], where 1 means moves arriving back to back.
+
+    Args:
+        curve: "linear", "exponential", or "s-curve"
+        accel_factor: movement.acceleration
+
+    Returns:
+        AccelTable of the speed multiplier
+    """
+    step = 1.0 / (LEGACY_SAMPLES - 1)
+    gain = accel_factor - 1.0
+    if np is not None:
+        t = np.linspace(0.0, 1.0, LEGACY_SAMPLES)
+        if curve == "exponential":
+            values = 1.0 + gain * t
+        elif curve == "s-curve":
+            values = 1.0 + gain / (1.0 + np.exp(-10.0 * (t - 0.5)))
+        else:
+            values = np.ones_like(t)
+        return AccelTable(array("f", values.astype(np.float32).tobytes()), step)
+
+    samples = array("f", [1.0] * LEGACY_SAMPLES)
+    for i in range(LEGACY_SAMPLES):
+        t = i * step
+        if curve == "exponential":
+            samples[i] = 1.0 + gain * t
+        elif curve == "s-curve":
+            samples[i] = 1.0 + gain / (1.0 + math.exp(-10.0 * (t - 0.5)))
+    return AccelTable(samples, step)
+
+
+def _horizon(params: MovementParams, period: float) -> float:
+    """Return the nominal ticks after which the curve stays at its plateau."""
+    rate = params.acceleration_rate
+    max_mult = params.max_mult
+    curve = params.curve
+    if max_mult <= 1.0:
+        return 1.0
+    if curve in ("linear", "ease-in-out", "logarithmic"):
+        horizon = ramp_ticks(rate, max_mult)
+    elif curve == "exponential":
+        horizon = math.log(max_mult) / math.log(rate) if rate > 1.0 else 1.0
+    elif curve == "spline":
+        points = params.curve_points
+        horizon = points[-1][0] / 1000.0 / period if points else 1.0
+    else:
+        horizon = 1.0
+    return min(max(horizon, 1.0), MAX_HORIZON)
+
+
+def _curve_np(params: MovementParams, n: np.ndarray, period: float) -> np.ndarray:
+    """Vectorized form of accel_curves.speed_multiplier over nominal ticks n."""
+    curve = params.curve
+    rate = params.acceleration_rate
+    max_mult = params.max_mult
+
+    if curve == "linear":
+        return 1.0 + (rate - 1.0) * n
+    if curve == "exponential":
+        if rate <= 0:
+            return np.ones_like(n)
+        return np.exp(np.minimum(n * math.log(rate), math.log(max_mult)))
+    if curve == "ease-in-out":
+        x = np.minimum(n / ramp_ticks(rate, max_mult), 1.0)
+        return 1.0 + (max_mult - 1.0) * x * x * (3.0 - 2.0 * x)
+    if curve == "logarithmic":
+        x = np.minimum(n / ramp_ticks(rate, max_mult), 1.0)
+        return 1.0 + (max_mult - 1.0) * np.log1p((math.e - 1.0) * x)
+    if curve == "spline":
+        return _spline_np(n * period * 1000.0, params.curve_points)
+    return np.ones_like(n)
+
+
+def _spline_np(x: np.ndarray, points: CurvePoints) -> np.ndarray:
+    """Vectorized monotone cubic through points (held flat outside)."""
+    if not points:
+        return np.ones_like(x)
+    if len(points) == 1:
+        return np.full_like(x, points[0][1])
+    px = np.array([p[0] for p in points])
+    py = np.array([p[1] for p in points])
+    slopes = np.array(spline_slopes(points))
+
+    i = np.clip(np.searchsorted(px, x, side="right") - 1, 0, len(px) - 2)
+    h = px[i + 1] - px[i]
+    s = np.clip((x - px[i]) / h, 0.0, 1.0)
+    s2, s3 = s * s, s * s * s
+    values: np.ndarray = (
+        (2 * s3 - 3 * s2 + 1) * py[i]
+        + (s3 - 2 * s2 + s) * h * slopes[i]
+        + (-2 * s3 + 3 * s2) * py[i + 1]
+        + (s3 - s2) * h * slopes[i + 1]
+    )
+    return values
@@ -0,0 +1,220 @@
+"""Single persistent motion thread shared by movement and scroll."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from ..core.error_logger import ErrorLogger
+    from .movement_controller import MovementController
+    from .scroll_controller import ScrollController
+
+# Max time to wait for the motion thread on shutdown (seconds)
+STOP_TIMEOUT = 1.0
+
+
+class FrameMouseProtocol(Protocol):
+    """Mouse controller used by the engine (UInput or ydotool).
+
+    Mice with hi_res_wheel = True also provide scroll_hi_res(dx, dy).
+    """
+
+    def move(self, dx: int, dy: int) -> None:
+        """Move mouse by relative delta."""
+        ...
+
+    def scroll(self, dx: int, dy: int) -> None:
+        """Scroll by relative delta (dy>0=up, dx>0=right)."""
+        ...
+
+
+class MotionEngine:
+    """Drive movement and scroll ticks from one long-lived thread.
+
+    The thread is created on first use and then sleeps on an event while idle,
+    so starting a stroke wakes it immediately instead of paying thread creation
+    latency. Each controller keeps its own deadline grid; the engine sleeps
+    until the earliest one. When pointer motion and wheel motion fall due in
+    the same tick they are emitted in a single frame (one SYN_REPORT) if the
+    mouse supports emit_frame().
+
+    Under the asyncio runtime the engine is bound to the event loop instead:
+    ticks run as loop.call_at() callbacks on the loop thread (asyncio's clock
+    is time.monotonic(), so deadlines carry over unchanged) and no motion
+    thread is created.
+
+    A tick that raises (a failed mouse write, a controller bug) is logged and
+    both controllers are stopped; the engine itself keeps running, so the
+    next key press starts motion again.
+    """
+
+    def __init__(self, mouse: FrameMouseProtocol, logger: ErrorLogger | None = None) -> None:
+        """Initialize MotionEngine.
+
+        Args:
+            mouse: Mouse controller receiving the combined motion
+            logger: Logger for failed ticks (module logger if None)
+        """
+        self._mouse = mouse
+        self.logger = logger or logging.getLogger(__name__)
+        self.movement: MovementController | None = None
+        self.scroll: ScrollController | None = None
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def thread(self) -> threading.Thread | None:
+        """Return the motion thread (None until first wake)."""
+        return self._thread
+
+    def attach_movement(self, controller: MovementController) -> None:
+        """Register the movement controller driven by this engine."""
+        self.movement = controller
+
+    def attach_scroll(self, controller: ScrollController) -> None:
+        """Register the scroll controller driven by this engine."""
+        self.scroll = controller
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Drive ticks from an event loop instead of the motion thread.
+
+        Must be called on the loop's thread. Pass None to unbind.
+
+        Args:
+            loop: Running event loop, or None to return to the thread
+        """
+        self._cancel_timer()
+        self._loop = loop
+        self._loop_thread = threading.get_ident() if loop is not None else None
+
+    def wake(self) -> None:
+        """Wake the motion thread (starting it on first use)."""
+        loop = self._loop
+        if loop is not None:
+            if threading.get_ident() == self._loop_thread:
+                loop.call_soon(self._loop_tick)
+            else:
+                loop.call_soon_threadsafe(self._loop_tick)
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._running = True
+                self._thread = threading.Thread(
+                    target=self._run, name="motion-engine", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Stop the motion thread."""
+        if self._loop is not None:
+            if threading.get_ident() == self._loop_thread:
+                self._cancel_timer()
+            else:
+                self._loop.call_soon_threadsafe(self._cancel_timer)
+        with self._lock:
+            self._running = False
+            thread = self._thread
+            self._thread = None
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=STOP_TIMEOUT)
+
+    def tick(self, now: float) -> float | None:
+        """Run all due controller ticks and emit the resulting frame.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            Monotonic time of the next deadline, or None if all controllers idle
+        """
+        dx = dy = wheel = hwheel = 0
+        hi_res = False
+        next_deadline: float | None = None
+
+        movement = self.movement
+        if movement is not None:
+            dx, dy = movement._step(now)
+            deadline = movement._next_deadline()
+            if deadline is not None:
+                next_deadline = deadline
+
+        scroll = self.scroll
+        if scroll is not None:
+            hwheel, wheel = scroll._step(now)
+            hi_res = scroll.hi_res
+            deadline = scroll._next_deadline()
+            if deadline is not None and (next_deadline is None or deadline < next_deadline):
+                next_deadline = deadline
+
+        moved = dx != 0 or dy != 0
+        scrolled = wheel != 0 or hwheel != 0
+        if moved and scrolled and hasattr(self._mouse, "emit_frame"):
+            if hi_res:
+                self._mouse.emit_frame(dx, dy, wheel_hi_res=wheel, hwheel_hi_res=hwheel)
+            else:
+                self._mouse.emit_frame(dx, dy, wheel, hwheel)
+        else:
+            if moved:
+                self._mouse.move(dx, dy)
+            if scrolled:
+                if hi_res:
+                    self._mouse.scroll_hi_res(hwheel, wheel)
+                else:
+                    self._mouse.scroll(hwheel, wheel)
+        return next_deadline
+
+    def _loop_tick(self) -> None:
+        """Run one tick and schedule the next (runs on the event loop)."""
+        self._cancel_timer()  # Coalesce with a pending deadline
+        loop = self._loop
+        if loop is None:
+            return
+        next_deadline = self._safe_tick()
+        if next_deadline is not None:
+            self._timer = loop.call_at(next_deadline, self._loop_tick)
+
+    def _safe_tick(self) -> float | None:
+        """Run one tick; on error log it and bring both controllers to rest.
+
+        Returns:
+            Next deadline, or None if idle (always None after an error)
+        """
+        try:
+            return self.tick(time.monotonic())
+        except Exception as e:
+            self.logger.exception("Motion tick failed: %s", e)
+            # Controllers at rest: the next key press wakes the engine again
+            for controller in (self.movement, self.scroll):
+                if controller is not None:
+                    controller.stop_all()
+            return None
+
+    def _cancel_timer(self) -> None:
+        """Cancel the pending loop deadline, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _run(self) -> None:
+        """Motion loop (runs in the engine thread)."""
+        while self._running:
+            # Clear before ticking: a wake() after this point keeps the event set
+            self._wake.clear()
+            next_deadline = self._safe_tick()
+            if next_deadline is None:
+                self._wake.wait()
+                continue
+            timeout = next_deadline - time.monotonic()
+            if timeout > 0:
+                self._wake.wait(timeout)
@@ -1,6 +1,5 @@
 """Mouse control with acceleration curves and multi-monitor support."""
 
-import math
 import time
 from typing import Literal
 
@@ -8,6 +7,7 @@ from pynput.mouse import Button, Controller
 
 from mouse_on_numpad.core.config import ConfigManager
 from mouse_on_numpad.core.state_manager import StateManager
+from mouse_on_numpad.input.accel_lut import legacy_table
 
 AccelerationCurve = Literal["linear", "exponential", "s-curve"]
 
@@ -92,23 +92,9 @@ class MouseController:
         if time_delta > 0.5:
             return 1.0
 
-        if curve == "linear":
-            return 1.0  # No acceleration
-
-        elif curve == "exponential":
-            # Exponential growth based on continuous movement
-            # time_delta small = high multiplier
-            t = max(0.0, 0.5 - time_delta) * 2  # Normalize to 0-1
-            return 1.0 + (accel_factor - 1.0) * t
-
-        elif curve == "s-curve":
-            # Smooth S-curve: slow start, fast middle, slow end
-            # Using sigmoid function
-            t = max(0.0, 0.5 - time_delta) * 2
-            sigmoid = 1 / (1 + math.exp(-10 * (t - 0.5)))
-            return 1.0 + (accel_factor - 1.0) * sigmoid
-
-        return 1.0
+        # Sampled once per (curve, factor); linear stays flat (no acceleration)
+        t = max(0.0, 0.5 - time_delta) * 2  # Normalize to 0-1
+        return legacy_table(curve, accel_factor)(t)
 
     def click(self, button: str = "left") -> None:
         """Perform mouse click.
@@ -4,6 +4,13 @@ import threading
 import time
 from typing import Protocol
 
+from ..core.config_params import MovementParams
+from .accel_lut import AccelTable, movement_table
+from .motion_engine import MotionEngine
+from .subpixel import SubpixelAccumulator
+from .tick_scheduler import MAX_CATCH_UP_TICKS, TickScheduler, TickStats
+from .undo_history import StrokeHistory
+
 
 class MouseProtocol(Protocol):
     """Protocol for mouse controllers (UInput or ydotool)."""
@@ -23,21 +30,58 @@ class MovementController:
     - Configurable base speed, acceleration rate, max speed
     """
 
-    def __init__(self, config, mouse: MouseProtocol) -> None:
+    def __init__(
+        self, config, mouse: MouseProtocol, engine: MotionEngine | None = None
+    ) -> None:
         """Initialize MovementController.
 
         Args:
             config: ConfigManager instance for reading movement settings
             mouse: Mouse controller (UinputMouse or YdotoolMouse)
+            engine: Shared motion engine (a private one is created if omitted)
         """
         self._config = config
         self._mouse = mouse
         self._current_speed = 1.0
-        self._move_thread: threading.Thread | None = None
+        self._engine = engine or MotionEngine(mouse)
+        self._engine.attach_movement(self)
         self._active_dirs: set[str] = set()  # {"up", "left"} = diagonal up-left
         self._running = False
         self._lock = threading.Lock()
-        self._move_history: list[tuple[int, int]] = []  # Undo history of (dx, dy)
+        self._params_version = config.version
+        self._params: MovementParams = config.movement_params
+        self._history = StrokeHistory(self._params.undo_levels)  # Undo/redo of strokes
+        self._accel: AccelTable = movement_table(self._params)
+        self._scheduler = TickScheduler(self._params.tick_period)
+        self._stroke_ticks = 0  # Accelerated ticks in the current stroke (tick physics)
+        self._stroke_start = 0.0  # Monotonic time the current stroke began
+        self._last_tick = 0.0  # Monotonic time of the last integrated tick
+        self._subpixel = SubpixelAccumulator()  # Fractional pixels carried between ticks
+
+    @property
+    def tick_stats(self) -> TickStats:
+        """Return tick period, jitter and missed-deadline statistics."""
+        return self._scheduler.stats
+
+    def _current_params(self) -> MovementParams:
+        """Return the movement snapshot, replacing it only after config changes."""
+        version = self._config.version
+        if version != self._params_version:
+            self._params_version = version
+            self._params = self._config.movement_params
+            self._accel = movement_table(self._params)
+        return self._params
+
+    def reload_params(self) -> None:
+        """Rebuild the settings snapshot (called by the config watcher thread).
+
+        Keeps snapshot and lookup table construction off the movement thread
+        after file reloads.
+        """
+        params = self._config.movement_params
+        self._accel = movement_table(params)
+        self._params = params
+        self._params_version = self._config.version
 
     def start_direction(self, direction: str) -> None:
         """Start moving in a direction (or add to multi-key diagonal).
@@ -46,6 +90,12 @@ class MovementController:
             direction: "up", "down", "left", or "right"
         """
         with self._lock:
+            if not self._active_dirs:
+                # Stroke starts from rest: restart the acceleration clock
+                self._stroke_start = self._last_tick = time.monotonic()
+                self._stroke_ticks = 0
+                self._subpixel.reset()
+                self._history.begin(self._stroke_start)
             self._active_dirs.add(direction)
             self._ensure_moving()
 
@@ -59,58 +109,134 @@ class MovementController:
             self._active_dirs.discard(direction)
             if not self._active_dirs:
                 self._current_speed = 1.0  # Reset acceleration on full stop
+                self._stroke_ticks = 0
+                self._history.end(time.monotonic())
 
     def stop_all(self) -> None:
         """Stop all movement immediately."""
         with self._lock:
             self._active_dirs.clear()
             self._current_speed = 1.0
+            self._stroke_ticks = 0
             self._running = False
+            self._history.end(time.monotonic())
 
     def _ensure_moving(self) -> None:
-        """Start movement thread if not already running."""
-        if self._move_thread is None or not self._move_thread.is_alive():
+        """Wake the motion engine if movement is starting from rest."""
+        if not self._running:
             self._running = True
-            self._move_thread = threading.Thread(target=self._movement_loop, daemon=True)
-            self._move_thread.start()
-
-    def _movement_loop(self) -> None:
-        """Continuous movement loop (runs in separate thread)."""
-        reload_counter = 0
-        while self._running:
-            # Reload config every ~1s to pick up GUI changes
-            reload_counter += 1
-            if reload_counter >= 50:
-                self._config.reload()
-                reload_counter = 0
-
-            with self._lock:
-                if not self._active_dirs:
-                    self._running = False
-                    break
-
-                dx, dy = self._calc_delta()
-
-            # Move mouse (outside lock to avoid blocking input)
+            self._scheduler.reset()  # First tick due immediately
+            self._engine.wake()
+
+    def _next_deadline(self) -> float | None:
+        """Return the next tick deadline, or None when idle."""
+        return self._scheduler.next_deadline if self._running else None
+
+    def _step(self, now: float) -> tuple[int, int]:
+        """Advance due movement ticks (called from the motion engine thread).
+
+        Dispatches to time-based physics when movement.physics is "time".
+
+        Paced by absolute deadlines so work done per tick does not stretch the
+        period. Ticks missed under load are caught up by scaling the delta.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            (dx, dy) to emit this tick ((0, 0) if nothing is due)
+        """
+        if not self._running:
+            return 0, 0
+        ticks = self._scheduler.poll(now)
+        if not ticks:
+            return 0, 0
+        if self._current_params().physics == "time":
+            return self._step_timed(now)
+
+        with self._lock:
+            if not self._active_dirs:
+                self._running = False
+                return 0, 0
+
+            dx, dy = self._calc_delta()
+            # Accelerate once per elapsed tick
+            for _ in range(ticks):
+                self._accelerate()
+
+            dx, dy = self._subpixel.add(dx * ticks, dy * ticks)
+            if dx != 0 or dy != 0:
+                self._record_move(dx, dy, now)
+
+        # Pick up move_delay changes for the next deadline
+        self._scheduler.set_period(self._current_params().tick_period)
+        return dx, dy
+
+    def _step_timed(self, now: float) -> tuple[int, int]:
+        """Integrate velocity (px/s) over the real time since the last tick.
+
+        The curve is evaluated over elapsed stroke time, and displacement is the
+        trapezoidal integral of velocity over dt, so speed and acceleration do
+        not depend on tick_rate, move_delay or lost ticks.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            (dx, dy) to emit this tick
+        """
+        params = self._current_params()
+        with self._lock:
+            if not self._active_dirs:
+                self._running = False
+                return 0, 0
+
+            # Bound catch-up after long stalls, like the tick scheduler does
+            max_dt = params.tick_period * (1 + MAX_CATCH_UP_TICKS)
+            dt = min(now - self._last_tick, max_dt)
+            t1 = now - self._stroke_start
+            t0 = max(t1 - dt, 0.0)
+            self._last_tick = now
+
+            mult0 = self._multiplier_at(t0, params)
+            mult1 = self._multiplier_at(t1, params)
+            self._current_speed = mult1
+
+            # Base velocity in px/s keeps profiles tuned in px per move_delay
+            velocity = params.base_speed / params.move_delay
+            distance = velocity * (mult0 + mult1) * 0.5 * dt
+            ux, uy = self._direction_vector()
+            dx, dy = self._subpixel.add(ux * distance, uy * distance)
             if dx != 0 or dy != 0:
-                self._mouse.move(dx, dy)
-                self._record_move(dx, dy)
+                self._record_move(dx, dy, now)
+
+        self._scheduler.set_period(params.tick_period)
+        return dx, dy
 
-            # Accelerate for next iteration
-            self._accelerate()
+    def _multiplier_at(self, t: float, params: MovementParams) -> float:
+        """Return the acceleration curve multiplier t seconds into a stroke."""
+        return self._accel(t / params.move_delay)
 
-            # Sleep to control movement speed
-            move_delay = self._config.get("movement.move_delay", 10) / 1000.0
-            time.sleep(move_delay)
+    def _direction_vector(self) -> tuple[int, int]:
+        """Return the (x, y) unit signs of the active directions."""
+        ux = uy = 0
+        if "left" in self._active_dirs:
+            ux -= 1
+        if "right" in self._active_dirs:
+            ux += 1
+        if "up" in self._active_dirs:
+            uy -= 1
+        if "down" in self._active_dirs:
+            uy += 1
+        return ux, uy
 
-    def _calc_delta(self) -> tuple[int, int]:
+    def _calc_delta(self) -> tuple[float, float]:
         """Calculate movement delta based on active directions and speed.
 
         Returns:
-            (dx, dy) tuple for relative mouse movement
+            (dx, dy) per-tick delta in (fractional) pixels
         """
-        base = self._config.get("movement.base_speed", 10)
-        speed = int(base * self._current_speed)
+        speed = self._current_params().base_speed * self._current_speed
 
         dx = dy = 0
         if "left" in self._active_dirs:
@@ -125,42 +251,54 @@ class MovementController:
         return dx, dy
 
     def _accelerate(self) -> None:
-        """Apply acceleration curve to current speed."""
-        curve = self._config.get("movement.curve", "exponential")
-        rate = self._config.get("movement.acceleration_rate", 1.02)
-        base = self._config.get("movement.base_speed", 10)
-        max_speed = self._config.get("movement.max_speed", 100)
-        max_mult = max_speed / base
-
-        if curve == "linear":
-            # Linear: constant increment each step
-            self._current_speed = min(self._current_speed + (rate - 1), max_mult)
-        elif curve == "exponential":
-            # Exponential: multiply by rate (matches Windows AHK)
-            self._current_speed = min(self._current_speed * rate, max_mult)
-        elif curve == "s-curve":
-            # S-curve: slow start, fast middle, slow end
-            t = self._current_speed / max_mult
-            increment = rate * (1 - abs(2 * t - 1))
-            self._current_speed = min(self._current_speed + increment, max_mult)
-
-    def _record_move(self, dx: int, dy: int) -> None:
-        """Record a move for undo history."""
-        max_levels = self._config.get("undo.max_levels", 10)
-        self._move_history.append((dx, dy))
-        # Trim history to max levels
-        if len(self._move_history) > max_levels:
-            self._move_history = self._move_history[-max_levels:]
+        """Advance the acceleration curve by one tick (table lookup)."""
+        self._current_params()  # Refresh the table after config changes
+        self._stroke_ticks += 1
+        self._current_speed = self._accel(self._stroke_ticks)
+
+    def _record_move(self, dx: int, dy: int, now: float | None = None) -> None:
+        """Fold an emitted move into the current stroke's undo record.
+
+        Called with self._lock held.
+
+        Args:
+            dx: Emitted horizontal pixels
+            dy: Emitted vertical pixels
+            now: Monotonic time of the tick (defaults to the current time)
+        """
+        self._sync_history_capacity()
+        self._history.add(dx, dy, time.monotonic() if now is None else now)
+
+    def _sync_history_capacity(self) -> None:
+        """Resize the undo ring after undo.max_levels changes."""
+        levels = self._current_params().undo_levels
+        if self._history.capacity != levels:
+            self._history.set_capacity(levels)
 
     def undo(self) -> bool:
-        """Undo last movement by reversing the delta.
+        """Undo the last stroke by moving back its whole displacement.
 
         Returns:
             True if undo performed, False if history empty.
         """
-        if not self._move_history:
+        with self._lock:
+            self._sync_history_capacity()
+            record = self._history.undo()
+        if record is None:
             return False
-        dx, dy = self._move_history.pop()
         # Move in opposite direction
-        self._mouse.move(-dx, -dy)
+        self._mouse.move(-record.dx, -record.dy)
+        return True
+
+    def redo(self) -> bool:
+        """Replay the last undone stroke.
+
+        Returns:
+            True if redo performed, False if nothing to redo.
+        """
+        with self._lock:
+            record = self._history.redo()
+        if record is None:
+            return False
+        self._mouse.move(record.dx, record.dy)
         return True
@@ -1,9 +1,17 @@
 """Continuous scroll with acceleration support."""
 
+import math
 import threading
 import time
 from typing import Protocol
 
+from ..core.config_params import ScrollParams
+from .motion_engine import MotionEngine
+from .scroll_momentum import MomentumPhase
+from .subpixel import SubpixelAccumulator
+from .tick_scheduler import TickScheduler, TickStats
+from .uinput_frame import WHEEL_HI_RES_UNITS
+
 
 class ScrollableProtocol(Protocol):
     """Protocol for scrollable controllers."""
@@ -20,22 +28,67 @@ class ScrollController:
     - Vertical scroll (Numpad 7=up, 1=down)
     - Horizontal scroll (Numpad 9=left, 3=right)
     - Exponential acceleration matching movement controller
+    - Smooth 1/120-notch scrolling on mice with hi-res wheel support
+    - Optional momentum: scrolling coasts to a stop after key release
     """
 
-    def __init__(self, config, mouse: ScrollableProtocol) -> None:
+    def __init__(
+        self, config, mouse: ScrollableProtocol, engine: MotionEngine | None = None
+    ) -> None:
         """Initialize ScrollController.
 
         Args:
             config: ConfigManager instance for reading scroll settings
             mouse: Mouse controller with scroll method
+            engine: Shared motion engine (a private one is created if omitted)
         """
         self._config = config
         self._mouse = mouse
         self._current_speed = 1.0
-        self._scroll_thread: threading.Thread | None = None
+        self._engine = engine or MotionEngine(mouse)
+        self._engine.attach_scroll(self)
         self._active_dirs: set[str] = set()  # {"up"}, {"down"}, {"left"}, {"right"}
         self._running = False
         self._lock = threading.Lock()
+        self._params_version = config.version
+        self._params: ScrollParams = config.scroll_params
+        # Only UinputMouse advertises hi-res axes (a plain attribute, not a mock)
+        self._hi_res_capable = getattr(mouse, "hi_res_wheel", False) is True
+        self._hi_res = False  # Unit of the last _step() result
+        self._remainder = SubpixelAccumulator()  # Fractional hi-res units
+        self._momentum: MomentumPhase | None = None  # Coasting after release
+        self._scheduler = TickScheduler(self._tick_period(self._params))
+
+    @property
+    def tick_stats(self) -> TickStats:
+        """Return tick period, jitter and missed-deadline statistics."""
+        return self._scheduler.stats
+
+    @property
+    def hi_res(self) -> bool:
+        """Return True if the last _step() result is in 1/120-notch units."""
+        return self._hi_res
+
+    def _uses_hi_res(self, params: ScrollParams) -> bool:
+        """Return True if hi-res scrolling is configured and supported."""
+        return self._hi_res_capable and params.hi_res
+
+    def _tick_period(self, params: ScrollParams) -> float:
+        """Return the tick period for the active scroll mode."""
+        return params.hi_res_period if self._uses_hi_res(params) else params.delay
+
+    def _current_params(self) -> ScrollParams:
+        """Return the scroll snapshot, replacing it only after config changes."""
+        version = self._config.version
+        if version != self._params_version:
+            self._params_version = version
+            self._params = self._config.scroll_params
+        return self._params
+
+    def reload_params(self) -> None:
+        """Rebuild the settings snapshot (called by the config watcher thread)."""
+        self._params_version = self._config.version
+        self._params = self._config.scroll_params
 
     def start_direction(self, direction: str) -> None:
         """Start scrolling in a direction.
@@ -44,6 +97,9 @@ class ScrollController:
             direction: "up", "down", "left", or "right"
         """
         with self._lock:
+            self.cancel_momentum()
+            if not self._active_dirs:
+                self._remainder.reset()
             self._active_dirs.add(direction)
             self._ensure_scrolling()
 
@@ -54,44 +110,160 @@ class ScrollController:
             direction: "up", "down", "left", or "right"
         """
         with self._lock:
+            ux, uy = self._direction_vector()
             self._active_dirs.discard(direction)
             if not self._active_dirs:
+                if self._running:
+                    self._start_momentum(ux, uy)
                 self._current_speed = 1.0  # Reset acceleration on full stop
 
     def stop_all(self) -> None:
         """Stop all scrolling immediately."""
         with self._lock:
+            self.cancel_momentum()
             self._active_dirs.clear()
             self._current_speed = 1.0
             self._running = False
 
+    def cancel_momentum(self) -> None:
+        """End a momentum phase immediately (any key press).
+
+        Lock-free: the motion thread sees the flag on its next tick.
+        """
+        momentum = self._momentum
+        if momentum is not None:
+            momentum.cancel()
+            self._momentum = None
+
+    def _start_momentum(self, ux: int, uy: int) -> None:
+        """Hand the release velocity to a momentum phase (called with the lock).
+
+        Args:
+            ux: Horizontal sign of the released direction(s)
+            uy: Vertical sign of the released direction(s)
+        """
+        params = self._current_params()
+        if not params.momentum or params.delay <= 0:
+            return
+        speed = params.step * self._current_speed / params.delay  # Notches/s
+        if speed * math.hypot(ux, uy) < params.momentum_min_speed:
+            return
+        self._momentum = MomentumPhase(ux * speed, uy * speed, time.monotonic())
+
     def _ensure_scrolling(self) -> None:
-        """Start scroll thread if not already running."""
-        if self._scroll_thread is None or not self._scroll_thread.is_alive():
+        """Wake the motion engine if scrolling is starting from rest."""
+        if not self._running:
             self._running = True
-            self._scroll_thread = threading.Thread(target=self._scroll_loop, daemon=True)
-            self._scroll_thread.start()
+            self._scheduler.reset()  # First tick due immediately
+            self._engine.wake()
+
+    def _next_deadline(self) -> float | None:
+        """Return the next tick deadline, or None when idle."""
+        return self._scheduler.next_deadline if self._running else None
+
+    def _step(self, now: float) -> tuple[int, int]:
+        """Advance due scroll ticks (called from the motion engine thread).
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            (dx, dy) scroll to emit this tick ((0, 0) if nothing is due), in
+            notches, or in 1/120 notches when hi_res is True
+        """
+        if not self._running:
+            return 0, 0
+        ticks = self._scheduler.poll(now)
+        if not ticks:
+            return 0, 0
+
+        params = self._current_params()
+        hi_res = self._uses_hi_res(params)
+        momentum = self._momentum
+        if momentum is not None and not self._active_dirs:
+            return self._step_momentum(momentum, now, params, hi_res)
 
-    def _scroll_loop(self) -> None:
-        """Continuous scroll loop (runs in separate thread)."""
-        while self._running:
+        with self._lock:
+            if not self._active_dirs:
+                self._running = False
+                return 0, 0
+
+            if hi_res:
+                dx, dy = self._step_hi_res(params, ticks)
+            else:
+                dx, dy = self._calc_delta()
+                # Accelerate once per elapsed tick
+                for _ in range(ticks):
+                    self._accelerate()
+                dx *= ticks
+                dy *= ticks
+
+        self._hi_res = hi_res
+        # Pick up delay changes for the next deadline
+        self._scheduler.set_period(self._tick_period(params))
+        return dx, dy
+
+    def _step_momentum(
+        self, momentum: MomentumPhase, now: float, params: ScrollParams, hi_res: bool
+    ) -> tuple[int, int]:
+        """Coast under friction after release (no lock held while coasting).
+
+        Args:
+            momentum: Phase captured at release
+            now: Current monotonic time
+            params: Scroll settings snapshot
+            hi_res: Emit 1/120-notch units instead of notches
+
+        Returns:
+            (dx, dy) scroll to emit this tick
+        """
+        travel = momentum.advance(now, params.friction, params.momentum_min_speed)
+        if travel is None:
             with self._lock:
-                if not self._active_dirs:
+                if self._momentum is momentum:
+                    self._momentum = None
+                if not self._active_dirs and self._momentum is None:
                     self._running = False
-                    break
+            return 0, 0
 
-                dx, dy = self._calc_delta()
+        scale = WHEEL_HI_RES_UNITS if hi_res else 1
+        dx, dy = self._remainder.add(travel[0] * scale, travel[1] * scale)
+        self._hi_res = hi_res
+        self._scheduler.set_period(self._tick_period(params))
+        return dx, dy
+
+    def _step_hi_res(self, params: ScrollParams, ticks: int) -> tuple[int, int]:
+        """Scroll by a fraction of a notch tick in 1/120-notch units.
 
-            # Scroll mouse (outside lock to avoid blocking input)
-            if dx != 0 or dy != 0:
-                self._mouse.scroll(dx, dy)
+        Speed and acceleration stay defined per `delay` tick; each shorter
+        hi-res tick covers hi_res_period / delay of that. Called with the lock.
 
-            # Accelerate for next iteration
-            self._accelerate()
+        Args:
+            params: Scroll settings snapshot
+            ticks: Elapsed hi-res ticks
 
-            # Sleep to control scroll speed
-            delay = self._config.get("scroll.delay", 30) / 1000.0
-            time.sleep(delay)
+        Returns:
+            (dx, dy) in 1/120 notches
+        """
+        fraction = params.hi_res_period / params.delay * ticks
+        amount = params.step * self._current_speed * WHEEL_HI_RES_UNITS * fraction
+        ux, uy = self._direction_vector()
+        growth = params.acceleration_rate**fraction
+        self._current_speed = min(self._current_speed * growth, params.max_mult)
+        return self._remainder.add(ux * amount, uy * amount)
+
+    def _direction_vector(self) -> tuple[int, int]:
+        """Return the (x, y) signs of the active directions (dy>0=up)."""
+        ux = uy = 0
+        if "up" in self._active_dirs:
+            uy += 1
+        if "down" in self._active_dirs:
+            uy -= 1
+        if "left" in self._active_dirs:
+            ux -= 1
+        if "right" in self._active_dirs:
+            ux += 1
+        return ux, uy
 
     def _calc_delta(self) -> tuple[int, int]:
         """Calculate scroll delta based on active directions and speed.
@@ -103,8 +275,7 @@ class ScrollController:
             Opposite directions cancel out (e.g., up+down = 0).
             This is intentional for consistent behavior.
         """
-        step = self._config.get("scroll.step", 3)
-        speed = int(step * self._current_speed)
+        speed = int(self._current_params().step * self._current_speed)
 
         dx = dy = 0
         if "up" in self._active_dirs:
@@ -120,10 +291,5 @@ class ScrollController:
 
     def _accelerate(self) -> None:
         """Apply exponential acceleration to scroll speed."""
-        rate = self._config.get("scroll.acceleration_rate", 1.1)
-        step = self._config.get("scroll.step", 3)
-        max_speed = self._config.get("scroll.max_speed", 10)
-        # Guard against division by zero or invalid config
-        max_mult = max(max_speed / step, 1.0) if step > 0 else 1.0
-
-        self._current_speed = min(self._current_speed * rate, max_mult)
+        params = self._current_params()
+        self._current_speed = min(self._current_speed * params.acceleration_rate, params.max_mult)
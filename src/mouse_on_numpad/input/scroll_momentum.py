@@ -0,0 +1,71 @@
+"""Kinetic scroll phase: velocity decaying under friction after key release."""
+
+import math
+
+
+class MomentumPhase:
+    """Exponentially decaying scroll velocity.
+
+    Velocity follows dv/dt = -friction * v, integrated exactly over each
+    (possibly uneven) interval. Once handed to the motion thread only that
+    thread advances it; other threads just call cancel(), so no lock is held
+    while coasting.
+    """
+
+    __slots__ = ("vx", "vy", "last", "cancelled")
+
+    def __init__(self, vx: float, vy: float, now: float) -> None:
+        """Initialize MomentumPhase.
+
+        Args:
+            vx: Horizontal velocity at release (notches/s, >0 = right)
+            vy: Vertical velocity at release (notches/s, >0 = up)
+            now: Monotonic release time
+        """
+        self.vx = vx
+        self.vy = vy
+        self.last = now
+        self.cancelled = False
+
+    @property
+    def speed(self) -> float:
+        """Return the current speed (notches/s)."""
+        return math.hypot(self.vx, self.vy)
+
+    def cancel(self) -> None:
+        """Stop the phase; the next advance() returns None."""
+        self.cancelled = True
+
+    def advance(
+        self, now: float, friction: float, min_speed: float
+    ) -> tuple[float, float] | None:
+        """Integrate the decaying velocity up to now.
+
+        Args:
+            now: Current monotonic time
+            friction: Decay rate (1/s); 0 keeps a constant velocity
+            min_speed: Speed (notches/s) below which the phase ends
+
+        Returns:
+            (dx, dy) fractional notches travelled since the last call, or
+            None once the phase is cancelled or has come to rest
+        """
+        if self.cancelled:
+            return None
+        dt = now - self.last
+        if dt <= 0:
+            return 0.0, 0.0
+        self.last = now
+        if friction > 0:
+            decay = math.exp(-friction * dt)
+            travel = (1.0 - decay) / friction  # Integral of decay over dt
+        else:
+            decay = 1.0
+            travel = dt
+        dx = self.vx * travel
+        dy = self.vy * travel
+        self.vx *= decay
+        self.vy *= decay
+        if self.speed < min_speed:
+            self.cancelled = True  # Emit this last stretch, then stop
+        return dx, dy
@@ -0,0 +1,47 @@
+"""Per-axis fractional remainder for relative pointer motion.
+
+uinput only accepts whole pixels. Truncating each tick's delta discards the
+fraction, so slow speeds stall and high tick rates move in coarse steps. The
+accumulator carries the fraction into the next tick instead: after any number
+of ticks, emitted + remainder equals the exact sum of the requested deltas.
+"""
+
+import math
+
+
+class SubpixelAccumulator:
+    """Turn fractional (dx, dy) deltas into whole-pixel steps without loss."""
+
+    def __init__(self) -> None:
+        """Initialize SubpixelAccumulator with zero remainder."""
+        self._rx = 0.0
+        self._ry = 0.0
+
+    @property
+    def remainder(self) -> tuple[float, float]:
+        """Return the carried (x, y) fraction, each in (-1, 1)."""
+        return self._rx, self._ry
+
+    def add(self, dx: float, dy: float) -> tuple[int, int]:
+        """Accumulate a fractional delta and return the whole pixels to emit.
+
+        Args:
+            dx: Requested horizontal delta in pixels (may be fractional)
+            dy: Requested vertical delta in pixels (may be fractional)
+
+        Returns:
+            (dx, dy) whole-pixel delta; the fraction is kept for the next call
+        """
+        x = self._rx + dx
+        y = self._ry + dy
+        # Truncate toward zero so the remainder keeps the sign of the motion
+        ix = math.trunc(x)
+        iy = math.trunc(y)
+        self._rx = x - ix
+        self._ry = y - iy
+        return ix, iy
+
+    def reset(self) -> None:
+        """Drop any carried fraction (start of a new stroke)."""
+        self._rx = 0.0
+        self._ry = 0.0
@@ -0,0 +1,141 @@
+"""Drift-free fixed-rate tick scheduling on the monotonic clock."""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+# Missed ticks beyond this are dropped instead of replayed (avoids cursor jumps)
+MAX_CATCH_UP_TICKS = 5
+
+
+@dataclass
+class TickStats:
+    """Timing statistics collected by a TickScheduler.
+
+    Jitter is the lateness of a tick relative to its deadline (seconds).
+    """
+
+    period: float = 0.0  # Nominal tick period (seconds)
+    ticks: int = 0  # Ticks delivered, including caught-up ticks
+    missed: int = 0  # Deadlines that had already passed when polled
+    dropped: int = 0  # Missed ticks discarded beyond the catch-up limit
+    jitter_mean: float = 0.0
+    jitter_max: float = 0.0
+
+
+class TickScheduler:
+    """Fixed-rate scheduler that paces loops by absolute deadlines.
+
+    Deadlines advance on a fixed grid (start + n * period), so the time spent
+    doing work between ticks does not stretch the period. When a tick runs
+    late, the missed deadlines are reported as extra ticks (up to
+    max_catch_up) so callers can keep velocity constant in units per second.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        max_catch_up: int = MAX_CATCH_UP_TICKS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize TickScheduler.
+
+        Args:
+            period: Tick period in seconds
+            max_catch_up: Max missed ticks replayed after an overrun
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._period = max(period, 1e-6)
+        self._max_catch_up = max_catch_up
+        self._clock = clock
+        self._deadline = clock()
+        self._jitter_total = 0.0
+        self._polls = 0
+        self._stats = TickStats(period=self._period)
+
+    @property
+    def period(self) -> float:
+        """Return the tick period in seconds."""
+        return self._period
+
+    @property
+    def next_deadline(self) -> float:
+        """Return the monotonic time of the next tick."""
+        return self._deadline
+
+    @property
+    def stats(self) -> TickStats:
+        """Return a copy of the timing statistics."""
+        return replace(self._stats)
+
+    def set_period(self, period: float) -> None:
+        """Change the tick period, keeping the next deadline anchored.
+
+        Args:
+            period: New tick period in seconds
+        """
+        period = max(period, 1e-6)
+        if period != self._period:
+            self._period = period
+            self._stats.period = period
+
+    def reset(self, now: float | None = None) -> None:
+        """Restart the deadline grid so the next tick is due immediately.
+
+        Args:
+            now: Current monotonic time (defaults to clock())
+        """
+        self._deadline = self._clock() if now is None else now
+
+    def reset_stats(self) -> None:
+        """Clear accumulated timing statistics."""
+        self._jitter_total = 0.0
+        self._polls = 0
+        self._stats = TickStats(period=self._period)
+
+    def poll(self, now: float | None = None) -> int:
+        """Consume due deadlines without blocking.
+
+        Args:
+            now: Current monotonic time (defaults to clock())
+
+        Returns:
+            Number of ticks due (0 if the next deadline is in the future)
+        """
+        if now is None:
+            now = self._clock()
+        if now < self._deadline:
+            return 0
+
+        late = now - self._deadline
+        elapsed = 1 + int(late / self._period)
+        # Advance on the fixed grid: next deadline is always in the future
+        self._deadline += elapsed * self._period
+
+        missed = elapsed - 1
+        due = min(elapsed, 1 + self._max_catch_up)
+
+        stats = self._stats
+        stats.ticks += due
+        stats.missed += missed
+        stats.dropped += elapsed - due
+        self._polls += 1
+        self._jitter_total += late
+        stats.jitter_mean = self._jitter_total / self._polls
+        if late > stats.jitter_max:
+            stats.jitter_max = late
+        return due
+
+    def wait(self) -> int:
+        """Sleep until the next deadline, then consume it.
+
+        Returns:
+            Number of ticks due (>= 1, more after an overrun)
+        """
+        while True:
+            delay = self._deadline - self._clock()
+            if delay > 0:
+                time.sleep(delay)
+            due = self.poll()
+            if due:
+                return due
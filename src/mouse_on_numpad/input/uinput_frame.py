@@ -0,0 +1,136 @@
+"""Batched input_event writer for uinput devices.
+
+python-evdev's UInput.write() packs one event and issues one write(2) per
+call, so a pointer frame (REL_X, REL_Y, SYN_REPORT) costs three syscalls.
+FrameWriter packs a whole frame into a preallocated buffer and hands it to
+the kernel with a single os.write().
+"""
+
+import os
+import struct
+
+# struct input_event on 64-bit Linux: struct timeval (2 x long), __u16 type,
+# __u16 code, __s32 value. uinput fills in the timestamp itself.
+INPUT_EVENT = struct.Struct("llHHi")
+EVENT_SIZE = INPUT_EVENT.size
+
+# linux/input-event-codes.h
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_REL = 0x02
+SYN_REPORT = 0
+REL_X = 0x00
+REL_Y = 0x01
+REL_HWHEEL = 0x06
+REL_WHEEL = 0x08
+REL_WHEEL_HI_RES = 0x0B
+REL_HWHEEL_HI_RES = 0x0C
+
+# Hi-res wheel units per legacy notch (kernel convention)
+WHEEL_HI_RES_UNITS = 120
+
+# Events buffered before an implicit flush (a full frame is at most ~8)
+MAX_FRAME_EVENTS = 32
+
+
+class FrameWriter:
+    """Pack input events into one buffer and write them with one syscall.
+
+    Not thread-safe: the buffer belongs to one frame at a time, so callers
+    on several threads must serialize whole frames (see UinputMouse).
+    """
+
+    __slots__ = ("_fd", "_buf", "_view", "_count", "_capacity", "writes")
+
+    def __init__(self, fd: int, max_events: int = MAX_FRAME_EVENTS) -> None:
+        """Initialize FrameWriter.
+
+        Args:
+            fd: File descriptor of the uinput device
+            max_events: Buffer capacity in events
+        """
+        self._fd = fd
+        self._buf = bytearray(EVENT_SIZE * max_events)
+        self._view = memoryview(self._buf)
+        self._count = 0
+        self._capacity = max_events
+        self.writes = 0  # write(2) calls issued (for benchmarks)
+
+    def add(self, etype: int, code: int, value: int) -> None:
+        """Append one event to the pending frame."""
+        if self._count == self._capacity:
+            self.flush()
+        INPUT_EVENT.pack_into(self._buf, self._count * EVENT_SIZE, 0, 0, etype, code, value)
+        self._count += 1
+
+    def syn(self) -> None:
+        """Append a SYN_REPORT, closing the current frame."""
+        self.add(EV_SYN, SYN_REPORT, 0)
+
+    def flush(self) -> None:
+        """Write all pending events to the device."""
+        end = self._count * EVENT_SIZE
+        if not end:
+            return
+        self._count = 0
+        written = os.write(self._fd, self._view[:end])
+        self.writes += 1
+        while written < end:  # uinput consumes whole events; loop defensively
+            written += os.write(self._fd, self._view[written:end])
+            self.writes += 1
+
+    def rel_frame(
+        self,
+        dx: int = 0,
+        dy: int = 0,
+        wheel: int = 0,
+        hwheel: int = 0,
+        buttons: dict[int, int] | None = None,
+        wheel_hi_res: int = 0,
+        hwheel_hi_res: int = 0,
+    ) -> None:
+        """Write pointer motion, wheel and button changes as one SYN frame.
+
+        Packs directly into the buffer (no per-event method calls) since this
+        runs on every motion tick.
+
+        Args:
+            dx: Horizontal pointer delta
+            dy: Vertical pointer delta
+            wheel: Vertical wheel notches (>0 = up)
+            hwheel: Horizontal wheel notches (>0 = right)
+            buttons: Button code -> 1 (press) / 0 (release)
+            wheel_hi_res: Vertical wheel in 1/120 notches (>0 = up)
+            hwheel_hi_res: Horizontal wheel in 1/120 notches (>0 = right)
+        """
+        needed = 7 + (len(buttons) if buttons else 0)
+        if self._count + needed > self._capacity:
+            self.flush()
+        pack = INPUT_EVENT.pack_into
+        buf = self._buf
+        offset = self._count * EVENT_SIZE
+        if buttons:
+            for code, value in buttons.items():
+                pack(buf, offset, 0, 0, EV_KEY, code, value)
+                offset += EVENT_SIZE
+        if dx:
+            pack(buf, offset, 0, 0, EV_REL, REL_X, dx)
+            offset += EVENT_SIZE
+        if dy:
+            pack(buf, offset, 0, 0, EV_REL, REL_Y, dy)
+            offset += EVENT_SIZE
+        if wheel:
+            pack(buf, offset, 0, 0, EV_REL, REL_WHEEL, wheel)
+            offset += EVENT_SIZE
+        if hwheel:
+            pack(buf, offset, 0, 0, EV_REL, REL_HWHEEL, hwheel)
+            offset += EVENT_SIZE
+        if wheel_hi_res:
+            pack(buf, offset, 0, 0, EV_REL, REL_WHEEL_HI_RES, wheel_hi_res)
+            offset += EVENT_SIZE
+        if hwheel_hi_res:
+            pack(buf, offset, 0, 0, EV_REL, REL_HWHEEL_HI_RES, hwheel_hi_res)
+            offset += EVENT_SIZE
+        pack(buf, offset, 0, 0, EV_SYN, SYN_REPORT, 0)
+        self._count = offset // EVENT_SIZE + 1
+        self.flush()
@@ -1,16 +1,31 @@
 """UInput-based mouse controller for zero-overhead mouse control."""
 
 import os
+import threading
+
 from evdev import UInput, ecodes
 
+from .uinput_frame import WHEEL_HI_RES_UNITS, FrameWriter
+
 
 class UinputMouse:
     """Mouse controller using UInput (works on Wayland, zero subprocess overhead).
 
     Provides move, click, scroll operations via direct kernel writes.
     Requires /dev/uinput access (input group membership or udev rule).
+
+    The device advertises the hi-res wheel axes, so scrolling can be emitted
+    in 1/120-notch steps. Legacy REL_WHEEL notches are synthesized alongside
+    for applications that only read whole notches.
+
+    Safe to call from any thread: the motion thread, key capture and the
+    control socket share one frame buffer, so each frame is built and
+    written under a lock.
     """
 
+    # ScrollController emits 1/120-notch units through scroll_hi_res()
+    hi_res_wheel = True
+
     BUTTONS = {
         "left": ecodes.BTN_LEFT,
         "right": ecodes.BTN_RIGHT,
@@ -36,47 +51,102 @@ class UinputMouse:
         # Include PID in name to prevent collisions with multiple instances
         self._ui = UInput(
             events={
-                ecodes.EV_REL: [ecodes.REL_X, ecodes.REL_Y, ecodes.REL_WHEEL, ecodes.REL_HWHEEL],
+                ecodes.EV_REL: [
+                    ecodes.REL_X,
+                    ecodes.REL_Y,
+                    ecodes.REL_WHEEL,
+                    ecodes.REL_HWHEEL,
+                    ecodes.REL_WHEEL_HI_RES,
+                    ecodes.REL_HWHEEL_HI_RES,
+                ],
                 ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT, ecodes.BTN_MIDDLE],
             },
             name=f"mouse-on-numpad-mouse-{os.getpid()}",
         )
+        self._frame = FrameWriter(self._ui.fd)
+        self._lock = threading.Lock()  # One frame (add ... flush) at a time
+        # Hi-res units not yet reported as a legacy notch
+        self._wheel_acc = 0
+        self._hwheel_acc = 0
 
     def move(self, dx: int, dy: int) -> None:
         """Move mouse by relative offset."""
-        if dx != 0:
-            self._ui.write(ecodes.EV_REL, ecodes.REL_X, dx)
-        if dy != 0:
-            self._ui.write(ecodes.EV_REL, ecodes.REL_Y, dy)
-        self._ui.syn()
+        with self._lock:
+            self._frame.rel_frame(dx, dy)
 
     def click(self, button: str = "left") -> None:
-        """Click mouse button (press and release)."""
+        """Click mouse button (press and release frames in one write)."""
         btn = self.BUTTONS.get(button, ecodes.BTN_LEFT)
-        self._ui.write(ecodes.EV_KEY, btn, 1)  # Press
-        self._ui.syn()
-        self._ui.write(ecodes.EV_KEY, btn, 0)  # Release
-        self._ui.syn()
+        frame = self._frame
+        with self._lock:
+            frame.add(ecodes.EV_KEY, btn, 1)  # Press
+            frame.syn()
+            frame.add(ecodes.EV_KEY, btn, 0)  # Release
+            frame.syn()
+            frame.flush()
 
     def press(self, button: str = "left") -> None:
         """Press and hold mouse button."""
-        btn = self.BUTTONS.get(button, ecodes.BTN_LEFT)
-        self._ui.write(ecodes.EV_KEY, btn, 1)
-        self._ui.syn()
+        self.emit_frame(buttons={button: True})
 
     def release(self, button: str = "left") -> None:
         """Release mouse button."""
-        btn = self.BUTTONS.get(button, ecodes.BTN_LEFT)
-        self._ui.write(ecodes.EV_KEY, btn, 0)
-        self._ui.syn()
+        self.emit_frame(buttons={button: False})
 
     def scroll(self, dx: int, dy: int) -> None:
         """Scroll mouse wheel. dy>0 = up, dy<0 = down."""
-        if dy != 0:
-            self._ui.write(ecodes.EV_REL, ecodes.REL_WHEEL, dy)
-        if dx != 0:
-            self._ui.write(ecodes.EV_REL, ecodes.REL_HWHEEL, dx)
-        self._ui.syn()
+        self.emit_frame(wheel=dy, hwheel=dx)
+
+    def scroll_hi_res(self, dx: int, dy: int) -> None:
+        """Scroll in 1/120-notch units. dy>0 = up, dx>0 = right."""
+        self.emit_frame(wheel_hi_res=dy, hwheel_hi_res=dx)
+
+    def emit_frame(
+        self,
+        dx: int = 0,
+        dy: int = 0,
+        wheel: int = 0,
+        hwheel: int = 0,
+        buttons: dict[str, bool] | None = None,
+        wheel_hi_res: int = 0,
+        hwheel_hi_res: int = 0,
+    ) -> None:
+        """Emit pointer motion, wheel scroll and button changes in one SYN frame.
+
+        All events are packed into a preallocated buffer and written with a
+        single syscall. Whole notches are also reported on the hi-res axes
+        (libinput reads only those when present), and hi-res scrolling adds
+        a legacy notch each time 120 units accumulate.
+
+        Args:
+            dx: Horizontal pointer delta
+            dy: Vertical pointer delta
+            wheel: Vertical wheel notches (>0 = up)
+            hwheel: Horizontal wheel notches (>0 = right)
+            buttons: Button name -> True (press) / False (release)
+            wheel_hi_res: Vertical wheel in 1/120 notches (>0 = up)
+            hwheel_hi_res: Horizontal wheel in 1/120 notches (>0 = right)
+        """
+        codes = None
+        if buttons:
+            codes = {
+                self.BUTTONS.get(name, ecodes.BTN_LEFT): int(pressed)
+                for name, pressed in buttons.items()
+            }
+        with self._lock:
+            if wheel_hi_res:
+                notches, self._wheel_acc = _legacy_notches(self._wheel_acc, wheel_hi_res)
+                wheel_hi_res += wheel * WHEEL_HI_RES_UNITS
+                wheel += notches
+            elif wheel:
+                wheel_hi_res = wheel * WHEEL_HI_RES_UNITS
+            if hwheel_hi_res:
+                notches, self._hwheel_acc = _legacy_notches(self._hwheel_acc, hwheel_hi_res)
+                hwheel_hi_res += hwheel * WHEEL_HI_RES_UNITS
+                hwheel += notches
+            elif hwheel:
+                hwheel_hi_res = hwheel * WHEEL_HI_RES_UNITS
+            self._frame.rel_frame(dx, dy, wheel, hwheel, codes, wheel_hi_res, hwheel_hi_res)
 
     def close(self) -> None:
         """Close the UInput device."""
@@ -94,3 +164,20 @@ class UinputMouse:
     def __del__(self) -> None:
         """Cleanup on destruction."""
         self.close()
+
+
+def _legacy_notches(acc: int, units: int) -> tuple[int, int]:
+    """Fold hi-res units into an accumulator and split off whole notches.
+
+    Args:
+        acc: Units accumulated since the last legacy notch
+        units: New hi-res units
+
+    Returns:
+        (notches to report, remaining accumulator)
+    """
+    if (acc > 0 > units) or (acc < 0 < units):
+        acc = 0  # Direction changed: start a fresh notch
+    acc += units
+    notches = int(acc / WHEEL_HI_RES_UNITS)  # Toward zero
+    return notches, acc - notches * WHEEL_HI_RES_UNITS
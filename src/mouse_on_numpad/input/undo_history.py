@@ -0,0 +1,158 @@
+"""Stroke-level undo/redo history for cursor movement."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class StrokeRecord:
+    """Accumulated displacement of one press-to-release stroke."""
+
+    dx: int
+    dy: int
+    start: float  # Monotonic time of the first key press
+    end: float  # Monotonic time of the last key release
+
+
+class StrokeHistory:
+    """Fixed-size ring buffer of strokes plus a redo stack.
+
+    Ticks are folded into the open stroke, so recording is O(1) with no
+    allocation per tick. Closing a stroke writes one slot of the ring; once
+    full, the oldest stroke is overwritten. Recording a new stroke clears the
+    redo stack, as in editors.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize StrokeHistory.
+
+        Args:
+            capacity: Number of strokes kept (undo.max_levels)
+        """
+        self._capacity = max(capacity, 0)
+        self._ring: list[StrokeRecord | None] = [None] * self._capacity
+        self._head = 0  # Next slot to write
+        self._count = 0
+        self._redo: list[StrokeRecord] = []
+        self._open: StrokeRecord | None = None
+
+    def __len__(self) -> int:
+        """Return the number of closed strokes available to undo."""
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of strokes kept."""
+        return self._capacity
+
+    @property
+    def redo_depth(self) -> int:
+        """Return the number of strokes available to redo."""
+        return len(self._redo)
+
+    def set_capacity(self, capacity: int) -> None:
+        """Resize the ring, keeping the newest strokes.
+
+        Args:
+            capacity: New number of strokes kept
+        """
+        capacity = max(capacity, 0)
+        if capacity == self._capacity:
+            return
+        kept = self.strokes()[-capacity:] if capacity else []
+        self._capacity = capacity
+        self._ring = [None] * capacity
+        self._head = self._count = 0
+        for record in kept:
+            self._push(record)
+        del self._redo[capacity:]
+
+    def begin(self, now: float) -> None:
+        """Open a stroke (first movement key pressed from rest).
+
+        Args:
+            now: Monotonic press time
+        """
+        self.end(now)  # Close any stroke left open
+        self._open = StrokeRecord(0, 0, now, now)
+
+    def add(self, dx: int, dy: int, now: float) -> None:
+        """Fold one emitted delta into the open stroke.
+
+        Args:
+            dx: Emitted horizontal pixels
+            dy: Emitted vertical pixels
+            now: Monotonic time of the tick
+        """
+        record = self._open
+        if record is None:
+            record = self._open = StrokeRecord(0, 0, now, now)
+        record.dx += dx
+        record.dy += dy
+        record.end = now
+
+    def end(self, now: float) -> None:
+        """Close the open stroke (all movement keys released).
+
+        Strokes that did not move the cursor are dropped.
+
+        Args:
+            now: Monotonic release time
+        """
+        record = self._open
+        if record is None:
+            return
+        self._open = None
+        if record.dx == 0 and record.dy == 0:
+            return
+        record.end = now
+        self._push(record)
+        self._redo.clear()
+
+    def undo(self) -> StrokeRecord | None:
+        """Take the newest stroke off the ring and move it onto the redo stack.
+
+        Returns:
+            The stroke to reverse, or None if the history is empty
+        """
+        if self._open is not None:
+            self.end(self._open.end)
+        if self._count == 0:
+            return None
+        self._head = (self._head - 1) % self._capacity
+        record = self._ring[self._head]
+        self._ring[self._head] = None
+        self._count -= 1
+        self._redo.append(record)
+        return record
+
+    def redo(self) -> StrokeRecord | None:
+        """Move the last undone stroke back onto the ring.
+
+        Returns:
+            The stroke to replay, or None if nothing was undone
+        """
+        if not self._redo:
+            return None
+        record = self._redo.pop()
+        self._push(record)
+        return record
+
+    def clear(self) -> None:
+        """Drop all undo and redo history."""
+        self._ring = [None] * self._capacity
+        self._head = self._count = 0
+        self._redo.clear()
+        self._open = None
+
+    def strokes(self) -> list[StrokeRecord]:
+        """Return closed strokes, oldest first."""
+        start = (self._head - self._count) % self._capacity if self._capacity else 0
+        return [self._ring[(start + i) % self._capacity] for i in range(self._count)]
+
+    def _push(self, record: StrokeRecord) -> None:
+        """Append a closed stroke, overwriting the oldest when full."""
+        if self._capacity == 0:
+            return
+        self._ring[self._head] = record
+        self._head = (self._head + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
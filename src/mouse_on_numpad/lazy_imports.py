@@ -0,0 +1,39 @@
+"""Deferred package exports (PEP 562).
+
+Package __init__ files map their public names to submodules instead of
+importing them, so importing one light submodule (or running a CLI command
+that needs none of them) does not pull in GTK, Xlib, pynput or evdev.
+"""
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module __getattr__ and __dir__ for deferred exports.
+
+    Args:
+        package: Package name (the calling module's __name__)
+        exports: Public name -> submodule (relative to package) defining it
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(f".{module}", package), name)
+        namespace[name] = value  # Later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,10 +1,18 @@
-"""Mouse on Numpad Enhanced - Main entry point."""
+"""Mouse on Numpad Enhanced - Main entry point.
+
+Each command imports and initializes only what it uses: the daemon client
+commands need just the control channel, --list-devices just evdev, and only
+--daemon builds the config, state and input stack.
+"""
 
 import argparse
 import sys
+from typing import TYPE_CHECKING
 
 from . import __version__
-from .core import ConfigManager, ErrorLogger, StateManager
+
+if TYPE_CHECKING:
+    from .core.error_logger import ErrorLogger
 
 
 def parse_args() -> argparse.Namespace:
@@ -23,6 +31,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run in background daemon mode",
     )
+    parser.add_argument(
+        "--asyncio",
+        action="store_true",
+        help="Run the daemon on a single asyncio event loop (with --daemon)",
+    )
     parser.add_argument(
         "--settings",
         action="store_true",
@@ -31,12 +44,24 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--toggle",
         action="store_true",
-        help="Toggle mouse control on/off",
+        help="Toggle mouse control on/off in the running daemon",
     )
     parser.add_argument(
         "--status",
         action="store_true",
-        help="Show current status",
+        help="Show the running daemon's status",
+    )
+    parser.add_argument(
+        "--send",
+        nargs="+",
+        metavar="COMMAND",
+        help="Send a command to the running daemon "
+        "(toggle [on|off], status, move DX DY, click [BUTTON], slot N, reload, stats)",
+    )
+    parser.add_argument(
+        "--list-devices",
+        action="store_true",
+        help="List input devices and their ids for capture.devices",
     )
     parser.add_argument(
         "--debug",
@@ -51,78 +76,134 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> int:
-    """Application entry point.
+def run_client(words: list[str]) -> int:
+    """Send one command to the daemon's control socket and print the reply.
+
+    Imports only the control channel, so it runs without GTK or X11.
+
+    Args:
+        words: Command and arguments
 
     Returns:
-        Exit code (0 for success)
+        Exit code (0 for success, 1 if the daemon is unreachable or refused)
     """
-    args = parse_args()
+    import json
+
+    from .core.control_channel import ControlError, send_command
+
+    try:
+        response = send_command(*words)
+    except ControlError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    command = words[0].lower()
+    if command == "toggle":
+        print(f"Mouse control {'enabled' if response['enabled'] else 'disabled'}")
+    elif command == "status":
+        print(f"Mouse Mode: {'ENABLED' if response['enabled'] else 'DISABLED'}")
+        print(f"Position memory: {response['mode']}")
+        print(f"Held buttons: {', '.join(response['held_buttons']) or 'none'}")
+        print(f"Speed: {response['speed']}")
+    elif response:
+        print(json.dumps(response, indent=2))
+    return 0
 
-    # Initialize core components
-    logger = ErrorLogger(console_output=args.debug)
-    config = ConfigManager()
-    state = StateManager()
 
+def _start_logger(debug: bool) -> "ErrorLogger":
+    """Create the file logger and record startup."""
+    from .core.error_logger import ErrorLogger
+
+    logger = ErrorLogger(console_output=debug)
     logger.info("Mouse on Numpad %s starting", __version__)
-    logger.debug("Config loaded from: %s", config.config_file)
+    return logger
 
-    if args.status:
-        # Show current state
-        snapshot = state.get_state_snapshot()
-        print(f"Mouse Mode: {'ENABLED' if snapshot['is_enabled'] else 'DISABLED'}")
-        print(f"NumLock: {'ON' if snapshot['numlock_state'] else 'OFF'}")
-        print(f"Position: {snapshot['current_position']}")
-        print(f"Monitor: {snapshot['active_monitor']}")
-        return 0
 
-    if args.toggle:
-        enabled = state.toggle()
-        status = "enabled" if enabled else "disabled"
-        print(f"Mouse control {status}")
-        logger.info("Mouse control toggled: %s", status)
-        return 0
+def run_indicator(debug: bool) -> int:
+    """Show the floating status indicator (layer shell)."""
+    _start_logger(debug)
 
-    if args.indicator:
-        # Show floating status indicator (layer shell)
-        import gi
+    import gi
 
-        gi.require_version("Gtk", "4.0")
-        from gi.repository import Gtk
+    gi.require_version("Gtk", "4.0")
+    from gi.repository import Gtk
 
-        from .ui.status_indicator import StatusIndicator
+    from .ui.status_indicator import StatusIndicator
 
-        indicator = None
+    indicator = None
 
-        def on_activate(app: Gtk.Application) -> None:
-            nonlocal indicator
-            indicator = StatusIndicator()
-            indicator.set_application(app)
-            # Don't use present() - layer shell handles visibility
-            app.hold()  # Keep app running
+    def on_activate(app: Gtk.Application) -> None:
+        nonlocal indicator
+        indicator = StatusIndicator()
+        indicator.set_application(app)
+        # Don't use present() - layer shell handles visibility
+        app.hold()  # Keep app running
 
-        app = Gtk.Application(application_id="org.mouse-on-numpad.indicator")
-        app.connect("activate", on_activate)
-        return app.run(None)
+    app = Gtk.Application(application_id="org.mouse-on-numpad.indicator")
+    app.connect("activate", on_activate)
+    return app.run(None)
 
-    if args.settings:
-        # Launch GTK GUI
-        import gi
 
-        gi.require_version("Gtk", "4.0")
-        from .app import Application
+def run_settings(debug: bool) -> int:
+    """Launch the GTK settings GUI."""
+    _start_logger(debug)
 
-        app = Application()
-        return app.run(None)
+    import gi
 
-    if args.daemon:
-        from .daemon import Daemon
+    gi.require_version("Gtk", "4.0")
+    from .app import Application
 
-        logger.info("Starting daemon mode")
-        daemon = Daemon(config=config, state=state, logger=logger)
-        daemon.start()
+    app = Application()
+    return app.run(None)
+
+
+def run_daemon(debug: bool, use_asyncio: bool) -> int:
+    """Run the daemon until it is stopped."""
+    logger = _start_logger(debug)
+
+    from .core.config import ConfigManager
+    from .core.state_manager import StateManager
+    from .daemon.daemon_coordinator import Daemon
+
+    config = ConfigManager()
+    logger.debug("Config loaded from: %s", config.config_file)
+    logger.info("Starting daemon mode")
+    daemon = Daemon(config=config, state=StateManager(), logger=logger)
+    daemon.start(use_asyncio=use_asyncio)
+    return 0
+
+
+def main() -> int:
+    """Application entry point.
+
+    Returns:
+        Exit code (0 for success)
+    """
+    args = parse_args()
+
+    # Talk to the running daemon before loading anything else
+    if args.status:
+        return run_client(["status"])
+    if args.toggle:
+        return run_client(["toggle"])
+    if args.send:
+        return run_client(args.send)
+
+    if args.list_devices:
+        from .daemon.device_selector import list_key_devices
+
+        for path, identity in list_key_devices():
+            print(f"{path}\t{identity}")
         return 0
 
+    if args.indicator:
+        return run_indicator(args.debug)
+
+    if args.settings:
+        return run_settings(args.debug)
+
+    if args.daemon:
+        return run_daemon(args.debug, args.asyncio)
+
     # Default: show help
     print(f"Mouse on Numpad Enhanced v{__version__}")
     print("Use --help for usage information")
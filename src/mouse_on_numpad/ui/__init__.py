@@ -1,10 +1,19 @@
-"""GTK 4 GUI components for Mouse on Numpad."""
+"""GTK 4 GUI components for Mouse on Numpad.
 
-from .main_window import MainWindow
-from .status_indicator import StatusIndicator
-from .hotkeys_tab import HotkeysTab
-from .key_capture_button import KeyCaptureButton
-from .keycode_mappings import get_key_name, HOTKEY_LABELS, SLOT_KEY_LABELS
+Exports are imported on first access, so importing the package does not
+load GTK until a widget is used.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .main_window import MainWindow
+    from .status_indicator import StatusIndicator
+    from .hotkeys_tab import HotkeysTab
+    from .key_capture_button import KeyCaptureButton
+    from .keycode_mappings import get_key_name, HOTKEY_LABELS, SLOT_KEY_LABELS
 
 __all__ = [
     "MainWindow",
@@ -16,6 +25,19 @@ __all__ = [
     "SLOT_KEY_LABELS",
 ]
 
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MainWindow": "main_window",
+        "StatusIndicator": "status_indicator",
+        "HotkeysTab": "hotkeys_tab",
+        "KeyCaptureButton": "key_capture_button",
+        "get_key_name": "keycode_mappings",
+        "HOTKEY_LABELS": "keycode_mappings",
+        "SLOT_KEY_LABELS": "keycode_mappings",
+    },
+)
+
 # TrayIcon uses pystray (GTK 3) and lives in mouse_on_numpad.tray_icon
 # to avoid GTK version conflict. Import directly:
 # from mouse_on_numpad.tray_icon import TrayIcon
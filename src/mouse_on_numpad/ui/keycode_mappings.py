@@ -50,7 +50,7 @@ HOTKEY_LABELS: dict[str, str] = {
     "toggle_mode": "Toggle Mouse Mode",
     "save_mode": "Save Position Mode",
     "load_mode": "Load Position Mode",
-    "undo": "Undo Movement",
+    "undo": "Undo Movement (Alt+Key: Redo)",
     "left_click": "Left Click",
     "right_click": "Right Click",
     "middle_click": "Middle Click",
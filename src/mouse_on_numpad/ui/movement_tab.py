@@ -2,10 +2,12 @@
 
 import gi  # type: ignore[import-untyped]
 
-gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk  # type: ignore[import-untyped]
-
 from ..core.config import ConfigManager
+from ..input.accel_curves import CURVES
+
+# gi.repository must be imported after the GTK version is pinned
+gi.require_version("Gtk", "4.0")
+from gi.repository import Gtk  # type: ignore[import-untyped]  # noqa: E402
 
 
 class MovementTab(Gtk.Box):  # type: ignore[misc]
@@ -101,13 +103,14 @@ class MovementTab(Gtk.Box):  # type: ignore[misc]
         curve_label.set_halign(Gtk.Align.START)
         curve_box.append(curve_label)
 
-        curve_dropdown = Gtk.DropDown.new_from_strings(
-            ["linear", "exponential", "s-curve"]
-        )
         current_curve = self._config.get("movement.curve", "exponential")
-        curve_options = ["linear", "exponential", "s-curve"]
-        if current_curve in curve_options:
-            curve_dropdown.set_selected(curve_options.index(current_curve))
+        # No curve_points editor yet: offer spline only once points are set
+        # in config.json (without them it is a flat 1.0, no acceleration)
+        show_spline = bool(self._config.get("movement.curve_points")) or current_curve == "spline"
+        self._curves = [curve for curve in CURVES if curve != "spline" or show_spline]
+        curve_dropdown = Gtk.DropDown.new_from_strings(self._curves)
+        if current_curve in self._curves:
+            curve_dropdown.set_selected(self._curves.index(current_curve))
         curve_dropdown.connect("notify::selected", self._on_curve_changed)
         curve_box.append(curve_dropdown)
         self.append(curve_box)
@@ -135,6 +138,5 @@ class MovementTab(Gtk.Box):  # type: ignore[misc]
     def _on_curve_changed(self, dropdown: Gtk.DropDown, _param: object) -> None:
         """Handle acceleration curve dropdown changes."""
         selected = dropdown.get_selected()
-        curves = ["linear", "exponential", "s-curve"]
-        if 0 <= selected < len(curves):
-            self._config.set("movement.curve", curves[selected])
+        if 0 <= selected < len(self._curves):
+            self._config.set("movement.curve", self._curves[selected])
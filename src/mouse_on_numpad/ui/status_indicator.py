@@ -1,16 +1,19 @@
 """Floating status indicator using Wayland layer shell."""
 
-from pathlib import Path
-
 import gi  # type: ignore[import-untyped]
 
+from ..core.status_channel import MAX_MESSAGE, connect_status, decode_status
+
+# gi.repository must be imported after the library versions are pinned
 gi.require_version("Gtk", "4.0")
 gi.require_version("Gtk4LayerShell", "1.0")
-from gi.repository import Gtk, GLib, Gdk, Gtk4LayerShell  # type: ignore[import-untyped]
+from gi.repository import Gdk, GLib, Gtk, Gtk4LayerShell  # type: ignore[import-untyped]  # noqa: E402
 
-from ..core.config import ConfigManager
+# Seconds between attempts to reach the daemon's status channel
+RECONNECT_INTERVAL = 1
 
-STATUS_FILE = Path("/tmp/mouse-on-numpad-status")
+# Label suffixes for position memory modes
+MODE_LABELS = {"save": "SAVE", "load": "LOAD"}
 
 # Size presets: font-size in px
 SIZE_PRESETS = {"small": 11, "medium": 14, "large": 20}
@@ -25,12 +28,18 @@ THEME_PRESETS = {
 
 
 class StatusIndicator(Gtk.Window):  # type: ignore[misc]
-    """Layer shell overlay indicator for mouse mode status."""
+    """Layer shell overlay indicator for mouse mode status.
+
+    Everything it shows, including its appearance (the status_bar config
+    section), is pushed by the daemon; it never reads config.json itself.
+    """
 
     def __init__(self) -> None:
         super().__init__()
-        self._enabled = False
-        self._config = ConfigManager()
+        self._status: dict = {}
+        self._sock = None
+        self._watch_id = 0
+        self._style: dict = {}  # status_bar settings pushed by the daemon
 
         # Layer shell setup - MUST be before window is realized
         Gtk4LayerShell.init_for_window(self)
@@ -39,7 +48,7 @@ class StatusIndicator(Gtk.Window):  # type: ignore[misc]
         Gtk4LayerShell.set_exclusive_zone(self, -1)
         Gtk4LayerShell.set_keyboard_mode(self, Gtk4LayerShell.KeyboardMode.NONE)
 
-        # Apply position from config
+        # Default position until the daemon sends the configured one
         self._apply_position()
 
         # UI
@@ -50,14 +59,21 @@ class StatusIndicator(Gtk.Window):  # type: ignore[misc]
         self._label.set_margin_end(14)
         self.set_child(self._label)
 
+        self._css = Gtk.CssProvider()
+        display = Gdk.Display.get_default()
+        if display:
+            Gtk.StyleContext.add_provider_for_display(
+                display, self._css, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
         self._apply_styles()
 
-        # Start polling
-        GLib.timeout_add(100, self._poll_status)
+        # Status is pushed by the daemon; no polling while connected
+        if self._connect():
+            GLib.timeout_add_seconds(RECONNECT_INTERVAL, self._connect)
 
     def _apply_position(self) -> None:
-        """Apply position from config."""
-        pos = self._config.get("status_bar.position", "top-right")
+        """Apply the configured position."""
+        pos = self._style.get("position", "top-right")
         margin = 10
 
         # Reset anchors
@@ -81,18 +97,17 @@ class StatusIndicator(Gtk.Window):  # type: ignore[misc]
             Gtk4LayerShell.set_margin(self, Gtk4LayerShell.Edge.LEFT, margin)
 
     def _apply_styles(self) -> None:
-        """Apply size, opacity and theme from config."""
-        size = self._config.get("status_bar.size", "medium")
-        opacity = self._config.get("status_bar.opacity", 80) / 100.0
-        theme = self._config.get("status_bar.theme", "default")
+        """Apply the configured size, opacity and theme."""
+        size = self._style.get("size", "medium")
+        opacity = self._style.get("opacity", 80) / 100.0
+        theme = self._style.get("theme", "default")
         font_size = SIZE_PRESETS.get(size, 14)
         bg_color, text_color = THEME_PRESETS.get(theme, THEME_PRESETS["default"])
 
         # Convert hex to rgba
         r, g, b = int(bg_color[1:3], 16), int(bg_color[3:5], 16), int(bg_color[5:7], 16)
 
-        css = Gtk.CssProvider()
-        css.load_from_data(f"""
+        self._css.load_from_data(f"""
             window {{
                 background-color: rgba({r}, {g}, {b}, {opacity});
                 border-radius: 8px;
@@ -103,26 +118,64 @@ class StatusIndicator(Gtk.Window):  # type: ignore[misc]
                 font-size: {font_size}px;
             }}
         """.encode())
-        display = Gdk.Display.get_default()
-        if display:
-            Gtk.StyleContext.add_provider_for_display(
-                display, css, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
 
-    def _poll_status(self) -> bool:
-        try:
-            if STATUS_FILE.exists():
-                enabled = STATUS_FILE.read_text().strip() == "enabled"
-            else:
-                enabled = False
-            self._update(enabled)
-        except OSError:
-            pass
-        return True
-
-    def _update(self, enabled: bool) -> None:
-        if enabled == self._enabled:
+    def _connect(self) -> bool:
+        """Subscribe to the daemon's status channel.
+
+        Returns:
+            True to keep retrying (used as a GLib timeout callback)
+        """
+        sock = connect_status()
+        if sock is None:
+            return True
+        self._sock = sock
+        self._watch_id = GLib.io_add_watch(
+            sock.fileno(),
+            GLib.PRIORITY_DEFAULT,
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self._on_status,
+        )
+        return False
+
+    def _on_status(self, _fd: int, condition: GLib.IOCondition) -> bool:
+        """Apply pushed status messages (GLib IO watch)."""
+        while True:
+            try:
+                data = self._sock.recv(MAX_MESSAGE)
+            except BlockingIOError:
+                return True
+            except OSError:
+                data = b""
+            if not data:
+                # Daemon went away: hide and wait for it to come back
+                self._sock.close()
+                self._sock = None
+                self._watch_id = 0
+                self._update({})
+                GLib.timeout_add_seconds(RECONNECT_INTERVAL, self._connect)
+                return False
+            status = decode_status(data)
+            if status is not None:
+                self._update(status)
+
+    def _update(self, status: dict) -> None:
+        if status == self._status:
             return
-        self._enabled = enabled
-        self._label.set_label("Mouse: ON" if enabled else "Mouse: OFF")
+        style = status.get("status_bar")
+        if style and style != self._style:  # Kept while the daemon is away
+            self._style = style
+            self._apply_position()
+            self._apply_styles()
+        self._status = status
+        enabled = bool(status.get("enabled"))
+        label = "Mouse: ON" if enabled else "Mouse: OFF"
+        extras = []
+        mode = status.get("mode")
+        if mode in MODE_LABELS:
+            extras.append(MODE_LABELS[mode])
+        if status.get("held_buttons"):
+            extras.append("HOLD")
+        if extras:
+            label = f"{label} · {' '.join(extras)}"
+        self._label.set_label(label)
         self.set_visible(enabled)
@@ -0,0 +1,51 @@
+"""Tests for time-based acceleration curves."""
+
+from itertools import pairwise
+
+import pytest
+
+from mouse_on_numpad.input.accel_curves import speed_multiplier
+
+PERIOD = 0.02  # Nominal move_delay the rates are tuned for
+
+
+def test_exponential_matches_per_tick_compounding():
+    """At whole ticks the exponential curve equals rate ** n."""
+    for n in (0, 1, 5, 20):
+        assert speed_multiplier("exponential", n * PERIOD, 1.08, 100.0, PERIOD) == pytest.approx(
+            1.08**n
+        )
+
+
+def test_linear_matches_per_tick_increment():
+    """Linear adds (rate - 1) per nominal tick."""
+    assert speed_multiplier("linear", 3 * PERIOD, 1.1, 100.0, PERIOD) == pytest.approx(1.3)
+
+
+def test_curves_are_capped_at_max_mult():
+    """No curve exceeds max_mult, however long the stroke."""
+    for curve in ("linear", "exponential", "s-curve"):
+        assert speed_multiplier(curve, 60.0, 1.5, 8.0, PERIOD) <= 8.0
+
+
+def test_s_curve_is_monotonic_and_continuous():
+    """S-curve grows smoothly through its midpoint."""
+    values = [speed_multiplier("s-curve", i * 0.001, 1.08, 8.0, PERIOD) for i in range(2000)]
+    assert values[0] == pytest.approx(1.0)
+    assert all(b >= a for a, b in pairwise(values))
+    assert max(b - a for a, b in pairwise(values)) < 0.06  # No jumps (peak slope is rate per 20 ms)
+    assert values[-1] == pytest.approx(8.0, rel=0.01)
+
+
+def test_s_curve_slope_matches_discrete_step():
+    """Initial slope matches the tick-based s-curve increment."""
+    max_mult, rate = 8.0, 1.08
+    discrete_first_step = rate * (1 - abs(2 * (1.0 / max_mult) - 1))
+    continuous = speed_multiplier("s-curve", 0.001 * PERIOD, rate, max_mult, PERIOD) - 1.0
+    assert continuous / 0.001 == pytest.approx(discrete_first_step, rel=0.01)
+
+
+def test_unknown_curve_and_no_headroom():
+    """Unknown curves stay at base speed; max_mult <= 1 is returned as-is."""
+    assert speed_multiplier("bogus", 1.0, 1.1, 5.0, PERIOD) == 1.0
+    assert speed_multiplier("exponential", 1.0, 1.1, 1.0, PERIOD) == 1.0
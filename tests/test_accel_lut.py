@@ -0,0 +1,127 @@
+"""Tests for precomputed acceleration lookup tables."""
+
+import math
+from dataclasses import replace
+from itertools import pairwise
+
+import pytest
+
+from mouse_on_numpad.core.config import ConfigManager
+from mouse_on_numpad.input import accel_lut
+from mouse_on_numpad.input.accel_curves import CURVES, speed_multiplier
+from mouse_on_numpad.input.accel_lut import legacy_table, movement_table
+
+POINTS = ((0.0, 1.0), (200.0, 1.5), (500.0, 4.0), (900.0, 6.0))
+
+
+@pytest.fixture
+def params(tmp_path):
+    """Movement snapshot with default settings."""
+    return ConfigManager(config_dir=tmp_path).movement_params
+
+
+def _reference(params, n):
+    """Scalar curve value after n nominal ticks."""
+    return speed_multiplier(
+        params.curve,
+        n * params.move_delay,
+        params.acceleration_rate,
+        params.max_mult,
+        params.move_delay,
+        params.curve_points,
+    )
+
+
+def _build_without_numpy(monkeypatch, params):
+    """Build a table through the pure-Python fallback."""
+    monkeypatch.setattr(accel_lut, "np", None)
+    return movement_table.__wrapped__(params)
+
+
+@pytest.mark.parametrize("curve", CURVES)
+def test_table_matches_scalar_curve(params, curve):
+    """Interpolated lookups track the closed-form curve."""
+    params = replace(params, curve=curve, curve_points=POINTS)
+    table = movement_table(params)
+    for n in (0, 0.5, 1, 3, 7.25, 20, 60, 500):
+        assert table(n) == pytest.approx(_reference(params, n), rel=2e-3)
+
+
+def test_s_curve_table_follows_tick_recurrence(params):
+    """Tick physics reads the original per-tick s-curve step at whole ticks."""
+    params = replace(params, curve="s-curve")
+    table = movement_table(params)
+    speed = 1.0
+    for n in range(60):
+        assert table(n) == pytest.approx(speed, rel=1e-6)
+        t = speed / params.max_mult
+        speed = min(speed + params.acceleration_rate * (1 - abs(2 * t - 1)), params.max_mult)
+
+
+@pytest.mark.parametrize("curve", CURVES)
+def test_fallback_matches_numpy_build(monkeypatch, params, curve):
+    """Tables sampled without NumPy equal the vectorized ones."""
+    pytest.importorskip("numpy")
+    params = replace(params, curve=curve, curve_points=POINTS)
+    vectorized = movement_table.__wrapped__(params)
+    fallback = _build_without_numpy(monkeypatch, params)
+    assert len(fallback) == len(vectorized)
+    for n in range(0, 200, 3):
+        assert fallback(n) == pytest.approx(vectorized(n), rel=1e-5)
+
+
+def test_table_is_compact_float_array(params):
+    """Samples are stored as a bounded array('f')."""
+    table = movement_table(params)
+    assert table._values.typecode == "f"
+    assert len(table) <= accel_lut.MAX_SAMPLES
+
+
+def test_table_plateaus_at_max_mult(params):
+    """Lookups past the sampled range return the cap."""
+    table = movement_table(params)
+    assert table(1e9) == pytest.approx(params.max_mult, rel=1e-3)
+
+
+def test_tables_cached_per_snapshot(params):
+    """Equal snapshots share one table."""
+    assert movement_table(params) is movement_table(replace(params))
+
+
+def test_spline_passes_through_points(params):
+    """User curve points are hit exactly and held after the last one."""
+    params = replace(params, curve="spline", curve_points=POINTS, max_mult=10.0)
+    table = movement_table(params)
+    for ms, mult in POINTS:
+        assert table(ms / 1000.0 / params.move_delay) == pytest.approx(mult, rel=1e-3)
+    assert table(5000.0) == pytest.approx(6.0)
+
+
+def test_spline_is_monotone_between_rising_points(params):
+    """Monotone interpolation never overshoots a rising profile."""
+    params = replace(params, curve="spline", curve_points=POINTS, max_mult=10.0)
+    table = movement_table(params)
+    values = [table(i * 0.1) for i in range(600)]
+    assert all(b >= a - 1e-6 for a, b in pairwise(values))
+    assert max(values) <= 6.0 + 1e-6
+
+
+def test_curve_points_normalized_from_config(tmp_path):
+    """curve_points are sorted, de-duplicated and malformed entries dropped."""
+    config = ConfigManager(config_dir=tmp_path)
+    config.set("movement.curve_points", [[500, 3], [0, 1], "bad", [500, 4]])
+    assert config.movement_params.curve_points == ((0.0, 1.0), (500.0, 4.0))
+
+
+@pytest.mark.parametrize("curve", ["linear", "exponential", "s-curve"])
+def test_legacy_table_matches_formula(curve):
+    """MouseController tables match the original per-move formulas."""
+    table = legacy_table(curve, 1.5)
+    for t in (0.0, 0.25, 0.5, 0.9, 1.0):
+        if curve == "exponential":
+            expected = 1.0 + 0.5 * t
+        elif curve == "s-curve":
+            expected = 1.0 + 0.5 / (1 + math.exp(-10 * (t - 0.5)))
+        else:
+            expected = 1.0
+        assert table(t) == pytest.approx(expected, rel=1e-3)
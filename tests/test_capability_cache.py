@@ -0,0 +1,165 @@
+"""Tests for the device capability cache."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import evdev
+import pytest
+
+from mouse_on_numpad.core.error_logger import ErrorLogger
+from mouse_on_numpad.daemon import keyboard_capture
+from mouse_on_numpad.daemon.capability_cache import (
+    CapabilityCache,
+    DeviceCaps,
+    default_cache_path,
+    read_sysfs,
+)
+from mouse_on_numpad.daemon.keyboard_capture import KEY_KP8, KeyboardCapture
+
+# (name, vendor, product, keys) per fake eventN
+DEVICES = {
+    "event0": ("USB Numeric Keypad", 0x05A4, 0x9759, [KEY_KP8]),
+    "event1": ("Gamepad", 0x045E, 0x028E, None),
+    "event2": ("Power Button", 0x0000, 0x0001, [116]),
+}
+
+
+def _make_sysfs(root: Path) -> None:
+    """Build /sys/class/input/eventN/device entries for DEVICES."""
+    for node, (name, vendor, product, _) in DEVICES.items():
+        device_dir = root / node / "device"
+        (device_dir / "id").mkdir(parents=True)
+        for field, value in (("bustype", 3), ("vendor", vendor), ("product", product), ("version", 0x110)):
+            (device_dir / "id" / field).write_text(f"{value:04x}\n")
+        (device_dir / "name").write_text(name + "\n")
+        (device_dir / "phys").write_text(f"usb-0000:00:14.0-{node[-1]}/input0\n")
+
+
+def _open_device(path: str) -> MagicMock:
+    """evdev.InputDevice stand-in for a fake node."""
+    name, vendor, product, keys = DEVICES[Path(path).name]
+    dev = MagicMock()
+    dev.path = path
+    dev.name = name
+    dev.phys = f"usb-0000:00:14.0-{path[-1]}/input0"
+    dev.uniq = ""
+    dev.info = SimpleNamespace(bustype=3, vendor=vendor, product=product)
+    dev.capabilities.return_value = {evdev.ecodes.EV_KEY: keys} if keys else {3: [0, 1]}
+    return dev
+
+
+@pytest.fixture
+def sysfs(tmp_path):
+    """Provide a fake sysfs input class directory."""
+    root = tmp_path / "sys"
+    _make_sysfs(root)
+    return root
+
+
+class TestSysfs:
+    """Test identity reads from sysfs."""
+
+    def test_read_identity(self, sysfs):
+        """Identity and version come from sysfs without opening the node."""
+        info = read_sysfs("/dev/input/event0", str(sysfs))
+
+        assert info.identity.name == "USB Numeric Keypad"
+        assert info.identity.usb_id == "05a4:9759"
+        assert info.identity.phys == "usb-0000:00:14.0-0/input0"
+        assert info.version == 0x110
+        assert "05a4:9759:0110" in info.key
+
+    def test_missing_node(self, sysfs):
+        """Nodes without sysfs entries are not cacheable."""
+        assert read_sysfs("/dev/input/event9", str(sysfs)) is None
+
+
+class TestCacheFile:
+    """Test persistence."""
+
+    def test_round_trip(self, tmp_path):
+        """Saved entries load back."""
+        path = tmp_path / "cache" / "devices.json"
+        cache = CapabilityCache(path)
+        cache.put("a", DeviceCaps(True, True))
+        cache.put("b", DeviceCaps(False, False))
+        cache.save()
+
+        loaded = CapabilityCache(path)
+
+        assert len(loaded) == 2
+        assert loaded.get("a") == DeviceCaps(True, True)
+        assert loaded.get("b") == DeviceCaps(False, False)
+
+    def test_unchanged_cache_not_rewritten(self, tmp_path):
+        """save() is a no-op without changes."""
+        path = tmp_path / "devices.json"
+        cache = CapabilityCache(path)
+        cache.save()
+        assert not path.exists()
+
+    def test_stale_or_corrupt_file_ignored(self, tmp_path):
+        """Unknown versions and bad JSON start an empty cache."""
+        path = tmp_path / "devices.json"
+        path.write_text(json.dumps({"version": 0, "devices": {"a": {"keys": True}}}))
+        assert len(CapabilityCache(path)) == 0
+        path.write_text("{not json")
+        assert len(CapabilityCache(path)) == 0
+
+    def test_default_path_honours_xdg(self, tmp_path, monkeypatch):
+        """The cache lives under XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_path() == tmp_path / "mouse-on-numpad" / "devices.json"
+
+
+class TestCachedScan:
+    """Test find_keyboards() with a cache."""
+
+    def _scan(self, sysfs, cache_path):
+        paths = [f"/dev/input/{node}" for node in DEVICES]
+        opener = MagicMock(side_effect=_open_device)
+        with patch.object(keyboard_capture.evdev, "list_devices", return_value=paths):
+            with patch.object(keyboard_capture.evdev, "InputDevice", opener):
+                with patch.object(
+                    keyboard_capture, "read_sysfs", lambda path: read_sysfs(path, str(sysfs))
+                ):
+                    capture = KeyboardCapture(
+                        ErrorLogger(console_output=False), cache=CapabilityCache(cache_path)
+                    )
+                    try:
+                        found = capture.find_keyboards()
+                    finally:
+                        capture.close()
+        return found, [call.args[0] for call in opener.call_args_list]
+
+    def test_first_scan_probes_everything(self, sysfs, tmp_path):
+        """With an empty cache every device is opened, and the facts are saved."""
+        cache_path = tmp_path / "devices.json"
+
+        found, opened = self._scan(sysfs, cache_path)
+
+        assert [dev.name for dev in found] == ["USB Numeric Keypad"]
+        assert sorted(opened) == [f"/dev/input/{node}" for node in DEVICES]
+        assert len(CapabilityCache(cache_path)) == 3
+
+    def test_second_scan_opens_only_wanted(self, sysfs, tmp_path):
+        """Cached non-keyboards are skipped without being opened."""
+        cache_path = tmp_path / "devices.json"
+        self._scan(sysfs, cache_path)
+
+        found, opened = self._scan(sysfs, cache_path)
+
+        assert [dev.name for dev in found] == ["USB Numeric Keypad"]
+        assert opened == ["/dev/input/event0"]
+
+    def test_changed_device_is_reprobed(self, sysfs, tmp_path):
+        """A new version (e.g. firmware update) misses the cache."""
+        cache_path = tmp_path / "devices.json"
+        self._scan(sysfs, cache_path)
+        (sysfs / "event1" / "device" / "id" / "version").write_text("0111\n")
+
+        _, opened = self._scan(sysfs, cache_path)
+
+        assert sorted(opened) == ["/dev/input/event0", "/dev/input/event1"]
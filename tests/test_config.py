@@ -3,6 +3,8 @@
 import json
 import os
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -146,6 +148,55 @@ class TestConfigManager:
         assert config.get("movement.base_speed") == 42
 
 
+class TestConfigSnapshots:
+    """Test versioned MovementParams/ScrollParams snapshots."""
+
+    def test_snapshot_reflects_config(self, temp_config_dir: Path):
+        """Snapshots expose typed values with derived fields."""
+        config = ConfigManager(config_dir=temp_config_dir)
+        params = config.movement_params
+        assert params.base_speed == 5
+        assert params.max_mult == pytest.approx(40 / 5)
+        assert params.move_delay == pytest.approx(0.02)
+
+        scroll = config.scroll_params
+        assert scroll.step == 3
+        assert scroll.delay == pytest.approx(0.03)
+
+    def test_snapshot_is_immutable(self, temp_config_dir: Path):
+        """Snapshots cannot be mutated and have no instance dict."""
+        config = ConfigManager(config_dir=temp_config_dir)
+        params = config.movement_params
+        with pytest.raises(AttributeError):
+            params.base_speed = 99  # type: ignore[misc]
+        assert not hasattr(params, "__dict__")
+
+    def test_snapshot_cached_until_version_changes(self, temp_config_dir: Path):
+        """Same object returned until set/reload bumps the version."""
+        config = ConfigManager(config_dir=temp_config_dir)
+        version = config.version
+        first = config.movement_params
+        assert config.movement_params is first
+
+        config.set("movement.base_speed", 20)
+        assert config.version > version
+        second = config.movement_params
+        assert second is not first
+        assert second.base_speed == 20
+
+        version = config.version
+        config.reload()
+        assert config.version > version
+
+    def test_zero_step_guarded(self, temp_config_dir: Path):
+        """Invalid divisors fall back to a multiplier cap of 1.0."""
+        config = ConfigManager(config_dir=temp_config_dir)
+        config.set("scroll.step", 0)
+        config.set("movement.base_speed", 0)
+        assert config.scroll_params.max_mult == 1.0
+        assert config.movement_params.max_mult == 1.0
+
+
 class TestConfigProfiles:
     """Test profile management functionality."""
 
@@ -256,3 +307,125 @@ class TestConfigProfiles:
         # Load fast
         config.load_profile("fast")
         assert config.get("movement.base_speed") == 50
+
+
+class TestWriteBehind:
+    """Test coalesced (write-behind) persistence."""
+
+    def _read(self, config: ConfigManager) -> dict:
+        with open(config.config_file) as f:
+            return json.load(f)
+
+    def test_changes_held_until_flush(self, temp_config_dir: Path):
+        """set() updates memory at once and the file only on flush()."""
+        config = ConfigManager(config_dir=temp_config_dir, write_delay=60.0)
+        for speed in range(10, 60):
+            config.set("movement.base_speed", speed)
+
+        assert config.get("movement.base_speed") == 59
+        assert config.pending
+        assert self._read(config)["movement"]["base_speed"] == 5
+
+        config.flush()
+
+        assert not config.pending
+        assert self._read(config)["movement"]["base_speed"] == 59
+
+    def test_timer_writes_once(self, temp_config_dir: Path, monkeypatch):
+        """Changes within one window are written by a single save."""
+        config = ConfigManager(config_dir=temp_config_dir, write_delay=0.05)
+        saves = []
+        saved = threading.Event()
+        save = config._save
+
+        def counting_save():
+            saves.append(1)
+            save()
+            saved.set()
+
+        monkeypatch.setattr(config, "_save", counting_save)
+
+        for speed in range(10, 30):
+            config.set("movement.base_speed", speed)
+
+        assert saved.wait(2.0)
+        time.sleep(0.1)  # Two more windows: nothing left to write
+        assert len(saves) == 1
+        assert self._read(config)["movement"]["base_speed"] == 29
+
+    def test_backup_once_per_flush(self, temp_config_dir: Path):
+        """The backup holds the file as it was before the flushed window."""
+        config = ConfigManager(config_dir=temp_config_dir, write_delay=60.0)
+        config.set("movement.base_speed", 10)
+        config.flush()
+        config.set("movement.base_speed", 20)
+        config.set("movement.base_speed", 30)
+        config.flush()
+
+        backup = config.config_file.with_suffix(".json.bak")
+        assert json.loads(backup.read_text())["movement"]["base_speed"] == 10
+
+    def test_atomic_write_leaves_no_temp_files(self, temp_config_dir: Path):
+        """Saves replace config.json by rename and keep 0600 permissions."""
+        config = ConfigManager(config_dir=temp_config_dir, write_delay=60.0)
+        inode = os.stat(config.config_file).st_ino
+        config.set("test", "value")
+        config.flush()
+
+        assert sorted(p.name for p in temp_config_dir.iterdir()) == [
+            "config.json",
+            "config.json.bak",
+        ]
+        assert os.stat(config.config_file).st_ino != inode
+        assert os.stat(config.config_file).st_mode & 0o777 == 0o600
+        assert not config.changed_on_disk()
+
+    def test_flush_without_changes_is_noop(self, temp_config_dir: Path):
+        """flush() with nothing pending does not touch the file."""
+        config = ConfigManager(config_dir=temp_config_dir, write_delay=60.0)
+        before = os.stat(config.config_file).st_mtime_ns
+
+        config.flush()
+
+        assert os.stat(config.config_file).st_mtime_ns == before
+
+    def test_pending_edits_survive_reload(self, temp_config_dir: Path):
+        """A reload inside the window keeps unsaved edits on top of the file."""
+        config = ConfigManager(config_dir=temp_config_dir, write_delay=60.0)
+        config.set("movement.base_speed", 40)
+        data = self._read(config)
+        data["scroll"]["step"] = 7
+        config.config_file.write_text(json.dumps(data) + " ")
+
+        assert config.reload_if_changed()
+
+        assert config.get("movement.base_speed") == 40
+        assert config.get("scroll.step") == 7
+        assert config.pending
+        config.flush()
+        assert self._read(config)["movement"]["base_speed"] == 40
+        assert self._read(config)["scroll"]["step"] == 7
+
+    def test_pending_reset_not_undone_by_reload(self, temp_config_dir: Path):
+        """An unsaved reset() wins over the file it is about to replace."""
+        config = ConfigManager(config_dir=temp_config_dir, write_delay=60.0)
+        config.set("movement.base_speed", 40)
+        config.flush()
+        config.reset()
+        config.config_file.write_text(config.config_file.read_text() + " ")
+
+        assert not config.reload_if_changed()
+
+        assert config.get("movement.base_speed") == 5
+        config.flush()
+        assert self._read(config)["movement"]["base_speed"] == 5
+
+    def test_edits_do_not_leak_into_defaults(self, temp_config_dir: Path):
+        """Sections filled in from defaults are copies, not DEFAULT_CONFIG itself."""
+        from mouse_on_numpad.core.config_defaults import DEFAULT_CONFIG
+
+        (temp_config_dir / "config.json").write_text("{}")
+        config = ConfigManager(config_dir=temp_config_dir)
+        config.set("audio.volume", 1)
+
+        assert DEFAULT_CONFIG["audio"]["volume"] == 50
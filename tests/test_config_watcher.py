@@ -0,0 +1,168 @@
+"""Tests for ConfigWatcher change-driven reloads."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mouse_on_numpad.core.config import ConfigManager
+from mouse_on_numpad.core.config_watcher import ConfigWatcher
+
+
+@pytest.fixture
+def config(tmp_path: Path):
+    """Create ConfigManager in an isolated temp directory."""
+    return ConfigManager(config_dir=tmp_path)
+
+
+def _write_external(config: ConfigManager, base_speed: int) -> None:
+    """Modify config.json as another process would."""
+    data = json.loads(config.config_file.read_text())
+    data["movement"]["base_speed"] = base_speed
+    data["padding"] = "x" * base_speed  # Guarantee a size change
+    config.config_file.write_text(json.dumps(data))
+
+
+def test_no_reload_when_unchanged(config):
+    """check() only stats the file; unchanged files are not re-read."""
+    watcher = ConfigWatcher(config)
+    callback = MagicMock()
+    watcher.subscribe(callback)
+    version = config.version
+
+    assert watcher.check() is False
+    callback.assert_not_called()
+    assert config.version == version
+
+
+def test_own_writes_not_reported(config):
+    """set() records the new file signature so it is not seen as external."""
+    watcher = ConfigWatcher(config)
+    config.set("movement.base_speed", 12)
+    assert config.changed_on_disk() is False
+    assert watcher.check() is False
+
+
+def test_external_change_reloads_and_notifies(config):
+    """External edits are reloaded and subscribers get the ConfigManager."""
+    watcher = ConfigWatcher(config)
+    callback = MagicMock()
+    watcher.subscribe(callback)
+
+    _write_external(config, 33)
+
+    assert watcher.check() is True
+    callback.assert_called_once_with(config)
+    assert config.get("movement.base_speed") == 33
+    assert config.movement_params.base_speed == 33
+
+
+def test_corrupt_file_keeps_last_good_config(config):
+    """A half-written file is not reloaded and is never overwritten."""
+    watcher = ConfigWatcher(config)
+    _write_external(config, 33)
+    watcher.check()
+    config.config_file.write_text('{"movement": {"base_')
+
+    assert watcher.check() is False
+    assert config.get("movement.base_speed") == 33
+    assert config.config_file.read_text() == '{"movement": {"base_'
+    assert watcher.check() is False  # Not re-read until it changes again
+
+
+def test_missing_file_keeps_last_good_config(config):
+    """A file deleted mid-save (before the rename) is not recreated."""
+    watcher = ConfigWatcher(config)
+    config.config_file.unlink()
+
+    assert watcher.check() is False
+    assert config.get("movement.base_speed") == 5
+    assert not config.config_file.exists()
+
+
+def test_write_during_read_picked_up_next_check(config):
+    """The signature is taken before reading, so a racing write is not lost."""
+    watcher = ConfigWatcher(config)
+    _write_external(config, 33)
+    real_load = json.load
+
+    def load_then_write(f):
+        data = real_load(f)
+        _write_external(config, 55)  # Lands after the read
+        return data
+
+    with patch("mouse_on_numpad.core.config.json.load", side_effect=load_then_write):
+        assert watcher.check() is True
+    assert config.get("movement.base_speed") == 33
+
+    assert watcher.check() is True
+    assert config.get("movement.base_speed") == 55
+
+
+def test_failing_callback_does_not_block_others(config):
+    """A raising subscriber does not prevent later subscribers."""
+    watcher = ConfigWatcher(config)
+    bad = MagicMock(side_effect=RuntimeError("boom"))
+    good = MagicMock()
+    watcher.subscribe(bad)
+    watcher.subscribe(good)
+
+    _write_external(config, 21)
+    watcher.check()
+
+    good.assert_called_once()
+
+
+def test_unsubscribe(config):
+    """Unsubscribed callbacks are not notified."""
+    watcher = ConfigWatcher(config)
+    callback = MagicMock()
+    watcher.subscribe(callback)
+    watcher.unsubscribe(callback)
+
+    _write_external(config, 17)
+    watcher.check()
+
+    callback.assert_not_called()
+
+
+def test_background_thread_picks_up_change(config):
+    """The watcher thread reloads without any caller polling."""
+    watcher = ConfigWatcher(config, interval=0.01)
+    callback = MagicMock()
+    watcher.subscribe(callback)
+    watcher.start()
+    try:
+        _write_external(config, 44)
+        deadline = time.monotonic() + 2.0
+        while not callback.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    callback.assert_called_once_with(config)
+    assert config.get("movement.base_speed") == 44
+
+
+def test_run_async_picks_up_change(config):
+    """run_async() polls from the event loop until cancelled."""
+    watcher = ConfigWatcher(config, interval=0.01)
+    callback = MagicMock()
+    watcher.subscribe(callback)
+
+    async def watch() -> None:
+        task = asyncio.create_task(watcher.run_async())
+        _write_external(config, 45)
+        for _ in range(200):
+            if callback.called:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(watch())
+
+    callback.assert_called_once_with(config)
+    assert config.get("movement.base_speed") == 45
@@ -0,0 +1,91 @@
+"""Tests for the daemon control socket."""
+
+import socket
+
+import pytest
+
+from mouse_on_numpad.core.control_channel import ControlError, ControlServer, send_command
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Serve a small command table on a temporary socket."""
+    calls = []
+
+    def echo(args):
+        calls.append(args)
+        return {"args": args}
+
+    def fail(args):
+        raise ValueError("usage: fail")
+
+    def crash(args):
+        raise RuntimeError("boom")
+
+    srv = ControlServer({"echo": echo, "fail": fail, "crash": crash}, tmp_path / "control.sock")
+    assert srv.start()
+    srv.calls = calls
+    yield srv
+    srv.close()
+
+
+def test_round_trip(server):
+    """A request reaches its handler and the result comes back."""
+    assert send_command("echo", "10", "-5", path=server.path) == {"args": ["10", "-5"]}
+    assert server.calls == [["10", "-5"]]
+    assert server.requests == 1
+
+
+def test_commands_are_case_insensitive(server):
+    """Command names match regardless of case."""
+    assert send_command("ECHO", path=server.path) == {"args": []}
+
+
+def test_bad_arguments_rejected(server):
+    """A handler's ValueError becomes the error message."""
+    with pytest.raises(ControlError, match="usage: fail"):
+        send_command("fail", path=server.path)
+
+
+def test_unknown_command_rejected(server):
+    """Unknown commands are reported, not ignored."""
+    with pytest.raises(ControlError, match="unknown command"):
+        send_command("nope", path=server.path)
+
+
+def test_handler_crash_keeps_serving(server):
+    """A failing handler answers with an error and the server keeps going."""
+    with pytest.raises(ControlError, match="RuntimeError"):
+        send_command("crash", path=server.path)
+    assert send_command("echo", path=server.path) == {"args": []}
+
+
+def test_several_requests_on_one_connection(server):
+    """Scripts can keep a connection open and pipeline requests."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(2.0)
+        sock.connect(str(server.path))
+        sock.sendall(b"echo a\necho b\n")
+        data = b""
+        while data.count(b"\n") < 2:
+            data += sock.recv(4096)
+
+    assert data.splitlines() == [
+        b'{"ok":true,"args":["a"]}',
+        b'{"ok":true,"args":["b"]}',
+    ]
+
+
+def test_daemon_not_running(tmp_path):
+    """Connecting without a daemon raises ControlError."""
+    with pytest.raises(ControlError, match="not running"):
+        send_command("status", path=tmp_path / "missing.sock")
+
+
+def test_close_removes_socket(tmp_path):
+    """Closing the server unlinks its socket."""
+    srv = ControlServer({}, tmp_path / "control.sock")
+    srv.start()
+    srv.close()
+
+    assert not srv.path.exists()
@@ -0,0 +1,119 @@
+"""Tests for control socket commands."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mouse_on_numpad.daemon.control_commands import ControlCommands
+
+
+@pytest.fixture
+def state():
+    """Mouse mode state stand-in."""
+    return MagicMock(is_enabled=False)
+
+
+@pytest.fixture
+def commands(state):
+    """Create ControlCommands over mocked daemon callbacks."""
+    def toggle():
+        state.is_enabled = not state.is_enabled
+
+    return ControlCommands(
+        state=state,
+        mouse=MagicMock(),
+        toggle=MagicMock(side_effect=toggle),
+        status=MagicMock(return_value={"enabled": False}),
+        load_slot=MagicMock(),
+        reload=MagicMock(),
+        stats=MagicMock(return_value={"capture": {}}),
+    )
+
+
+def test_handler_table(commands):
+    """Every protocol command has a handler."""
+    assert set(commands.handlers) == {
+        "toggle", "status", "move", "click", "slot", "reload", "stats"
+    }
+
+
+def test_toggle_flips(commands, state):
+    """toggle without arguments flips mouse mode."""
+    assert commands.toggle([]) == {"enabled": True}
+    assert commands.toggle([]) == {"enabled": False}
+
+
+def test_toggle_on_is_idempotent(commands, state):
+    """toggle on/off only acts when the mode differs."""
+    commands.toggle(["on"])
+    commands.toggle(["on"])
+
+    assert commands._toggle.call_count == 1
+    assert commands.toggle(["off"]) == {"enabled": False}
+
+
+def test_move_and_click(commands):
+    """move and click reach the mouse controller."""
+    commands.move(["10", "-5"])
+    commands.click(["right"])
+    commands.click([])
+
+    commands._mouse.move.assert_called_once_with(10, -5)
+    assert [c.args for c in commands._mouse.click.call_args_list] == [("right",), ("left",)]
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("move", ["10"]),
+        ("move", ["a", "b"]),
+        ("click", ["side"]),
+        ("slot", ["0"]),
+        ("slot", ["x"]),
+        ("toggle", ["maybe"]),
+    ],
+)
+def test_bad_arguments(commands, name, args):
+    """Malformed arguments raise ValueError (reported to the client)."""
+    with pytest.raises(ValueError):
+        commands.handlers[name](args)
+
+
+def test_slot_jumps(commands):
+    """slot N moves to the saved position."""
+    commands.slot(["3"])
+
+    commands._load_slot.assert_called_once_with(3)
+
+
+def test_stats_include_uptime(commands):
+    """stats adds daemon uptime to the collected statistics."""
+    stats = commands.stats([])
+
+    assert stats["uptime"] >= 0.0
+    assert stats["capture"] == {}
+
+
+def test_state_changing_commands_go_through_call(state):
+    """With call set, only status and stats run on the server thread."""
+    calls = []
+
+    def call(func, *args):
+        calls.append(func.__name__)
+        return func(*args)
+
+    commands = ControlCommands(
+        state=state,
+        mouse=MagicMock(),
+        toggle=MagicMock(),
+        status=MagicMock(return_value={}),
+        load_slot=MagicMock(),
+        reload=MagicMock(),
+        stats=MagicMock(return_value={}),
+        call=call,
+    )
+    for name, args in [("move", ["1", "2"]), ("click", []), ("slot", ["1"]),
+                       ("reload", []), ("toggle", []), ("status", []), ("stats", [])]:
+        commands.handlers[name](args)
+
+    assert calls == ["move", "click", "slot", "reload", "toggle"]
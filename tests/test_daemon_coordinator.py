@@ -2,12 +2,16 @@
 
 from unittest.mock import MagicMock, Mock, patch, call
 import signal
+import threading
 import pytest
 
 from mouse_on_numpad.core.config import ConfigManager
 from mouse_on_numpad.core.state_manager import StateManager
 from mouse_on_numpad.core.error_logger import ErrorLogger
 from mouse_on_numpad.daemon.daemon_coordinator import Daemon
+from mouse_on_numpad.daemon.keyboard_capture import KeyboardCapture
+
+from .test_keyboard_capture import EV_KEY, EV_SYN, FakeDevice, _fake_uinput, _start
 
 
 @pytest.fixture
@@ -55,8 +59,6 @@ def test_daemon_init(daemon, config, state, logger):
     assert daemon.logger is logger
     assert daemon._running is False
     assert daemon._held_buttons == set()
-    assert daemon._save_mode == {"active": False}
-    assert daemon._load_mode == {"active": False}
 
 
 def test_daemon_toggle_mode_enables(daemon, state):
@@ -72,7 +74,28 @@ def test_daemon_toggle_mode_enables(daemon, state):
 
     assert state.is_enabled is True
     daemon.tray.update.assert_called_once_with(True)
-    daemon.ipc.write_status.assert_called_once_with(True)
+    assert daemon.ipc.publish_status.call_args.kwargs["enabled"] is True
+
+
+def test_status_reports_configured_base_speed(daemon):
+    """The status field is named for what it is: the configured base speed."""
+    params = MagicMock(base_speed=17)
+    with patch.object(ConfigManager, "movement_params", new=params):
+        status = daemon._status()
+
+    assert status["base_speed"] == 17
+    assert "speed" not in status
+
+
+def test_status_bar_settings_published(daemon, config):
+    """The indicator's appearance is pushed with the status, as a copy."""
+    daemon.ipc = MagicMock()
+
+    daemon._publish_status()
+
+    status_bar = daemon.ipc.publish_status.call_args.kwargs["status_bar"]
+    assert status_bar == config.get("status_bar")
+    assert status_bar is not config.get("status_bar")  # In-place edits still differ
 
 
 def test_daemon_toggle_mode_disables(daemon, state):
@@ -107,32 +130,20 @@ def test_reload_hotkeys(daemon):
     daemon.hotkeys = MagicMock()
     daemon.movement = MagicMock()
     daemon.scroll = MagicMock()
-    daemon._save_mode["active"] = True
-    daemon._load_mode["active"] = True
 
     daemon.reload_hotkeys()
 
-    assert daemon._save_mode["active"] is False
-    assert daemon._load_mode["active"] is False
     daemon.hotkeys.reload_hotkeys.assert_called_once()
 
 
-def test_handle_key_delegates_to_hotkeys(daemon):
-    """Test _handle_key delegates to hotkey dispatcher."""
-    daemon.hotkeys = MagicMock()
-    daemon.hotkeys.handle_key.return_value = True
-    daemon.state = MagicMock()
-    daemon.mouse = MagicMock()
-    daemon.movement = MagicMock()
-    daemon.scroll = MagicMock()
-    daemon.tray = MagicMock()
-    daemon.ipc = MagicMock()
-    daemon.position_mgr = MagicMock()
-
-    result = daemon._handle_key(42, True)
+def test_hotkeys_bound_to_daemon_components(daemon):
+    """The dispatcher is bound once with the components its handlers drive."""
+    kwargs = daemon.hotkeys.bind.call_args.kwargs
 
-    daemon.hotkeys.handle_key.assert_called_once()
-    assert result is True
+    assert kwargs["state"] is daemon.state
+    assert kwargs["movement"] is daemon.movement
+    assert kwargs["scroll"] is daemon.scroll
+    assert kwargs["held_buttons"] is daemon._held_buttons
 
 
 def test_daemon_start_no_devices(daemon):
@@ -197,25 +208,67 @@ def test_daemon_stop_cleans_up(daemon):
     daemon.scroll.stop_all.assert_called_once()
     daemon.tray.stop.assert_called_once()
     daemon.ipc.stop_indicator.assert_called_once()
-    daemon.ipc.cleanup_status_file.assert_called_once()
-    mock_device.close.assert_called_once()
+    daemon.ipc.close_status.assert_called_once()
+    # Devices belong to the capture loop, which restores and closes them
+    mock_device.close.assert_not_called()
 
 
-def test_daemon_stop_handles_device_close_error(daemon):
-    """Test daemon stop handles device close errors gracefully."""
-    daemon._running = True
+class _ClosableDevice(FakeDevice):
+    """FakeDevice whose repeat ioctl fails once closed, like a real node."""
+
+    closed = False
+
+    @property
+    def repeat(self) -> tuple[int, int]:
+        return self._repeat
+
+    @repeat.setter
+    def repeat(self, value: tuple[int, int]) -> None:
+        if self.closed:
+            raise OSError(9, "Bad file descriptor")
+        self._repeat = value
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+def test_stop_restores_keyboard_repeat(daemon):
+    """Stopping from the capture thread (SIGINT) still restores autorepeat."""
+    device = _ClosableDevice("numpad")
     daemon.tray = MagicMock()
     daemon.ipc = MagicMock()
     daemon.movement = MagicMock()
     daemon.scroll = MagicMock()
-    mock_device = MagicMock()
-    mock_device.close.side_effect = OSError("Device error")
-    daemon._devices = [mock_device]
+    with patch("mouse_on_numpad.daemon.keyboard_capture.evdev.UInput") as uinput:
+        uinput.from_device.side_effect = _fake_uinput
+        daemon.keyboard = KeyboardCapture(ErrorLogger(console_output=False))
+        daemon.keyboard.set_repeat(200, 40)
+        daemon._devices = [device]
+        # The threaded runtime's signal handler runs stop() on the capture thread
+        thread = _start(daemon.keyboard, [device], lambda code, pressed: daemon.stop() or True)
+        assert device.repeat == (200, 25)
 
-    # Should not raise
-    daemon.stop()
+        device.push((EV_KEY, 30, 1), (EV_SYN, 0, 0))
+        thread.join(timeout=2)
 
-    assert daemon._running is False
+    assert not thread.is_alive()
+    assert device.repeat == (250, 33)
+    assert device.closed
+    daemon.keyboard.close()
+
+
+def test_capture_closed_after_loop_returns(daemon):
+    """start() releases the wake pipe and hotplug watch once the loop exits."""
+    daemon.keyboard.find_keyboards.return_value = [MagicMock()]
+    daemon.config_watcher = MagicMock()
+    daemon.control = MagicMock()
+    with patch("mouse_on_numpad.daemon.daemon_coordinator.signal.signal"):
+        daemon.start()
+
+    names = [name for name, *_ in daemon.keyboard.method_calls]
+    assert names.index("close") > names.index("run")
+    assert names.count("close") == 1
 
 
 def test_daemon_without_explicit_dependencies(config, state, logger):
@@ -238,3 +291,62 @@ def test_daemon_without_explicit_dependencies(config, state, logger):
                                                             assert daemon.config is not None
                                                             assert daemon.state is not None
                                                             assert daemon.logger is not None
+
+
+def test_config_change_refreshes_controllers(daemon):
+    """Config watcher callback refreshes snapshots without touching hotkeys."""
+    daemon.hotkeys = MagicMock()
+    daemon.hotkeys.apply_config.return_value = False
+    daemon.movement = MagicMock()
+    daemon.scroll = MagicMock()
+    daemon.keyboard.call.side_effect = lambda func, *args: func(*args)
+
+    daemon._on_config_changed(daemon.config)
+
+    daemon.movement.reload_params.assert_called_once()
+    daemon.scroll.reload_params.assert_called_once()
+    daemon.keyboard.call.assert_called_once_with(daemon._apply_config)
+    daemon.hotkeys.apply_config.assert_called_once()
+
+
+def test_config_change_applied_on_capture_thread(daemon):
+    """Hotkey and capture settings from a watcher reload change on the capture loop."""
+    device = FakeDevice("numpad")
+    threads = []
+    daemon.hotkeys = MagicMock()
+    daemon.hotkeys.apply_config.side_effect = lambda *_: threads.append(threading.get_ident())
+    daemon.ipc = MagicMock()
+    with patch("mouse_on_numpad.daemon.keyboard_capture.evdev.UInput") as uinput:
+        uinput.from_device.side_effect = _fake_uinput
+        daemon.keyboard = KeyboardCapture(ErrorLogger(console_output=False))
+        capture_thread = _start(daemon.keyboard, [device], lambda code, pressed: True)
+
+        watcher = threading.Thread(target=daemon._on_config_changed, args=(daemon.config,))
+        watcher.start()
+        watcher.join(timeout=2)
+        daemon.keyboard.stop()
+        capture_thread.join(timeout=2)
+    daemon.keyboard.close()
+    device.close()
+
+    assert threads == [capture_thread.ident]
+
+
+def test_slow_components_built_in_background(daemon):
+    """Monitors, position memory and audio come from background stages."""
+    daemon.startup.wait()
+
+    assert daemon.monitors is not None
+    assert daemon.positions is not None
+    assert daemon.audio is not None
+    assert {"mouse", "monitors", "positions", "audio"} <= set(daemon.startup.durations)
+
+
+def test_position_hotkeys_without_position_memory(daemon, capsys):
+    """A failed position stage disables position hotkeys instead of crashing."""
+    daemon.startup.get = Mock(return_value=None)
+
+    daemon._load_position(1)
+    daemon._cycle_monitor()
+
+    assert "Position memory unavailable" in capsys.readouterr().out
@@ -0,0 +1,60 @@
+"""Tests for inotify-based device hotplug notifications."""
+
+import os
+
+import pytest
+
+from mouse_on_numpad.daemon.device_monitor import DeviceMonitor
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    """Watch a temp directory standing in for /dev/input."""
+    mon = DeviceMonitor.create(str(tmp_path))
+    if mon is None:
+        pytest.skip("inotify unavailable")
+    yield mon
+    mon.close()
+
+
+def test_no_changes_when_idle(monitor):
+    """Reading with nothing pending returns immediately."""
+    assert monitor.read_changes() == []
+
+
+def test_reports_added_and_removed_nodes(monitor, tmp_path):
+    """Creating and deleting eventN nodes is reported in order."""
+    node = tmp_path / "event7"
+    node.touch()
+    os.chmod(node, 0o660)  # udev adjusting permissions (IN_ATTRIB)
+    node.unlink()
+
+    changes = monitor.read_changes()
+
+    path = str(node)
+    assert changes[0] == (path, True)
+    assert (path, True) in changes[1:-1]
+    assert changes[-1] == (path, False)
+
+
+def test_ignores_other_nodes(monitor, tmp_path):
+    """Only eventN nodes matter (not mouseN, jsN, by-id links...)."""
+    (tmp_path / "mouse0").touch()
+    (tmp_path / "js0").touch()
+    assert monitor.read_changes() == []
+
+
+def test_fd_becomes_readable(monitor, tmp_path):
+    """The fd can be multiplexed by the capture loop."""
+    import selectors
+
+    with selectors.DefaultSelector() as sel:
+        sel.register(monitor.fileno(), selectors.EVENT_READ)
+        assert sel.select(0) == []
+        (tmp_path / "event3").touch()
+        assert len(sel.select(1.0)) == 1
+
+
+def test_create_fails_for_missing_directory(tmp_path):
+    """A missing directory disables hotplug instead of raising."""
+    assert DeviceMonitor.create(str(tmp_path / "missing")) is None
@@ -0,0 +1,160 @@
+"""Tests for DeviceSelector allowlist matching."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import evdev
+import pytest
+
+from mouse_on_numpad.core.config import ConfigManager
+from mouse_on_numpad.core.error_logger import ErrorLogger
+from mouse_on_numpad.daemon.device_selector import DeviceIdentity, DeviceSelector
+from mouse_on_numpad.daemon.keyboard_capture import KEY_KP8, KeyboardCapture
+
+NUMPAD = DeviceIdentity(
+    bustype=3,
+    vendor=0x05A4,
+    product=0x9759,
+    name="USB Numeric Keypad",
+    phys="usb-0000:00:14.0-2/input0",
+    uniq="NP-001",
+)
+KEYBOARD = DeviceIdentity(
+    bustype=3,
+    vendor=0x046D,
+    product=0xC52B,
+    name="Logitech USB Receiver",
+    phys="usb-0000:00:14.0-1/input0",
+)
+
+
+def _device(identity: DeviceIdentity, keys: list[int]) -> MagicMock:
+    """Create an evdev.InputDevice mock with the given identity and keys."""
+    dev = MagicMock()
+    dev.info = SimpleNamespace(
+        bustype=identity.bustype, vendor=identity.vendor, product=identity.product
+    )
+    dev.name = identity.name
+    dev.phys = identity.phys
+    dev.uniq = identity.uniq
+    dev.capabilities.return_value = {evdev.ecodes.EV_KEY: keys}
+    return dev
+
+
+class TestRules:
+    """Test rule syntax."""
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            "05a4:9759",
+            "05A4:9759",
+            "phys:usb-0000:00:14.0-2/*",
+            "name:*Numeric*",
+            "uniq:NP-*",
+        ],
+    )
+    def test_rule_selects_numpad_only(self, rule):
+        """Each rule kind matches the numpad and not the main keyboard."""
+        selector = DeviceSelector([rule])
+        assert selector.matches(NUMPAD)
+        assert not selector.matches(KEYBOARD)
+
+    def test_no_rules_match_everything(self):
+        """Without an allowlist every device is eligible."""
+        selector = DeviceSelector()
+        assert not selector.has_rules
+        assert selector.matches(KEYBOARD)
+
+    def test_unknown_rule_matches_nothing(self):
+        """Malformed rules never select a device."""
+        selector = DeviceSelector(["bogus", "vendor:05a4", ""])
+        assert selector.rules == ["bogus", "vendor:05a4"]
+        assert not selector.matches(NUMPAD)
+
+    def test_from_config(self, tmp_path):
+        """capture.devices and capture.exclusive are read from config."""
+        config = ConfigManager(config_dir=tmp_path)
+        config.set("capture.devices", ["05a4:9759"])
+        config.set("capture.exclusive", True)
+
+        selector = DeviceSelector.from_config(config)
+
+        assert selector.rules == ["05a4:9759"]
+        assert selector.exclusive is True
+
+    def test_exclusive_without_rules_ignored(self, tmp_path):
+        """exclusive with an empty allowlist does not consume every keyboard."""
+        config = ConfigManager(config_dir=tmp_path)
+        config.set("capture.exclusive", True)
+
+        selector = DeviceSelector.from_config(config)
+
+        assert selector.exclusive is False
+        assert selector.exclusive_ignored is True
+
+    def test_exclusive_ignored_is_logged(self):
+        """KeyboardCapture warns when exclusive is ignored."""
+        logger = MagicMock()
+        KeyboardCapture(logger, DeviceSelector(exclusive=True)).close()
+
+        assert "capture.exclusive ignored" in logger.warning.call_args.args[0]
+
+    def test_identity_from_device(self):
+        """Identity is built from the device's stable attributes."""
+        identity = DeviceIdentity.from_device(_device(NUMPAD, []))
+        assert identity == NUMPAD
+        assert identity.usb_id == "05a4:9759"
+
+
+class TestFindKeyboards:
+    """Test device discovery with a selector."""
+
+    def _find(self, selector, devices):
+        paths = [f"/dev/input/event{i}" for i in range(len(devices))]
+        by_path = dict(zip(paths, devices))
+        with patch("mouse_on_numpad.daemon.keyboard_capture.evdev.list_devices", return_value=paths):
+            with patch(
+                "mouse_on_numpad.daemon.keyboard_capture.evdev.InputDevice",
+                side_effect=lambda path: by_path[path],
+            ):
+                capture = KeyboardCapture(ErrorLogger(console_output=False), selector)
+                try:
+                    return capture.find_keyboards()
+                finally:
+                    capture.close()
+
+    def test_default_selects_numpad_capable(self):
+        """Without rules both keyboards with numpad keys are captured."""
+        numpad = _device(NUMPAD, [KEY_KP8])
+        keyboard = _device(KEYBOARD, [KEY_KP8, 30])
+        assert self._find(DeviceSelector(), [numpad, keyboard]) == [numpad, keyboard]
+
+    def test_allowlist_leaves_other_keyboards_closed(self):
+        """Only the listed device is kept; the others are closed untouched."""
+        numpad = _device(NUMPAD, [KEY_KP8])
+        keyboard = _device(KEYBOARD, [KEY_KP8, 30])
+
+        found = self._find(DeviceSelector(["name:*Numeric*"]), [numpad, keyboard])
+
+        assert found == [numpad]
+        keyboard.close.assert_called_once()
+        keyboard.grab.assert_not_called()
+
+    def test_own_clones_never_selected(self):
+        """Our uinput clones are skipped even when a rule matches their name."""
+        numpad = _device(NUMPAD, [KEY_KP8])
+        clone = _device(
+            DeviceIdentity(
+                bustype=3,
+                vendor=1,
+                product=1,
+                name="mouse-on-numpad-USB Numeric Keypad",
+                phys="py-evdev-uinput",
+            ),
+            [KEY_KP8],
+        )
+
+        assert self._find(DeviceSelector(), [numpad, clone]) == [numpad]
+        assert self._find(DeviceSelector(["name:*Numeric*"]), [numpad, clone]) == [numpad]
+        clone.grab.assert_not_called()
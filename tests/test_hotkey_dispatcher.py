@@ -1,5 +1,6 @@
 """Tests for HotkeyDispatcher."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 import pytest
 
@@ -54,486 +55,346 @@ def dispatcher(config, logger):
         return dispatcher
 
 
+@pytest.fixture
+def ctx():
+    """Mocked components the dispatcher acts on."""
+    return SimpleNamespace(
+        state=MagicMock(is_enabled=True),
+        mouse=MagicMock(),
+        movement=MagicMock(),
+        scroll=MagicMock(),
+        tray=MagicMock(),
+        publish_status=MagicMock(),
+        held_buttons=set(),
+        save_position=MagicMock(),
+        load_position=MagicMock(),
+        cycle_monitor=MagicMock(),
+    )
+
+
+@pytest.fixture
+def bound(dispatcher, ctx):
+    """Dispatcher bound to the mocked components (tables compiled)."""
+    dispatcher.bind(**vars(ctx))
+    return dispatcher
+
+
 def test_dispatcher_init(dispatcher, config, logger):
     """Test HotkeyDispatcher initialization."""
     assert dispatcher.logger is logger
     assert dispatcher._held_keys == set()
+    assert dispatcher.mode == "normal"
 
 
-def test_reload_hotkeys(dispatcher):
+def test_reload_hotkeys(bound):
     """Test reloading hotkeys."""
     movement = MagicMock()
     scroll = MagicMock()
     release_callback = MagicMock()
+    bound.mode = "save"
 
-    dispatcher.reload_hotkeys(movement, scroll, release_callback)
+    bound.reload_hotkeys(movement, scroll, release_callback)
 
     movement.stop_all.assert_called_once()
     scroll.stop_all.assert_called_once()
     release_callback.assert_called_once()
-    dispatcher.keys.reload.assert_called_once()
+    bound.keys.reload.assert_called_once()
+    assert bound.mode == "normal"
+
+
+def test_reload_recompiles_tables(bound, ctx):
+    """New key mappings take effect after a reload."""
+    bound.keys.movement_keys = {30: ("up",)}
+
+    bound.reload_hotkeys(MagicMock(), MagicMock(), MagicMock())
+
+    assert bound.handle_key(30, True) is True
+    ctx.movement.start_direction.assert_called_once_with("up")
+    assert bound.handle_key(72, True) is False
+
 
+def test_apply_config_unchanged_keeps_mode(bound):
+    """A config change that leaves hotkeys alone keeps save/load mode."""
+    bound.keys.is_stale.return_value = False
+    bound.handle_key(55, True)  # Enter save mode
 
-def test_handle_key_toggle_mode_when_disabled(dispatcher):
+    assert bound.apply_config(MagicMock(), MagicMock(), MagicMock()) is False
+    assert bound.mode == "save"
+
+
+def test_apply_config_with_new_hotkeys_resets_mode(bound):
+    """Changed hotkeys leave save/load mode so stale slot keys are not used."""
+    bound.keys.is_stale.return_value = True
+    bound.handle_key(55, True)  # Enter save mode
+
+    assert bound.apply_config(MagicMock(), MagicMock(), MagicMock()) is True
+    bound.keys.refresh.assert_called_once()
+    assert bound.mode == "normal"
+
+
+def test_handle_key_toggle_mode_when_disabled(bound, ctx):
     """Test toggling mouse mode on when disabled."""
-    state = MagicMock(is_enabled=False)
-    state.toggle.return_value = True  # Enable
-    mouse = MagicMock()
-    movement = MagicMock()
-    scroll = MagicMock()
-    tray = MagicMock()
-    write_status = MagicMock()
-    held_buttons = set()
-    save_mode = {"active": False}
-    load_mode = {"active": False}
-
-    result = dispatcher.handle_key(
-        KEY_KP_PLUS,  # Toggle key
-        True,  # Pressed
-        state,
-        mouse,
-        movement,
-        scroll,
-        tray,
-        write_status,
-        held_buttons,
-        save_mode,
-        load_mode,
-        MagicMock(),  # save_position_callback
-        MagicMock(),  # load_position_callback
-        MagicMock(),  # cycle_monitor_callback
-    )
+    ctx.state.is_enabled = False
+    ctx.state.toggle.return_value = True  # Enable
+
+    result = bound.handle_key(KEY_KP_PLUS, True)
 
     assert result is True  # Key should be suppressed
-    state.toggle.assert_called_once()
-    tray.update.assert_called_once_with(True)
-    write_status.assert_called_once_with(True)
+    ctx.state.toggle.assert_called_once()
+    ctx.tray.update.assert_called_once_with(True)
+    ctx.publish_status.assert_called_once()
 
 
-def test_handle_key_toggle_mode_when_enabled(dispatcher):
+def test_handle_key_toggle_mode_when_enabled(bound, ctx):
     """Test toggling mouse mode off when enabled."""
-    state = MagicMock(is_enabled=True)
-    state.toggle.return_value = False  # Disable
-    mouse = MagicMock()
-    movement = MagicMock()
-    scroll = MagicMock()
-    tray = MagicMock()
-    write_status = MagicMock()
-    held_buttons = {"left"}
-    save_mode = {"active": False}
-    load_mode = {"active": False}
-
-    result = dispatcher.handle_key(
-        KEY_KP_PLUS,
-        True,
-        state,
-        mouse,
-        movement,
-        scroll,
-        tray,
-        write_status,
-        held_buttons,
-        save_mode,
-        load_mode,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    ctx.state.toggle.return_value = False  # Disable
+    ctx.held_buttons.add("left")
+
+    result = bound.handle_key(KEY_KP_PLUS, True)
 
     assert result is True
-    movement.stop_all.assert_called_once()
-    scroll.stop_all.assert_called_once()
-    assert held_buttons == set()
-    mouse.release.assert_called_once_with("left")
+    ctx.movement.stop_all.assert_called_once()
+    ctx.scroll.stop_all.assert_called_once()
+    assert ctx.held_buttons == set()
+    ctx.mouse.release.assert_called_once_with("left")
 
 
-def test_handle_key_alt_modifier(dispatcher):
+def test_toggle_release_passes_through(bound, ctx):
+    """Only the toggle press is consumed."""
+    assert bound.handle_key(KEY_KP_PLUS, False) is False
+    ctx.state.toggle.assert_not_called()
+
+
+def test_handle_key_alt_modifier(bound, ctx):
     """Test Alt modifier key tracking."""
-    state = MagicMock(is_enabled=False)
-    mouse = MagicMock()
-
-    # Press Alt
-    result = dispatcher.handle_key(
-        KEY_LEFTALT,
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    ctx.state.is_enabled = False
+
+    result = bound.handle_key(KEY_LEFTALT, True)
 
     assert result is False  # Don't suppress modifier keys
-    assert KEY_LEFTALT in dispatcher._held_keys
-
-    # Release Alt
-    result = dispatcher.handle_key(
-        KEY_LEFTALT,
-        False,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    assert KEY_LEFTALT in bound._held_keys
+
+    result = bound.handle_key(KEY_LEFTALT, False)
 
     assert result is False
-    assert KEY_LEFTALT not in dispatcher._held_keys
+    assert KEY_LEFTALT not in bound._held_keys
 
 
-def test_handle_key_ignores_non_toggle_when_disabled(dispatcher):
+def test_handle_key_ignores_non_toggle_when_disabled(bound, ctx):
     """Test that non-toggle keys are ignored when disabled."""
-    state = MagicMock(is_enabled=False)
-    mouse = MagicMock()
-
-    # Try to move
-    result = dispatcher.handle_key(
-        KEY_UP,
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    ctx.state.is_enabled = False
+
+    result = bound.handle_key(KEY_UP, True)
 
     assert result is False  # Key not suppressed, passed through
+    ctx.movement.start_direction.assert_not_called()
 
 
-def test_handle_key_movement(dispatcher):
+def test_handle_key_movement(bound, ctx):
     """Test movement key handling."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    movement = MagicMock()
-
-    # Start moving up (using keycode 72)
-    result = dispatcher.handle_key(
-        72,  # KEY_UP
-        True,
-        state,
-        mouse,
-        movement,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    result = bound.handle_key(KEY_UP, True)
 
     assert result is True  # Key suppressed
-    movement.start_direction.assert_called_once_with("up")
-
-    # Stop moving up
-    movement.reset_mock()
-    result = dispatcher.handle_key(
-        72,  # KEY_UP
-        False,
-        state,
-        mouse,
-        movement,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    ctx.movement.start_direction.assert_called_once_with("up")
+
+    result = bound.handle_key(KEY_UP, False)
 
     assert result is True
-    movement.stop_direction.assert_called_once_with("up")
+    ctx.movement.stop_direction.assert_called_once_with("up")
+
+
+def test_handle_key_diagonal_movement(dispatcher, ctx):
+    """A key bound to two directions starts and stops both."""
+    dispatcher.keys.movement_keys = {71: ("up", "left")}
+    dispatcher.keys.scroll_keys = {}
+    dispatcher.bind(**vars(ctx))
 
+    dispatcher.handle_key(71, True)
+    dispatcher.handle_key(71, False)
 
-def test_handle_key_click(dispatcher):
+    assert [c.args for c in ctx.movement.start_direction.call_args_list] == [("up",), ("left",)]
+    assert [c.args for c in ctx.movement.stop_direction.call_args_list] == [("up",), ("left",)]
+
+
+def test_handle_key_click(bound, ctx):
     """Test click key handling."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-
-    result = dispatcher.handle_key(
-        76,  # Click left key (from click_actions)
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {"active": False},
-        {"active": False},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    result = bound.handle_key(76, True)  # Click left key (from click_actions)
 
     assert result is True
-    mouse.click.assert_called_once_with("left")
+    ctx.mouse.click.assert_called_once_with("left")
+    assert bound.handle_key(76, False) is True  # Release is swallowed too
 
 
-def test_handle_key_scroll(dispatcher):
+def test_handle_key_scroll(bound, ctx):
     """Test scroll key handling."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    scroll = MagicMock()
-
-    # Start scrolling up (keycode 71 from scroll_keys)
-    result = dispatcher.handle_key(
-        71,  # Scroll up key
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        scroll,
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    result = bound.handle_key(71, True)  # Scroll up key
 
     assert result is True
-    scroll.start_direction.assert_called_once_with("up")
+    ctx.scroll.start_direction.assert_called_once_with("up")
 
 
-def test_handle_key_hold_button(dispatcher):
+def test_handle_key_hold_button(bound, ctx):
     """Test hold key for dragging."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    held_buttons = set()
-
-    # Press and hold left button (keycode 83 from hold_keys)
-    result = dispatcher.handle_key(
-        83,  # Hold left key
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        held_buttons,
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    result = bound.handle_key(83, True)  # Hold left key
 
     assert result is True
-    mouse.press.assert_called_once_with("left")
-    assert "left" in held_buttons
+    ctx.mouse.press.assert_called_once_with("left")
+    assert "left" in ctx.held_buttons
 
     # Release hold (toggle off)
-    mouse.reset_mock()
-    result = dispatcher.handle_key(
-        83,
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        held_buttons,
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    ctx.mouse.reset_mock()
+    result = bound.handle_key(83, True)
 
     assert result is True
-    mouse.release.assert_called_once_with("left")
-    assert "left" not in held_buttons
+    ctx.mouse.release.assert_called_once_with("left")
+    assert "left" not in ctx.held_buttons
 
 
-def test_handle_key_save_mode(dispatcher):
+def test_handle_key_save_mode(bound):
     """Test save mode activation."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    save_mode = {"active": False}
-    load_mode = {"active": False}
-
-    result = dispatcher.handle_key(
-        55,  # Save mode key (default from hotkey_config)
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        save_mode,
-        load_mode,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    result = bound.handle_key(55, True)  # Save mode key
 
     assert result is True
-    assert save_mode["active"] is True
-    assert load_mode["active"] is False  # Mutual exclusion
+    assert bound.mode == "save"
+
+
+def test_save_and_load_modes_are_exclusive(bound):
+    """Entering load mode leaves save mode; pressing it again leaves load mode."""
+    bound.handle_key(55, True)
+    bound.handle_key(74, True)
+    assert bound.mode == "load"
 
+    bound.handle_key(74, True)
+    assert bound.mode == "normal"
 
-def test_handle_key_slot_save(dispatcher):
+
+def test_mode_and_hold_changes_are_published(bound, ctx):
+    """Save/load mode and held buttons are pushed to status subscribers."""
+    bound.handle_key(55, True)  # Save mode
+    bound.handle_key(83, True)  # Hold left
+    bound.handle_key(KEY_UP, True)  # Movement is not a status change
+
+    assert ctx.publish_status.call_count == 2
+
+
+def test_handle_key_slot_save(bound, ctx):
     """Test saving position to slot."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    save_callback = MagicMock()
-    save_mode = {"active": True}
-    load_mode = {"active": False}
-
-    result = dispatcher.handle_key(
-        75,  # Slot 1 key (from dispatcher.keys.slot_keys)
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        save_mode,
-        load_mode,
-        save_callback,
-        MagicMock(),
-        MagicMock(),
-    )
+    bound.handle_key(55, True)
+
+    result = bound.handle_key(75, True)  # Slot 1 key (also move_left)
 
     assert result is True
-    save_callback.assert_called_once_with(1)
-    assert save_mode["active"] is False  # Deactivate after save
+    ctx.save_position.assert_called_once_with(1)
+    ctx.movement.start_direction.assert_not_called()
+    assert bound.mode == "normal"  # Deactivate after save
 
 
-def test_handle_key_slot_load(dispatcher):
+def test_handle_key_slot_load(bound, ctx):
     """Test loading position from slot."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    load_callback = MagicMock()
-    save_mode = {"active": False}
-    load_mode = {"active": True}
-
-    result = dispatcher.handle_key(
-        76,  # Slot 2 key
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        save_mode,
-        load_mode,
-        MagicMock(),
-        load_callback,
-        MagicMock(),
-    )
+    bound.handle_key(74, True)
+
+    result = bound.handle_key(76, True)  # Slot 2 key (also left click)
 
     assert result is True
-    load_callback.assert_called_once_with(2)
-    assert load_mode["active"] is False
+    ctx.load_position.assert_called_once_with(2)
+    ctx.mouse.click.assert_not_called()
+    assert bound.mode == "normal"
+
+
+def test_slot_keys_keep_normal_bindings_outside_modes(bound, ctx):
+    """Slot keys shared with movement and click act normally in normal mode."""
+    bound.handle_key(75, True)
+    bound.handle_key(76, True)
+
+    ctx.movement.start_direction.assert_called_once_with("left")
+    ctx.mouse.click.assert_called_once_with("left")
+    ctx.save_position.assert_not_called()
+
 
+def test_slot_release_in_save_mode_uses_normal_binding(bound, ctx):
+    """Releases of slot keys fall through to the key's other binding."""
+    bound.handle_key(55, True)
 
-def test_handle_key_undo(dispatcher):
+    assert bound.handle_key(75, False) is True
+
+    ctx.movement.stop_direction.assert_called_once_with("left")
+    assert bound.mode == "save"
+
+
+def test_handle_key_undo(bound, ctx):
     """Test undo key."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    movement = MagicMock()
+    result = bound.handle_key(98, True)  # Undo key
 
-    result = dispatcher.handle_key(
-        98,  # Undo key (default from hotkey_config)
-        True,
-        state,
-        mouse,
-        movement,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    assert result is True
+    ctx.movement.undo.assert_called_once()
+
+
+def test_any_key_press_cancels_scroll_momentum(bound, ctx):
+    """Test any key press ends scroll momentum, even pass-through keys."""
+    bound.handle_key(30, True)  # KEY_A, not a mouse-mode key
+
+    ctx.scroll.cancel_momentum.assert_called_once()
+
+
+def test_unbound_key_passes_through(bound):
+    """Keys without a binding are not suppressed."""
+    assert bound.handle_key(30, True) is False
+    assert bound.handle_key(30, False) is False
+
+
+def test_handle_key_redo_with_alt(bound, ctx):
+    """Test Alt+undo key redoes the last undone stroke."""
+    bound.handle_key(KEY_RIGHTALT, True)
+
+    result = bound.handle_key(98, True)
 
     assert result is True
-    movement.undo.assert_called_once()
+    ctx.movement.redo.assert_called_once()
+    ctx.movement.undo.assert_not_called()
+
+
+def test_alt_release_restores_normal_table(bound, ctx):
+    """After Alt is released the undo key undoes again."""
+    bound.handle_key(KEY_LEFTALT, True)
+    bound.handle_key(KEY_LEFTALT, False)
+
+    bound.handle_key(98, True)
 
+    ctx.movement.undo.assert_called_once()
+    ctx.movement.redo.assert_not_called()
 
-def test_handle_key_cycle_monitor_with_alt(dispatcher):
+
+def test_handle_key_cycle_monitor_with_alt(bound, ctx):
     """Test cycling monitor with Alt+secondary_monitor key."""
-    state = MagicMock(is_enabled=True)
-    mouse = MagicMock()
-    cycle_callback = MagicMock()
-
-    # Press Alt first
-    dispatcher.handle_key(
-        KEY_LEFTALT,
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-    )
+    bound.keys.scroll_keys[73] = ("right",)
+    bound.bind(**vars(ctx))  # Recompile with the overlapping scroll key
 
-    # Now press secondary_monitor with Alt held (keycode 73)
-    result = dispatcher.handle_key(
-        73,  # secondary_monitor key (default from hotkey_config)
-        True,
-        state,
-        mouse,
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        MagicMock(),
-        set(),
-        {},
-        {},
-        MagicMock(),
-        MagicMock(),
-        cycle_callback,
-    )
+    bound.handle_key(KEY_LEFTALT, True)
+    result = bound.handle_key(73, True)  # secondary_monitor key
 
     assert result is True
-    cycle_callback.assert_called_once()
+    ctx.cycle_monitor.assert_called_once()
+    assert bound.handle_key(73, False) is True
+    ctx.scroll.start_direction.assert_not_called()
+    ctx.scroll.stop_direction.assert_not_called()
+
+
+def test_secondary_monitor_key_scrolls_without_alt(bound, ctx):
+    """Without Alt the secondary_monitor key keeps its scroll binding."""
+    bound.keys.scroll_keys[73] = ("right",)
+    bound.bind(**vars(ctx))
+
+    assert bound.handle_key(73, True) is True
+
+    ctx.scroll.start_direction.assert_called_once_with("right")
+    ctx.cycle_monitor.assert_not_called()
+
+
+def test_continuous_keys_cover_movement_and_scroll(config):
+    """Movement and scroll keys are the ones whose autorepeat is filtered."""
+    from mouse_on_numpad.daemon.hotkey_config import HotkeyConfig
+
+    keys = HotkeyConfig(config)
+
+    assert keys.continuous_keys == set(keys.movement_keys) | set(keys.scroll_keys)
+    assert keys.key_toggle not in keys.continuous_keys
@@ -0,0 +1,712 @@
+"""Tests for the multiplexed keyboard capture loop."""
+
+import asyncio
+import ctypes
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import evdev
+import pytest
+
+from mouse_on_numpad.core.error_logger import ErrorLogger
+from mouse_on_numpad.daemon import event_mask
+from mouse_on_numpad.daemon.device_monitor import DeviceMonitor
+from mouse_on_numpad.daemon.device_selector import DeviceSelector
+from mouse_on_numpad.daemon.keyboard_capture import KeyboardCapture
+from mouse_on_numpad.input.uinput_frame import INPUT_EVENT
+
+EV_KEY = evdev.ecodes.EV_KEY
+EV_MSC = evdev.ecodes.EV_MSC
+EV_SYN = evdev.ecodes.EV_SYN
+
+
+class FakeDevice:
+    """evdev.InputDevice stand-in backed by a pipe.
+
+    Each queued batch is made readable by writing one byte to the pipe.
+    """
+
+    def __init__(self, name: str, path: str = "") -> None:
+        self.name = name
+        self.path = path or f"/dev/input/fake-{name}"
+        self.info = SimpleNamespace(bustype=3, vendor=0, product=0, version=0)
+        self.phys = f"fake/{name}"
+        self.uniq = ""
+        self.fd, self._write_fd = os.pipe()
+        os.set_blocking(self.fd, False)
+        self._batches: list[list[evdev.InputEvent]] = []
+        self._lock = threading.Lock()
+        self.grabbed = False
+        self.disconnected = False
+        self.held: set[int] = set()  # Kernel key state (EVIOCGKEY)
+        self.repeat = (250, 33)  # EVIOCGREP/EVIOCSREP (delay ms, period ms)
+
+    def push(self, *events: tuple[int, int, int]) -> None:
+        """Queue one read() batch of (type, code, value) events."""
+        now = time.time()
+        sec, usec = int(now), int((now % 1) * 1_000_000)
+        with self._lock:
+            self._batches.append([evdev.InputEvent(sec, usec, *e) for e in events])
+        for etype, code, value in events:
+            if etype == EV_KEY:
+                (self.held.add if value else self.held.discard)(code)
+        os.write(self._write_fd, b"x")
+
+    def unplug(self) -> None:
+        """Make the next read() fail like a removed device."""
+        self.disconnected = True
+        os.write(self._write_fd, b"x")
+
+    def read(self):
+        if self.disconnected:
+            raise OSError(19, "No such device")
+        os.read(self.fd, 1)
+        with self._lock:
+            if not self._batches:
+                raise BlockingIOError
+            batch = self._batches.pop(0)
+        return iter(batch)
+
+    def capabilities(self, absinfo: bool = True) -> dict[int, list[int]]:
+        return {EV_KEY: [72, 76]}  # KP8, KP5
+
+    def active_keys(self) -> list[int]:
+        return sorted(self.held)
+
+    def grab(self) -> None:
+        self.grabbed = True
+
+    def ungrab(self) -> None:
+        self.grabbed = False
+
+    def close(self) -> None:
+        for fd in (self.fd, self._write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def _fake_uinput(dev, name: str) -> MagicMock:
+    """UInput clone stand-in whose fd is the write end of a pipe."""
+    ui = MagicMock(name=name)
+    ui.read_fd, ui.fd = os.pipe()
+    os.set_blocking(ui.read_fd, False)
+    ui.close.side_effect = lambda: os.close(ui.fd)
+    return ui
+
+
+def _written_frames(ui) -> list[list[tuple[int, int, int]]]:
+    """Decode the frames written to a fake clone, split at SYN_REPORT."""
+    try:
+        data = os.read(ui.read_fd, 65536)
+    except BlockingIOError:
+        return []
+    frames, frame = [], []
+    for _, _, etype, code, value in INPUT_EVENT.iter_unpack(data):
+        if etype == EV_SYN:
+            frames.append(frame)
+            frame = []
+        else:
+            frame.append((etype, code, value))
+    return frames
+
+
+@pytest.fixture
+def capture():
+    """Create KeyboardCapture with UInput cloning mocked out."""
+    with patch("mouse_on_numpad.daemon.keyboard_capture.evdev.UInput") as uinput:
+        uinput.from_device.side_effect = _fake_uinput
+        cap = KeyboardCapture(ErrorLogger(console_output=False))
+        yield cap
+        cap.stop()
+        cap.close()
+
+
+@pytest.fixture
+def devices():
+    """Provide two fake keyboards."""
+    devs = [FakeDevice("numpad"), FakeDevice("keyboard")]
+    yield devs
+    for dev in devs:
+        dev.close()
+
+
+def _start(capture, devices, callback) -> threading.Thread:
+    """Run the capture loop on a background thread and wait until attached."""
+    thread = threading.Thread(target=capture.run, args=(devices, callback), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while capture.stats.devices < len(devices) and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return thread
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestCaptureLoop:
+    """Test multiplexed reading and dispatch."""
+
+    def test_all_devices_dispatch_on_one_thread(self, capture, devices):
+        """Events from every device are handled on the single capture thread."""
+        seen = []
+
+        def callback(code, pressed):
+            seen.append((code, pressed, threading.get_ident()))
+
+        thread = _start(capture, devices, callback)
+
+        devices[0].push((EV_KEY, 72, 1), (EV_SYN, 0, 0))
+        devices[1].push((EV_KEY, 30, 1), (EV_SYN, 0, 0))
+        _wait_for(lambda: len(seen) == 2)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+        assert sorted((code, pressed) for code, pressed, _ in seen) == [(30, True), (72, True)]
+        assert {ident for _, _, ident in seen} == {thread.ident}
+
+    def test_batch_is_drained_with_one_read(self, capture, devices):
+        """A multi-event batch counts as one read and one wakeup."""
+        seen = []
+        thread = _start(capture, devices[:1], lambda code, pressed: seen.append(code))
+
+        devices[0].push(
+            (EV_KEY, 72, 1), (EV_SYN, 0, 0), (EV_KEY, 72, 0), (EV_SYN, 0, 0)
+        )
+        _wait_for(lambda: len(seen) == 2)
+        capture.stop()
+        thread.join(timeout=2)
+
+        stats = capture.stats
+        assert stats.batches == 1
+        assert stats.events == 4
+        assert stats.max_batch == 4
+        assert stats.latency_max >= stats.latency_mean >= 0.0
+
+    def test_repeat_counts_as_pressed(self, capture, devices):
+        """Autorepeat (value 2) is dispatched as a press, release as not pressed."""
+        seen = []
+        thread = _start(capture, devices[:1], lambda code, pressed: seen.append(pressed))
+
+        devices[0].push((EV_KEY, 72, 2), (EV_KEY, 72, 0))
+        _wait_for(lambda: len(seen) == 2)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert seen == [True, False]
+
+    def test_unsuppressed_keys_are_forwarded(self, capture, devices):
+        """Keys the callback does not suppress are written to the clone."""
+        thread = _start(capture, devices[:1], lambda code, pressed: code == 72)
+        ui = capture._slots[devices[0].fd].ui
+
+        devices[0].push((EV_KEY, 72, 1), (EV_KEY, 30, 1), (EV_SYN, 0, 0))
+        _wait_for(lambda: capture.stats.events == 3)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert _written_frames(ui) == [[(EV_KEY, 30, 1)]]
+        ui.close.assert_called_once()
+
+    def test_batch_forwarded_with_one_write(self, capture, devices):
+        """Every complete frame in a read batch goes out in a single write."""
+        thread = _start(capture, devices[:1], lambda code, pressed: False)
+        ui = capture._slots[devices[0].fd].ui
+
+        devices[0].push(
+            (EV_MSC, 4, 0x70004), (EV_KEY, 30, 1), (EV_SYN, 0, 0),
+            (EV_MSC, 4, 0x70004), (EV_KEY, 30, 0), (EV_SYN, 0, 0),
+        )
+        _wait_for(lambda: capture.stats.forwarded == 2)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert _written_frames(ui) == [
+            [(EV_MSC, 4, 0x70004), (EV_KEY, 30, 1)],
+            [(EV_MSC, 4, 0x70004), (EV_KEY, 30, 0)],
+        ]
+        assert capture.stats.forward_writes == 1
+
+    def test_suppressed_frame_not_forwarded(self, capture, devices):
+        """A frame left with only MSC_SCAN after suppression is dropped."""
+        thread = _start(capture, devices[:1], lambda code, pressed: code == 72)
+        ui = capture._slots[devices[0].fd].ui
+
+        devices[0].push((EV_MSC, 4, 0x70060), (EV_KEY, 72, 1), (EV_SYN, 0, 0))
+        devices[0].push((EV_KEY, 30, 1))  # Frame completes in the next read
+        devices[0].push((EV_SYN, 0, 0))
+        _wait_for(lambda: capture.stats.forwarded == 1)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert _written_frames(ui) == [[(EV_KEY, 30, 1)]]
+
+    def test_syn_dropped_discards_partial_frame(self, capture, devices):
+        """Events up to the SYN_REPORT after a SYN_DROPPED are not forwarded."""
+        thread = _start(capture, devices[:1], lambda code, pressed: False)
+        ui = capture._slots[devices[0].fd].ui
+
+        devices[0].push(
+            (EV_KEY, 30, 1), (EV_SYN, 3, 0), (EV_KEY, 31, 1), (EV_SYN, 0, 0),
+            (EV_KEY, 32, 1), (EV_SYN, 0, 0),
+        )
+        _wait_for(lambda: capture.stats.events == 6)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert _written_frames(ui) == [[(EV_KEY, 32, 1)]]
+
+
+class TestLifecycle:
+    """Test grabbing, disconnects and shutdown."""
+
+    def test_devices_grabbed_while_running(self, capture, devices):
+        """Devices are grabbed on attach and released when the loop stops."""
+        thread = _start(capture, devices, lambda code, pressed: False)
+        assert all(dev.grabbed for dev in devices)
+        assert capture.running
+
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert not capture.running
+        assert not any(dev.grabbed for dev in devices)
+        assert capture.stats.devices == 0
+
+    def test_disconnect_detaches_only_that_device(self, capture, devices):
+        """A removed device is dropped while the others keep working."""
+        seen = []
+        thread = _start(capture, devices, lambda code, pressed: seen.append(code))
+
+        devices[0].unplug()
+        _wait_for(lambda: capture.stats.devices == 1)
+        devices[1].push((EV_KEY, 30, 1))
+        _wait_for(lambda: seen == [30])
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert seen == [30]
+        assert not devices[0].grabbed
+
+    def test_stop_before_run_returns_immediately(self, capture, devices):
+        """A stop() that races ahead of run() is not lost."""
+        capture.stop()
+        thread = threading.Thread(
+            target=capture.run, args=(devices, lambda code, pressed: False), daemon=True
+        )
+        thread.start()
+        thread.join(timeout=2)
+
+        assert not thread.is_alive()
+
+    def test_close_twice_leaves_reused_fds_alone(self, capture):
+        """A second close() does not close fds that now belong to someone else."""
+        capture.close()
+        read_fd, write_fd = os.pipe()  # Reuses the wake pipe's numbers
+        try:
+            capture.close()
+            capture.stop()
+            os.write(write_fd, b"x")
+            assert os.read(read_fd, 1) == b"x"
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_call_runs_on_capture_thread(self, capture, devices):
+        """call() from another thread runs on the loop and returns its result."""
+        capture_thread = []
+        thread = _start(
+            capture, devices, lambda code, pressed: capture_thread.append(threading.get_ident())
+        )
+        devices[0].push((EV_KEY, 72, 1))
+        _wait_for(lambda: capture_thread)
+
+        def broken():
+            raise ValueError("bad")
+
+        assert capture.call(lambda a, b: (a + b, threading.get_ident()), 2, 3) == (
+            5, capture_thread[0]
+        )
+        with pytest.raises(ValueError, match="bad"):
+            capture.call(broken)
+        capture.stop()
+        thread.join(timeout=2)
+
+    def test_call_runs_directly_when_stopped(self, capture):
+        """Without a running loop call() runs on the calling thread."""
+        assert capture.call(threading.get_ident) == threading.get_ident()
+
+    def test_idle_loop_does_not_wake(self, capture, devices):
+        """With no input the loop blocks in select() instead of polling."""
+        thread = _start(capture, devices, lambda code, pressed: False)
+        time.sleep(0.05)
+        wakeups = capture.stats.wakeups
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert wakeups == 0
+        assert capture.stats.threads >= 1
+
+
+class TestExclusive:
+    """Test exclusive routing of selected devices."""
+
+    def test_keys_consumed_without_clone(self, devices):
+        """Exclusive devices get no uinput clone; non-hotkeys are dropped."""
+        with patch("mouse_on_numpad.daemon.keyboard_capture.evdev.UInput") as uinput:
+            capture = KeyboardCapture(
+                ErrorLogger(console_output=False), DeviceSelector(["0000:0000"], exclusive=True)
+            )
+            seen = []
+            thread = _start(capture, devices[:1], lambda code, pressed: seen.append(code) or False)
+
+            devices[0].push((EV_KEY, 30, 1), (EV_SYN, 0, 0))
+            _wait_for(lambda: seen == [30])
+            capture.stop()
+            thread.join(timeout=2)
+            capture.close()
+
+        uinput.from_device.assert_not_called()
+        assert seen == [30]
+        assert capture.stats.events == 2
+
+
+class TestAutorepeat:
+    """Test autorepeat filtering and repeat settings."""
+
+    def test_consumed_continuous_key_repeats_not_dispatched(self, capture, devices):
+        """Repeats of a held movement key never reach the callback."""
+        seen = []
+        capture.set_repeat_filter([72])
+        thread = _start(capture, devices[:1], lambda code, pressed: seen.append(pressed) or True)
+
+        devices[0].push((EV_KEY, 72, 1), (EV_SYN, 0, 0))
+        devices[0].push((EV_KEY, 72, 2), (EV_SYN, 0, 0))
+        devices[0].push((EV_KEY, 72, 2), (EV_SYN, 0, 0))
+        devices[0].push((EV_KEY, 72, 0), (EV_SYN, 0, 0))
+        _wait_for(lambda: seen == [True, False])
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert seen == [True, False]
+        assert capture.stats.repeats == 2
+        assert capture.stats.repeats_filtered == 2
+
+    def test_passed_through_key_repeats_dispatched_not_forwarded(self, capture, devices):
+        """A filtered key that was not consumed still repeats, via the clone."""
+        seen = []
+        capture.set_repeat_filter([72])
+        thread = _start(capture, devices[:1], lambda code, pressed: seen.append(pressed) or False)
+        ui = capture._slots[devices[0].fd].ui
+
+        devices[0].push((EV_KEY, 72, 1), (EV_SYN, 0, 0))
+        devices[0].push((EV_KEY, 72, 2), (EV_SYN, 0, 0))
+        devices[0].push((EV_KEY, 72, 0), (EV_SYN, 0, 0))
+        _wait_for(lambda: len(seen) == 3)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert seen == [True, True, False]
+        assert _written_frames(ui) == [[(EV_KEY, 72, 1)], [(EV_KEY, 72, 0)]]
+        assert capture.stats.repeats_filtered == 0
+
+    def test_set_repeat_applied_and_restored(self, capture, devices):
+        """Repeat settings reach the device and its clone, then are undone."""
+        capture.set_repeat(200, 40)
+        thread = _start(capture, devices[:1], lambda code, pressed: False)
+        ui = capture._slots[devices[0].fd].ui
+
+        assert devices[0].repeat == (200, 25)
+        assert ui.device.repeat == (200, 25)
+
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert devices[0].repeat == (250, 33)
+
+    def test_clearing_repeat_restores_device(self, capture, devices):
+        """set_repeat(None, None) while running restores the device setting."""
+        capture.set_repeat(200, 40)
+        thread = _start(capture, devices[:1], lambda code, pressed: False)
+
+        capture.set_repeat(None, None)
+        _wait_for(lambda: devices[0].repeat == (250, 33))
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert devices[0].repeat == (250, 33)
+
+
+class TestPassthrough:
+    """Test grabbing only while mouse mode is enabled."""
+
+    TOGGLE = 78
+
+    def test_ungrabbed_until_enabled(self, capture, devices):
+        """In passthrough mode devices start ungrabbed and only watched keys dispatch."""
+        seen = []
+        capture.set_passthrough([self.TOGGLE])
+        thread = _start(capture, devices[:1], lambda code, pressed: seen.append(code))
+        ui = capture._slots[devices[0].fd].ui
+
+        devices[0].push((EV_KEY, 30, 1), (EV_SYN, 0, 0), (EV_KEY, 30, 0), (EV_SYN, 0, 0))
+        devices[0].push((EV_KEY, self.TOGGLE, 1), (EV_SYN, 0, 0))
+        _wait_for(lambda: seen == [self.TOGGLE])
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert seen == [self.TOGGLE]
+        assert not devices[0].grabbed
+        assert _written_frames(ui) == []  # The desktop already has the keys
+
+    def test_grab_waits_for_toggle_release(self, capture, devices):
+        """Enabling grabs after the toggle key is released, not mid-press."""
+        def on_key(code, pressed):
+            if code == self.TOGGLE and pressed:
+                capture.set_grab(True)
+            return True
+
+        capture.set_passthrough([self.TOGGLE])
+        thread = _start(capture, devices[:1], on_key)
+
+        devices[0].push((EV_KEY, self.TOGGLE, 1), (EV_SYN, 0, 0))
+        _wait_for(lambda: capture.stats.events == 2)
+        grabbed_while_held = devices[0].grabbed
+        devices[0].push((EV_KEY, self.TOGGLE, 0), (EV_SYN, 0, 0))
+        _wait_for(lambda: devices[0].grabbed)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert grabbed_while_held is False
+        assert capture.stats.grabs == 1
+
+    def test_set_grab_from_other_thread(self, capture, devices):
+        """set_grab() from another thread is applied on the capture thread."""
+        capture.set_passthrough([self.TOGGLE])
+        thread = _start(capture, devices, lambda code, pressed: True)
+
+        capture.set_grab(True)
+        _wait_for(lambda: all(dev.grabbed for dev in devices))
+        assert all(dev.grabbed for dev in devices)
+        capture.set_grab(False)
+        _wait_for(lambda: not any(dev.grabbed for dev in devices))
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert not any(dev.grabbed for dev in devices)
+
+    def test_release_waits_for_held_keys(self, capture, devices):
+        """Disabling keeps the grab until held keys are released through us."""
+        seen = []
+        capture.set_passthrough([self.TOGGLE])
+        capture.set_grab(True)
+        thread = _start(capture, devices[:1], lambda code, pressed: seen.append((code, pressed)))
+
+        devices[0].push((EV_KEY, 72, 1))
+        _wait_for(lambda: seen == [(72, True)])
+        capture.set_grab(False)
+        time.sleep(0.01)
+        still_grabbed = devices[0].grabbed
+        devices[0].push((EV_KEY, 72, 0))
+        _wait_for(lambda: not devices[0].grabbed)
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert still_grabbed
+        assert seen == [(72, True), (72, False)]
+
+    def test_always_mode_ignores_set_grab(self, capture, devices):
+        """Without passthrough devices stay grabbed whatever the mode."""
+        thread = _start(capture, devices[:1], lambda code, pressed: False)
+        capture.set_grab(False)
+        time.sleep(0.01)
+        grabbed = devices[0].grabbed
+        capture.stop()
+        thread.join(timeout=2)
+
+        assert grabbed
+
+
+class TestEventMask:
+    """Test the EVIOCSMASK helpers."""
+
+    def test_key_bitmap(self):
+        """Only the watched key bits are set, in kernel long-sized chunks."""
+        calls = []
+
+        def fake_ioctl(fd, request, arg):
+            etype, size, ptr = event_mask._INPUT_MASK.unpack(arg)
+            calls.append((request, etype, ctypes.string_at(ptr, size)))
+
+        with patch.object(event_mask.fcntl, "ioctl", side_effect=fake_ioctl):
+            assert event_mask.watch_keys_only(3, [78])
+
+        (_, types_etype, types), (request, key_etype, keys) = calls
+        assert request == event_mask.EVIOCSMASK
+        assert types_etype == event_mask.EV_SYN
+        assert types[0] == 0b11  # EV_SYN and EV_KEY
+        assert key_etype == event_mask.EV_KEY
+        assert len(keys) % 8 == 0
+        assert keys[78 // 8] == 1 << (78 % 8)
+        assert sum(keys) == keys[78 // 8]
+
+    def test_non_evdev_fd_is_not_masked(self):
+        """A kernel refusal (e.g. not an input device) is reported, not raised."""
+        read_fd, write_fd = os.pipe()
+        try:
+            assert event_mask.watch_keys_only(read_fd, [78]) is False
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+class TestHotplug:
+    """Test devices appearing and disappearing while the loop runs."""
+
+    @pytest.fixture
+    def dev_dir(self, tmp_path, capture):
+        """Point the capture's hotplug watch at a temp /dev/input."""
+        monitor = DeviceMonitor.create(str(tmp_path))
+        if monitor is None:
+            pytest.skip("inotify unavailable")
+        capture._monitor = monitor
+        return tmp_path
+
+    def test_plugged_device_is_attached(self, capture, dev_dir):
+        """A new node is probed off-thread and attached to the running loop."""
+        node = dev_dir / "event5"
+        plugged = FakeDevice("usb-numpad", str(node))
+        seen = []
+        with patch(
+            "mouse_on_numpad.daemon.keyboard_capture.evdev.InputDevice",
+            side_effect=lambda path: plugged,
+        ):
+            thread = _start(capture, [], lambda code, pressed: seen.append(code))
+            node.touch()
+            _wait_for(lambda: capture.stats.devices == 1)
+            plugged.push((EV_KEY, 72, 1))
+            _wait_for(lambda: seen == [72])
+            capture.stop()
+            thread.join(timeout=2)
+
+        assert seen == [72]
+        assert capture.stats.attached == 1
+        plugged.close()
+
+    def test_removed_device_is_torn_down(self, capture, dev_dir, devices):
+        """Deleting the node detaches the device and closes its clone."""
+        node = dev_dir / "event6"
+        node.touch()
+        devices[0].path = str(node)
+        thread = _start(capture, devices, lambda code, pressed: False)
+        ui = capture._slots[devices[0].fd].ui
+
+        node.unlink()
+        _wait_for(lambda: capture.stats.devices == 1)
+        capture.stop()
+        thread.join(timeout=2)
+
+        ui.close.assert_called_once()
+        assert not devices[0].grabbed
+        assert capture.stats.detached == 1
+
+    def test_unwanted_device_is_closed(self, capture, dev_dir):
+        """Devices the selector rejects are closed, not attached."""
+        node = dev_dir / "event8"
+        other = FakeDevice("mouse", str(node))
+        other.capabilities = lambda absinfo=True: {evdev.ecodes.EV_REL: [0, 1]}
+        other.close = MagicMock()
+        with patch(
+            "mouse_on_numpad.daemon.keyboard_capture.evdev.InputDevice",
+            side_effect=lambda path: other,
+        ):
+            thread = _start(capture, [], lambda code, pressed: False)
+            node.touch()
+            _wait_for(lambda: other.close.called)
+            capture.stop()
+            thread.join(timeout=2)
+
+        other.close.assert_called()
+        assert capture.stats.attached == 0
+        FakeDevice.close(other)
+
+    def test_own_clone_is_closed(self, capture, dev_dir):
+        """Our uinput clones have numpad keys but are never captured."""
+        node = dev_dir / "event9"
+        clone = FakeDevice("mouse-on-numpad-x", str(node))
+        clone.close = MagicMock()
+        with patch(
+            "mouse_on_numpad.daemon.keyboard_capture.evdev.InputDevice",
+            side_effect=lambda path: clone,
+        ):
+            thread = _start(capture, [], lambda code, pressed: False)
+            node.touch()
+            _wait_for(lambda: clone.close.called)
+            capture.stop()
+            thread.join(timeout=2)
+
+        clone.close.assert_called()
+        assert capture.stats.attached == 0
+        assert capture.stats.devices == 0
+        FakeDevice.close(clone)
+
+
+class TestAsyncCapture:
+    """Test run_async() on an asyncio event loop."""
+
+    def test_dispatches_on_loop_thread_until_stopped(self, capture, devices):
+        """Events are dispatched from loop readers; stop() ends the coroutine."""
+        seen = []
+
+        async def main() -> None:
+            task = asyncio.create_task(
+                capture.run_async(
+                    devices,
+                    lambda code, pressed: seen.append((code, threading.get_ident())),
+                )
+            )
+            await asyncio.sleep(0.01)
+            assert all(dev.grabbed for dev in devices)
+            devices[0].push((EV_KEY, 72, 1))
+            devices[1].push((EV_KEY, 30, 1))
+            for _ in range(200):
+                if len(seen) == 2:
+                    break
+                await asyncio.sleep(0.005)
+            threading.Thread(target=capture.stop).start()  # Any thread may stop
+            await asyncio.wait_for(task, 2.0)
+
+        asyncio.run(main())
+
+        assert sorted(code for code, _ in seen) == [30, 72]
+        assert {ident for _, ident in seen} == {threading.get_ident()}
+        assert not any(dev.grabbed for dev in devices)
+        assert capture.stats.wakeups >= 2
+
+    def test_call_runs_on_event_loop(self, capture, devices):
+        """call() from another thread runs on the loop thread under asyncio."""
+        results = []
+
+        async def main() -> None:
+            task = asyncio.create_task(capture.run_async(devices, lambda code, pressed: True))
+            await asyncio.sleep(0.01)
+            caller = threading.Thread(
+                target=lambda: results.append(capture.call(threading.get_ident))
+            )
+            caller.start()
+            while caller.is_alive():
+                await asyncio.sleep(0.005)
+            capture.stop()
+            await asyncio.wait_for(task, 2.0)
+
+        asyncio.run(main())
+
+        assert results == [threading.get_ident()]
@@ -0,0 +1,55 @@
+"""Tests for deferred package exports and the lean CLI import path."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mouse_on_numpad.input as input_pkg
+
+HEAVY = ("gi", "Xlib", "pynput", "evdev", "numpy", "pystray")
+
+
+def _loaded_heavy(code: str) -> list[str]:
+    """Run code in a fresh interpreter and return heavy modules it loaded."""
+    check = f"{code}\nimport sys\nprint(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import mouse_on_numpad.main",
+        "import mouse_on_numpad.core.control_channel",
+        "import mouse_on_numpad.core, mouse_on_numpad.daemon, "
+        "mouse_on_numpad.input, mouse_on_numpad.ui",
+    ],
+)
+def test_cli_path_skips_heavy_imports(code):
+    """CLI and package imports load no GUI, X11 or input libraries."""
+    assert _loaded_heavy(code) == []
+
+
+def test_export_resolved_on_access():
+    """A deferred export imports its submodule and is cached."""
+    assert input_pkg.MovementController.__module__ == "mouse_on_numpad.input.movement_controller"
+    assert "MovementController" in vars(input_pkg)
+
+
+def test_unknown_attribute():
+    """Names outside the export table raise AttributeError."""
+    with pytest.raises(AttributeError, match="NoSuchThing"):
+        _ = input_pkg.NoSuchThing
+
+
+def test_dir_lists_exports():
+    """dir() includes exports that are not imported yet."""
+    assert set(input_pkg.__all__) <= set(dir(input_pkg))
@@ -0,0 +1,185 @@
+"""Tests for the shared MotionEngine thread."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mouse_on_numpad.core.config import ConfigManager
+from mouse_on_numpad.input.motion_engine import MotionEngine
+from mouse_on_numpad.input.movement_controller import MovementController
+from mouse_on_numpad.input.scroll_controller import ScrollController
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Create ConfigManager in an isolated temp directory."""
+    return ConfigManager(config_dir=tmp_path)
+
+
+@pytest.fixture
+def mouse():
+    """Create a mocked mouse that supports combined frames."""
+    return MagicMock()
+
+
+@pytest.fixture
+def engine(mouse):
+    """Create a MotionEngine and stop it after the test."""
+    engine = MotionEngine(mouse)
+    yield engine
+    engine.stop()
+
+
+def test_controllers_share_one_thread(config, mouse, engine):
+    """Movement and scroll run on the same engine thread."""
+    movement = MovementController(config, mouse, engine)
+    scroll = ScrollController(config, mouse, engine)
+    before = threading.active_count()
+
+    movement.start_direction("right")
+    scroll.start_direction("up")
+    time.sleep(0.05)
+
+    assert engine.movement is movement
+    assert engine.scroll is scroll
+    assert threading.active_count() == before + 1
+    movement.stop_all()
+    scroll.stop_all()
+
+
+def test_thread_not_started_until_needed(mouse, engine):
+    """No thread is created before the first stroke."""
+    assert engine.thread is None
+
+
+def test_tick_combines_move_and_scroll_in_one_frame(config, mouse, engine):
+    """Motion and wheel due in the same tick go out as one frame."""
+    movement = MovementController(config, mouse, engine)
+    scroll = ScrollController(config, mouse, engine)
+    movement._active_dirs.add("right")
+    scroll._active_dirs.add("up")
+    movement._running = scroll._running = True
+    now = time.monotonic()
+    movement._scheduler.reset(now)
+    scroll._scheduler.reset(now)
+
+    next_deadline = engine.tick(now)
+
+    mouse.emit_frame.assert_called_once()
+    dx, dy, wheel, hwheel = mouse.emit_frame.call_args[0]
+    assert dx > 0 and dy == 0
+    assert wheel > 0 and hwheel == 0
+    mouse.move.assert_not_called()
+    mouse.scroll.assert_not_called()
+    # Next wake is the earliest controller deadline (movement: 20 ms)
+    assert next_deadline == pytest.approx(now + 0.02)
+
+
+def test_tick_without_emit_frame_falls_back(config, engine):
+    """Mice without emit_frame (ydotool) get separate move/scroll calls."""
+    mouse = MagicMock(spec=["move", "scroll"])
+    engine._mouse = mouse
+    movement = MovementController(config, mouse, engine)
+    scroll = ScrollController(config, mouse, engine)
+    movement._active_dirs.add("left")
+    scroll._active_dirs.add("down")
+    movement._running = scroll._running = True
+    now = time.monotonic()
+    movement._scheduler.reset(now)
+    scroll._scheduler.reset(now)
+
+    engine.tick(now)
+
+    mouse.move.assert_called_once()
+    mouse.scroll.assert_called_once()
+
+
+def test_tick_idle_returns_none(config, mouse, engine):
+    """With no active controller the engine has no deadline (sleeps on event)."""
+    MovementController(config, mouse, engine)
+    ScrollController(config, mouse, engine)
+    assert engine.tick(time.monotonic()) is None
+
+
+def test_wake_is_immediate(config, mouse, engine):
+    """Starting a stroke wakes an idle engine without waiting for a timeout."""
+    movement = MovementController(config, mouse, engine)
+    movement.start_direction("up")
+    time.sleep(0.03)
+    movement.stop_all()
+    time.sleep(0.05)  # Engine now blocked on its event
+    mouse.move.reset_mock()
+
+    moved = threading.Event()
+    mouse.move.side_effect = lambda *_: moved.set()
+    start = time.monotonic()
+    movement.start_direction("down")
+    assert moved.wait(1.0)
+    assert time.monotonic() - start < 0.015
+    movement.stop_all()
+
+
+def test_failed_tick_logged_and_motion_resumes(config, mouse):
+    """A tick that raises is logged and the next stroke moves again."""
+    logger = MagicMock()
+    engine = MotionEngine(mouse, logger)
+    movement = MovementController(config, mouse, engine)
+    failed = threading.Event()
+    moved = threading.Event()
+
+    def move(*_):
+        if not failed.is_set():
+            failed.set()
+            raise OSError("write failed")
+        moved.set()
+
+    mouse.move.side_effect = move
+    movement.start_direction("right")
+    assert failed.wait(1.0)
+    time.sleep(0.03)
+
+    logger.exception.assert_called_once()
+    assert not movement._running
+    assert engine.thread.is_alive()
+    movement.stop_direction("right")
+    movement.start_direction("right")
+    assert moved.wait(1.0)
+    movement.stop_all()
+    engine.stop()
+
+
+def test_stop_joins_thread(config, mouse):
+    """stop() terminates the engine thread."""
+    engine = MotionEngine(mouse)
+    movement = MovementController(config, mouse, engine)
+    movement.start_direction("up")
+    time.sleep(0.03)
+    thread = engine.thread
+
+    engine.stop()
+
+    assert not thread.is_alive()
+
+
+def test_bound_loop_ticks_without_thread(config, mouse, engine):
+    """Bound to an event loop, ticks run as loop timers on the loop thread."""
+    movement = MovementController(config, mouse, engine)
+    threads = []
+    mouse.move.side_effect = lambda *_: threads.append(threading.get_ident())
+
+    async def stroke() -> None:
+        engine.bind_loop(asyncio.get_running_loop())
+        movement.start_direction("right")
+        await asyncio.sleep(0.05)
+        movement.stop_all()
+        engine.stop()
+        engine.bind_loop(None)
+
+    asyncio.run(stroke())
+
+    assert engine.thread is None
+    assert len(threads) > 1
+    assert set(threads) == {threading.get_ident()}
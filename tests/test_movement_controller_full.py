@@ -41,7 +41,7 @@ def test_movement_controller_init(movement_controller, config, mock_mouse):
     assert movement_controller._current_speed == 1.0
     assert movement_controller._active_dirs == set()
     assert movement_controller._running is False
-    assert movement_controller._move_history == []
+    assert len(movement_controller._history) == 0
 
 
 def test_start_direction_single(movement_controller, mock_mouse):
@@ -181,34 +181,66 @@ def test_accelerate_respects_max_speed(movement_controller, config):
     assert movement_controller._current_speed <= max_mult
 
 
-def test_record_move_adds_to_history(movement_controller):
-    """Test that moves are recorded for undo."""
-    movement_controller._record_move(10, -5)
+def _record_stroke(controller, *moves: tuple[int, int]) -> None:
+    """Record one press-to-release stroke made of the given ticks."""
+    controller._history.begin(1.0)
+    for i, (dx, dy) in enumerate(moves):
+        controller._record_move(dx, dy, 1.0 + i * 0.02)
+    controller._history.end(2.0)
 
-    assert (10, -5) in movement_controller._move_history
+
+def test_record_move_accumulates_stroke(movement_controller):
+    """Test that ticks fold into a single stroke record."""
+    _record_stroke(movement_controller, (10, -5), (12, -6))
+
+    (stroke,) = movement_controller._history.strokes()
+    assert (stroke.dx, stroke.dy) == (22, -11)
+    assert (stroke.start, stroke.end) == (1.0, 2.0)
 
 
 def test_record_move_respects_max_levels(movement_controller, config):
     """Test that undo history respects max levels."""
     config.set("undo.max_levels", 3)
-    movement_controller._record_move(1, 2)
-    movement_controller._record_move(3, 4)
-    movement_controller._record_move(5, 6)
-    movement_controller._record_move(7, 8)
+    for i in range(4):
+        _record_stroke(movement_controller, (i + 1, 0))
 
-    assert len(movement_controller._move_history) <= 3
+    assert len(movement_controller._history) == 3
+    assert [s.dx for s in movement_controller._history.strokes()] == [2, 3, 4]
 
 
-def test_undo_reverses_last_move(movement_controller, mock_mouse):
-    """Test undo reverses the last move."""
-    movement_controller._record_move(20, -15)
+def test_undo_reverses_last_stroke(movement_controller, mock_mouse):
+    """Test undo reverses the whole last stroke at once."""
+    _record_stroke(movement_controller, (20, -15), (5, 0))
 
     result = movement_controller.undo()
 
     assert result is True
     # Should move in opposite direction
-    mock_mouse.move.assert_called_once_with(-20, 15)
-    assert len(movement_controller._move_history) == 0
+    mock_mouse.move.assert_called_once_with(-25, 15)
+    assert len(movement_controller._history) == 0
+
+
+def test_redo_replays_undone_stroke(movement_controller, mock_mouse):
+    """Test redo moves the undone stroke forward again."""
+    _record_stroke(movement_controller, (7, 3))
+    movement_controller.undo()
+    mock_mouse.reset_mock()
+
+    assert movement_controller.redo() is True
+    mock_mouse.move.assert_called_once_with(7, 3)
+    assert movement_controller.redo() is False
+
+
+def test_stroke_recorded_from_press_to_release(movement_controller, mock_mouse):
+    """Test a real stroke is undone as one unit after release."""
+    movement_controller.start_direction("right")
+    time.sleep(0.08)
+    movement_controller.stop_direction("right")
+    time.sleep(0.03)
+
+    (stroke,) = movement_controller._history.strokes()
+    assert stroke.dx > 0 and stroke.dy == 0
+    assert stroke.end > stroke.start
 
 
 def test_undo_with_empty_history(movement_controller, mock_mouse):
@@ -220,9 +252,9 @@ def test_undo_with_empty_history(movement_controller, mock_mouse):
 
 
 def test_undo_multiple_times(movement_controller, mock_mouse):
-    """Test undoing multiple moves."""
-    movement_controller._record_move(10, 0)
-    movement_controller._record_move(0, 10)
+    """Test undoing multiple strokes."""
+    _record_stroke(movement_controller, (10, 0))
+    _record_stroke(movement_controller, (0, 10))
 
     result1 = movement_controller.undo()
     result2 = movement_controller.undo()
@@ -266,19 +298,22 @@ def test_movement_loop_reloads_config(movement_controller, config, mock_mouse):
     assert second_call_count > first_call_count
 
 
-def test_movement_thread_cleanup_on_stop(movement_controller):
-    """Test that movement thread cleans up properly."""
+def test_movement_engine_idles_on_stop(movement_controller, mock_mouse):
+    """Test that the engine thread stops ticking (but stays alive) after stop."""
     movement_controller.start_direction("up")
     time.sleep(0.05)
 
-    thread = movement_controller._move_thread
+    thread = movement_controller._engine.thread
     assert thread is not None
     assert thread.is_alive()
 
     movement_controller.stop_all()
-    time.sleep(0.1)
+    time.sleep(0.05)
+    calls = mock_mouse.move.call_count
+    time.sleep(0.05)
 
-    assert not thread.is_alive()
+    assert mock_mouse.move.call_count == calls
+    assert thread.is_alive()  # Persistent: no thread creation on next stroke
 
 
 def test_concurrent_direction_changes(movement_controller, mock_mouse):
@@ -362,3 +397,92 @@ def test_speed_not_reset_with_multiple_directions(movement_controller):
 
     # Speed should not reset since left is still active
     assert movement_controller._current_speed == 2.5
+
+
+def _simulate_stroke(controller, tick_rate: int, duration: float) -> int:
+    """Drive a rightward stroke through _step() on a synthetic clock."""
+    start = 1000.0
+    controller._active_dirs = {"right"}
+    controller._running = True
+    controller._stroke_start = controller._last_tick = start
+    controller._scheduler.reset(start)
+    total = 0
+    for i in range(int(duration * tick_rate) + 1):
+        dx, _ = controller._step(start + i / tick_rate)
+        total += dx
+    return total
+
+
+def test_time_physics_independent_of_tick_rate(tmp_path, mock_mouse):
+    """Time physics yields the same distance at 250 Hz and 500 Hz."""
+    config = ConfigManager(config_dir=tmp_path)
+    config.set("movement.physics", "time")
+    config.set("movement.base_speed", 50)  # 50 px per 20 ms = 2500 px/s
+    config.set("movement.max_speed", 200)
+    config.set("movement.move_delay", 20)
+    config.set("movement.curve", "linear")
+    config.set("movement.acceleration_rate", 1.0)  # Constant velocity
+
+    config.set("movement.tick_rate", 250)
+    slow = _simulate_stroke(MovementController(config, mock_mouse), 250, 0.2)
+    config.set("movement.tick_rate", 500)
+    fast = _simulate_stroke(MovementController(config, mock_mouse), 500, 0.2)
+
+    assert slow == pytest.approx(500, abs=10)
+    assert fast == pytest.approx(500, abs=10)
+
+
+def test_time_physics_acceleration_over_elapsed_time(tmp_path, mock_mouse):
+    """Speed multiplier follows elapsed time, not the number of ticks."""
+    config = ConfigManager(config_dir=tmp_path)
+    config.set("movement.physics", "time")
+    config.set("movement.tick_rate", 1000)
+    controller = MovementController(config, mock_mouse)
+
+    _simulate_stroke(controller, 1000, 0.2)  # 10 nominal 20 ms ticks
+
+    rate = config.get("movement.acceleration_rate")
+    assert controller._current_speed == pytest.approx(rate**10, rel=0.01)
+
+
+def test_time_physics_slow_speed_at_high_rate_is_not_lost(tmp_path, mock_mouse):
+    """Sub-pixel deltas at 1000 Hz still add up to the intended distance."""
+    config = ConfigManager(config_dir=tmp_path)
+    config.set("movement.physics", "time")
+    config.set("movement.tick_rate", 1000)
+    config.set("movement.base_speed", 1)  # 1 px per 20 ms = 50 px/s, 0.05 px/tick
+    config.set("movement.move_delay", 20)
+    config.set("movement.curve", "linear")
+    config.set("movement.acceleration_rate", 1.0)
+
+    total = _simulate_stroke(MovementController(config, mock_mouse), 1000, 1.0)
+
+    assert total == pytest.approx(50, abs=1)
+
+
+def test_zero_move_delay_is_clamped(tmp_path, mock_mouse):
+    """movement.move_delay = 0 uses the 1 ms floor instead of dividing by zero."""
+    config = ConfigManager(config_dir=tmp_path)
+    config.set("movement.physics", "time")
+    config.set("movement.move_delay", 0)
+
+    total = _simulate_stroke(MovementController(config, mock_mouse), 250, 0.02)
+
+    assert config.movement_params.move_delay == pytest.approx(0.001)
+    assert total > 0
+
+
+def test_tick_physics_keeps_fractional_speed(movement_controller):
+    """Fractional base_speed * multiplier is carried, not truncated per tick."""
+    params = movement_controller._current_params()
+    movement_controller._active_dirs = {"down"}
+    movement_controller._running = True
+    movement_controller._scheduler.reset(0.0)
+    movement_controller._current_speed = 1.05
+    movement_controller._accelerate = lambda: None  # Hold the speed constant
+
+    total = sum(
+        movement_controller._step((i + 0.5) * params.tick_period)[1] for i in range(100)
+    )
+
+    assert total == pytest.approx(params.base_speed * 1.05 * 100, abs=1)
@@ -341,41 +341,44 @@ class TestScrollControllerThreading:
     """Test threading and thread safety."""
 
     def test_scroll_thread_is_daemon(self, scroll_controller):
-        """Test scroll thread is a daemon thread."""
+        """Test the motion engine thread is a daemon thread."""
         scroll_controller.start_direction("up")
         time.sleep(0.05)
-        if scroll_controller._scroll_thread:
-            assert scroll_controller._scroll_thread.daemon is True
+        thread = scroll_controller._engine.thread
+        assert thread is not None
+        assert thread.daemon is True
 
     def test_thread_reused_when_already_running(self, scroll_controller, mock_mouse):
         """Test thread is reused if already running."""
         scroll_controller.start_direction("up")
         time.sleep(0.1)
-        thread1 = scroll_controller._scroll_thread
+        thread1 = scroll_controller._engine.thread
 
         scroll_controller.start_direction("right")
         time.sleep(0.05)
-        thread2 = scroll_controller._scroll_thread
+        thread2 = scroll_controller._engine.thread
 
         # Same thread should be reused
         assert thread1 == thread2
 
-    def test_new_thread_started_if_old_died(self, scroll_controller, mock_mouse):
-        """Test new thread created if previous one died."""
+    def test_thread_persists_across_strokes(self, scroll_controller, mock_mouse):
+        """Test the engine thread idles between strokes instead of exiting."""
         scroll_controller.start_direction("up")
         time.sleep(0.1)
-        thread1 = scroll_controller._scroll_thread
+        thread1 = scroll_controller._engine.thread
 
         scroll_controller.stop_direction("up")
-        time.sleep(0.1)  # Let thread exit
-        assert not thread1.is_alive()
+        time.sleep(0.1)  # Let engine go idle
+        assert thread1.is_alive()
+        assert scroll_controller._running is False
+        calls = mock_mouse.scroll.call_count
+        time.sleep(0.05)
+        assert mock_mouse.scroll.call_count == calls  # Idle: no ticks
 
         scroll_controller.start_direction("down")
         time.sleep(0.05)
-        thread2 = scroll_controller._scroll_thread
-
-        # New thread should be created
-        assert thread1 != thread2
+        assert scroll_controller._engine.thread is thread1
+        assert mock_mouse.scroll.call_count > calls
 
 
 class TestScrollControllerConfigIntegration:
@@ -493,3 +496,86 @@ class TestScrollControllerDaemonIntegration:
 
         scroll.stop_all()
         assert scroll._active_dirs == set()
+
+
+class HiResMouse:
+    """Mouse stub advertising hi-res wheel support like UinputMouse."""
+
+    hi_res_wheel = True
+
+    def __init__(self):
+        self.scroll = MagicMock()
+        self.scroll_hi_res = MagicMock()
+        self.move = MagicMock()
+
+
+class TestHiResScroll:
+    def test_mock_mice_keep_notch_scrolling(self, scroll_controller):
+        """Mice without a real hi_res_wheel flag scroll in whole notches."""
+        assert scroll_controller._hi_res_capable is False
+        assert scroll_controller._scheduler.period == pytest.approx(0.03)
+
+    def test_hi_res_ticks_faster_in_120ths(self, config):
+        """Hi-res mode ticks at hi_res_rate and emits 1/120-notch units."""
+        controller = ScrollController(config, HiResMouse())
+        assert controller._scheduler.period == pytest.approx(1 / 120)
+
+        controller._active_dirs.add("up")
+        controller._running = True
+        controller._scheduler.reset(0.0)
+        dx, dy = controller._step(0.0)
+
+        assert controller.hi_res is True
+        # 3 notches per 30 ms spread over 1/120 s ticks = 100 units
+        assert (dx, dy) == (0, 100)
+
+    def test_hi_res_distance_matches_notch_rate(self, config):
+        """Over time hi-res scrolling covers the same distance as notches."""
+        config.set("scroll.acceleration_rate", 1.0)
+        config.set("scroll.hi_res_rate", 1000)
+        controller = ScrollController(config, HiResMouse())
+        controller._active_dirs.add("down")
+        controller._running = True
+        controller._scheduler.reset(0.0)
+
+        total = sum(controller._step((i + 0.5) / 1000)[1] for i in range(300))
+
+        # 0.3 s = 10 notch ticks of 3 notches each
+        assert total == pytest.approx(-30 * 120, abs=1)
+
+    def test_hi_res_disabled_in_config(self, config):
+        """scroll.hi_res = false falls back to notch ticks."""
+        config.set("scroll.hi_res", False)
+        controller = ScrollController(config, HiResMouse())
+        controller._active_dirs.add("up")
+        controller._running = True
+        controller._scheduler.reset(0.0)
+
+        assert controller._step(0.0) == (0, 3)
+        assert controller.hi_res is False
+
+    def test_zero_delay_is_clamped(self, config):
+        """scroll.delay = 0 ticks at the 1 ms floor instead of dividing by zero."""
+        config.set("scroll.delay", 0)
+        controller = ScrollController(config, HiResMouse())
+        controller._active_dirs.add("up")
+        controller._running = True
+        controller._scheduler.reset(0.0)
+
+        dx, dy = controller._step(0.0)
+
+        assert config.scroll_params.delay == pytest.approx(0.001)
+        assert dx == 0 and dy > 0
+
+    def test_engine_routes_hi_res_units(self, config):
+        """The motion engine sends hi-res results to scroll_hi_res()."""
+        mouse = HiResMouse()
+        controller = ScrollController(config, mouse)
+        controller._active_dirs.add("right")
+        controller._running = True
+        controller._scheduler.reset(0.0)
+
+        controller._engine.tick(0.0)
+
+        mouse.scroll_hi_res.assert_called_once_with(100, 0)
+        mouse.scroll.assert_not_called()
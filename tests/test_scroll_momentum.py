@@ -0,0 +1,135 @@
+"""Tests for kinetic scroll momentum."""
+
+import math
+
+import pytest
+
+from mouse_on_numpad.core.config import ConfigManager
+from mouse_on_numpad.core.config_params import ScrollParams
+from mouse_on_numpad.input.scroll_controller import ScrollController
+from mouse_on_numpad.input.scroll_momentum import MomentumPhase
+
+
+class HiResMouse:
+    """Mouse stub advertising hi-res wheel support like UinputMouse."""
+
+    hi_res_wheel = True
+
+    def scroll(self, dx, dy):
+        pass
+
+    def scroll_hi_res(self, dx, dy):
+        pass
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Config with momentum enabled."""
+    config = ConfigManager(config_dir=tmp_path)
+    config.set("scroll.momentum", True)
+    return config
+
+
+def test_phase_travels_v0_over_friction():
+    """Total coast distance approaches v0 / friction."""
+    phase = MomentumPhase(0.0, 50.0, 0.0)
+    total = 0.0
+    t = 0.0
+    while (step := phase.advance(t, 5.0, 0.01)) is not None:
+        total += step[1]
+        t += 0.01
+    assert total == pytest.approx(50.0 / 5.0, rel=1e-3)
+
+
+def test_phase_independent_of_step_size():
+    """Uneven ticks integrate to the same distance as even ones."""
+    even = MomentumPhase(20.0, 0.0, 0.0)
+    uneven = MomentumPhase(20.0, 0.0, 0.0)
+    a = sum(even.advance(i * 0.01, 3.0, 0.0)[0] for i in range(1, 101))
+    b = sum(uneven.advance(t, 3.0, 0.0)[0] for t in (0.003, 0.2, 0.21, 0.7, 1.0))
+    assert a == pytest.approx(b)
+    assert a == pytest.approx(20.0 / 3.0 * (1 - math.exp(-3.0)))
+
+
+def test_phase_stops_below_min_speed_and_on_cancel():
+    """The phase ends at min_speed, or immediately once cancelled."""
+    phase = MomentumPhase(0.0, 10.0, 0.0)
+    assert phase.advance(1.0, 4.0, 1.0) is not None  # Decays to ~0.18
+    assert phase.advance(1.1, 4.0, 1.0) is None
+
+    phase = MomentumPhase(0.0, 10.0, 0.0)
+    phase.cancel()
+    assert phase.advance(0.5, 4.0, 1.0) is None
+
+
+def _held_then_released(config):
+    """Scroll up at base speed, then release the key."""
+    controller = ScrollController(config, HiResMouse())
+    controller.start_direction("up")
+    controller._engine.stop()  # Drive _step by hand
+    controller.stop_direction("up")
+    return controller
+
+
+def test_release_hands_off_to_momentum(config):
+    """Releasing a key keeps scrolling in the same direction, decelerating."""
+    controller = _held_then_released(config)
+    momentum = controller._momentum
+    assert momentum is not None
+    assert controller._running is True
+
+    start = momentum.last
+    controller._scheduler.reset(start)
+    steps = [controller._step(start + i / 120)[1] for i in range(1, 60)]
+
+    assert all(dy >= 0 for dy in steps)
+    assert steps[5] > steps[-1] > 0  # Slowing down, still moving
+    assert controller.hi_res is True
+
+
+def test_momentum_comes_to_rest(config):
+    """The coast ends by itself and the controller goes idle."""
+    config.set("scroll.friction", 50.0)
+    controller = _held_then_released(config)
+    start = controller._momentum.last
+    controller._scheduler.reset(start)
+
+    for i in range(1, 200):
+        controller._step(start + i / 120)
+
+    assert controller._momentum is None
+    assert controller._running is False
+
+
+def test_zero_friction_still_comes_to_rest(config):
+    """Friction and end speed of 0 are clamped, so the coast cannot run forever."""
+    config.set("scroll.friction", 0.0)
+    config.set("scroll.momentum_min_speed", 0.0)
+    params = ScrollParams.from_config(config)
+    phase = MomentumPhase(0.0, 10.0, now=0.0)
+
+    assert params.friction > 0
+    assert params.momentum_min_speed > 0
+    for i in range(1, 10_000):
+        if phase.advance(float(i), params.friction, params.momentum_min_speed) is None:
+            break
+    assert phase.cancelled
+
+
+def test_key_press_cancels_momentum(config):
+    """cancel_momentum() stops the coast on the very next tick."""
+    controller = _held_then_released(config)
+    start = controller._momentum.last
+    controller._scheduler.reset(start)
+    controller._step(start + 1 / 120)
+
+    controller.cancel_momentum()
+
+    assert controller._step(start + 2 / 120) == (0, 0)
+    assert controller._running is False
+
+
+def test_momentum_disabled_by_default(tmp_path):
+    """Without scroll.momentum releasing stops dead."""
+    controller = _held_then_released(ConfigManager(config_dir=tmp_path))
+    assert controller._momentum is None
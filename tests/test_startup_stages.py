@@ -0,0 +1,83 @@
+"""Tests for staged daemon startup."""
+
+import threading
+
+import pytest
+
+from mouse_on_numpad.core.error_logger import ErrorLogger
+from mouse_on_numpad.daemon.startup_stages import StartupStages
+
+
+@pytest.fixture
+def logger(tmp_path):
+    """Create an ErrorLogger writing to a temp directory."""
+    return ErrorLogger(log_dir=tmp_path)
+
+
+@pytest.fixture
+def stages(logger):
+    """Create StartupStages and release its workers afterwards."""
+    stages = StartupStages(logger)
+    yield stages
+    stages.shutdown()
+
+
+def test_run_returns_result_and_times_stage(stages):
+    """Foreground stages run inline and are timed."""
+    assert stages.run("mouse", lambda a, b: a + b, 2, 3) == 5
+    assert stages.durations["mouse"] >= 0.0
+
+
+def test_background_stages_run_concurrently(stages):
+    """Submitted stages overlap instead of running one after another."""
+    barrier = threading.Barrier(2, timeout=2.0)
+
+    def stage(name):
+        barrier.wait()  # Deadlocks (times out) unless both run at once
+        return name
+
+    stages.submit("monitors", lambda: stage("monitors"))
+    stages.submit("audio", lambda: stage("audio"))
+
+    assert stages.get("monitors") == "monitors"
+    assert stages.get("audio") == "audio"
+    assert set(stages.durations) == {"monitors", "audio"}
+
+
+def test_dependency_result_passed(stages):
+    """A stage gets the results of the stages it runs after."""
+    stages.submit("monitors", lambda: ["DP-1"])
+    stages.submit("positions", lambda monitors: {"monitors": monitors}, after=("monitors",))
+
+    assert stages.get("positions") == {"monitors": ["DP-1"]}
+
+
+def test_failed_stage_logged_and_none(stages, logger):
+    """A failing stage yields None; its dependents fail too."""
+    def broken():
+        raise OSError("no display")
+
+    stages.submit("monitors", broken)
+    stages.submit("positions", lambda monitors: monitors, after=("monitors",))
+    stages.wait()
+    stages.shutdown(wait=True)  # Done callbacks (logging) have run
+
+    assert stages.get("monitors") is None
+    assert stages.get("positions") is None
+    assert "Startup stage monitors failed: no display" in logger.log_file.read_text()
+
+
+def test_summary_logged_once_when_done(stages, logger):
+    """report_when_done() logs every stage's duration to the daemon log."""
+    release = threading.Event()
+    stages.run("mouse", lambda: None)
+    stages.submit("audio", release.wait)
+
+    stages.report_when_done()
+    assert "Startup complete" not in logger.log_file.read_text()
+    release.set()
+    stages.shutdown(wait=True)
+
+    log = logger.log_file.read_text()
+    assert log.count("Startup complete") == 1
+    assert "mouse" in log and "audio" in log
@@ -0,0 +1,165 @@
+"""Tests for the push-based status channel."""
+
+import os
+import socket
+import time
+
+import pytest
+
+from mouse_on_numpad.core.status_channel import (
+    MAX_MESSAGE,
+    StatusPublisher,
+    connect_status,
+    decode_status,
+    runtime_dir,
+)
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    """Create a listening StatusPublisher on a temporary socket."""
+    pub = StatusPublisher(tmp_path / "status.sock")
+    assert pub.start()
+    yield pub
+    pub.close()
+
+
+def _subscribe(publisher: StatusPublisher) -> socket.socket:
+    """Connect a subscriber and wait until the publisher has accepted it."""
+    subscribers = publisher.subscribers
+    sock = connect_status(publisher.path)
+    assert sock is not None
+    deadline = time.monotonic() + 2.0
+    while publisher.subscribers == subscribers and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return sock
+
+
+def _receive(sock: socket.socket) -> list[dict]:
+    """Read every pending status message."""
+    messages = []
+    deadline = time.monotonic() + 0.5
+    while time.monotonic() < deadline:
+        try:
+            data = sock.recv(MAX_MESSAGE)
+        except BlockingIOError:
+            if messages:
+                break
+            time.sleep(0.001)
+            continue
+        messages.append(decode_status(data))
+    return messages
+
+
+def test_current_status_sent_on_connect(publisher):
+    """A new subscriber immediately gets the latest status."""
+    publisher.publish(enabled=True, mode="normal")
+
+    sock = _subscribe(publisher)
+
+    assert _receive(sock) == [{"enabled": True, "mode": "normal"}]
+    sock.close()
+
+
+def test_changes_pushed_as_separate_messages(publisher):
+    """Each change arrives as its own datagram with the merged status."""
+    publisher.publish(enabled=False)
+    sock = _subscribe(publisher)
+    _receive(sock)
+
+    publisher.publish(enabled=True)
+    publisher.publish(mode="save")
+
+    assert _receive(sock) == [
+        {"enabled": True},
+        {"enabled": True, "mode": "save"},
+    ]
+    sock.close()
+
+
+def test_unchanged_status_not_resent(publisher):
+    """Publishing the same values again sends nothing."""
+    publisher.publish(enabled=True)
+    sock = _subscribe(publisher)
+    _receive(sock)
+
+    publisher.publish(enabled=True)
+
+    with pytest.raises(BlockingIOError):
+        sock.recv(MAX_MESSAGE)
+    sock.close()
+
+
+def test_disconnected_subscriber_dropped(publisher):
+    """A subscriber that went away is removed on the next publish."""
+    sock = _subscribe(publisher)
+    sock.close()
+
+    publisher.publish(enabled=True)
+
+    assert publisher.subscribers == 0
+
+
+def test_close_removes_socket(tmp_path):
+    """Closing the publisher unlinks the socket and disconnects subscribers."""
+    pub = StatusPublisher(tmp_path / "status.sock")
+    pub.start()
+    sock = _subscribe(pub)
+    _receive(sock)
+
+    pub.close()
+
+    assert not pub.path.exists()
+    sock.setblocking(True)
+    assert sock.recv(MAX_MESSAGE) == b""
+    sock.close()
+
+
+def test_connect_without_daemon(tmp_path):
+    """Connecting returns None when no daemon is listening."""
+    assert connect_status(tmp_path / "missing.sock") is None
+
+
+def test_decode_rejects_malformed():
+    """Garbage and non-object messages are ignored."""
+    assert decode_status(b"not json") is None
+    assert decode_status(b"[1, 2]") is None
+
+
+def test_runtime_dir_prefers_xdg(monkeypatch, tmp_path):
+    """Sockets live under $XDG_RUNTIME_DIR when it is set."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert runtime_dir() == tmp_path / "mouse-on-numpad"
+
+
+def test_shared_socket_dir_refused(tmp_path):
+    """A socket directory other users can enter is not used."""
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o755)
+    os.chmod(shared, 0o755)
+    pub = StatusPublisher(shared / "status.sock")
+
+    assert pub.start() is False
+    assert not (shared / "status.sock").exists()
+
+
+def test_symlinked_socket_dir_refused(tmp_path):
+    """A symlink planted at the socket directory is not followed."""
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    (tmp_path / "link").symlink_to(target)
+    pub = StatusPublisher(tmp_path / "link" / "status.sock")
+
+    assert pub.start() is False
+    assert not (target / "status.sock").exists()
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="needs root to chown")
+def test_foreign_socket_dir_refused(tmp_path):
+    """A 0700 directory owned by another user is not used."""
+    foreign = tmp_path / "foreign"
+    foreign.mkdir(mode=0o700)
+    os.chown(foreign, os.getuid() + 1, -1)
+    pub = StatusPublisher(foreign / "status.sock")
+
+    assert pub.start() is False
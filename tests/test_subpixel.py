@@ -0,0 +1,43 @@
+"""Tests for SubpixelAccumulator."""
+
+import pytest
+
+from mouse_on_numpad.input.subpixel import SubpixelAccumulator
+
+
+def test_fractions_accumulate_to_whole_pixels():
+    """Deltas below one pixel are carried until they add up."""
+    acc = SubpixelAccumulator()
+    emitted = [acc.add(0.25, 0.0)[0] for _ in range(8)]
+    assert emitted == [0, 0, 0, 1, 0, 0, 0, 1]
+
+
+def test_total_matches_requested_distance():
+    """emitted + remainder equals the exact sum on both axes."""
+    acc = SubpixelAccumulator()
+    total_x = total_y = 0
+    for _ in range(1000):
+        dx, dy = acc.add(0.37, -0.37)  # Diagonal up-right
+        total_x += dx
+        total_y += dy
+    rx, ry = acc.remainder
+    assert total_x + rx == pytest.approx(370.0)
+    assert total_y + ry == pytest.approx(-370.0)
+    assert abs(rx) < 1 and abs(ry) < 1
+
+
+def test_negative_motion_truncates_toward_zero():
+    """Leftward motion keeps a negative remainder instead of overshooting."""
+    acc = SubpixelAccumulator()
+    assert acc.add(-1.5, 0.0) == (-1, 0)
+    assert acc.remainder[0] == pytest.approx(-0.5)
+    assert acc.add(-0.5, 0.0) == (-1, 0)
+
+
+def test_reset_clears_remainder():
+    """reset() drops the carried fraction."""
+    acc = SubpixelAccumulator()
+    acc.add(0.9, 0.9)
+    acc.reset()
+    assert acc.remainder == (0.0, 0.0)
+    assert acc.add(0.2, 0.2) == (0, 0)
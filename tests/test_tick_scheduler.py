@@ -0,0 +1,96 @@
+"""Tests for TickScheduler deadline pacing."""
+
+import pytest
+
+from mouse_on_numpad.input.tick_scheduler import TickScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+def test_first_tick_due_immediately(clock):
+    """A fresh scheduler fires on the first poll."""
+    sched = TickScheduler(0.02, clock=clock)
+    assert sched.poll() == 1
+    assert sched.next_deadline == pytest.approx(100.02)
+
+
+def test_not_due_before_deadline(clock):
+    """Polling before the deadline returns zero ticks."""
+    sched = TickScheduler(0.02, clock=clock)
+    sched.poll()
+    clock.now += 0.01
+    assert sched.poll() == 0
+
+
+def test_deadlines_do_not_drift_with_work(clock):
+    """Late ticks keep the deadline grid anchored to the start time."""
+    sched = TickScheduler(0.02, clock=clock)
+    sched.poll()
+    for n in range(1, 51):
+        # Each tick runs 5 ms late (simulated work/GIL contention)
+        clock.now = 100.0 + n * 0.02 + 0.005
+        assert sched.poll() == 1
+    assert sched.next_deadline == pytest.approx(100.0 + 51 * 0.02)
+    stats = sched.stats
+    assert stats.ticks == 51
+    assert stats.missed == 0
+    assert stats.jitter_max == pytest.approx(0.005)
+
+
+def test_overrun_reports_catch_up_ticks(clock):
+    """Missed deadlines are returned as extra ticks and counted."""
+    sched = TickScheduler(0.02, clock=clock)
+    sched.poll()
+    clock.now += 0.065  # Deadlines at +20, +40, +60 ms all passed
+    assert sched.poll() == 3
+    assert sched.stats.missed == 2
+    assert sched.next_deadline == pytest.approx(100.08)
+
+
+def test_catch_up_is_bounded(clock):
+    """Long stalls replay at most max_catch_up ticks; the rest are dropped."""
+    sched = TickScheduler(0.01, max_catch_up=2, clock=clock)
+    sched.poll()
+    clock.now += 0.105  # 10 deadlines elapsed
+    assert sched.poll() == 3
+    stats = sched.stats
+    assert stats.missed == 9
+    assert stats.dropped == 7
+
+
+def test_set_period_and_reset(clock):
+    """Period changes apply to the next deadline; reset restarts the grid."""
+    sched = TickScheduler(0.02, clock=clock)
+    sched.set_period(0.01)
+    assert sched.period == 0.01
+    assert sched.stats.period == 0.01
+
+    clock.now += 5.0
+    sched.reset()
+    assert sched.poll() == 1
+    assert sched.stats.missed == 0
+
+
+def test_wait_sleeps_until_deadline():
+    """wait() blocks on the real monotonic clock until the tick is due."""
+    import time
+
+    sched = TickScheduler(0.01)
+    start = time.monotonic()
+    assert sched.wait() >= 1
+    assert sched.wait() >= 1
+    assert time.monotonic() - start >= 0.009
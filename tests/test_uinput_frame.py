@@ -0,0 +1,271 @@
+"""Tests for batched uinput event emission."""
+
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mouse_on_numpad.input.uinput_frame import (
+    EV_KEY,
+    EV_REL,
+    EV_SYN,
+    EVENT_SIZE,
+    INPUT_EVENT,
+    REL_HWHEEL,
+    REL_HWHEEL_HI_RES,
+    REL_WHEEL,
+    REL_WHEEL_HI_RES,
+    REL_X,
+    REL_Y,
+    FrameWriter,
+)
+
+
+@pytest.fixture
+def pipe():
+    """Provide a (read_fd, write_fd) pair standing in for /dev/uinput."""
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def _events(read_fd: int) -> list[tuple[int, int, int]]:
+    """Read and decode everything written so far as (type, code, value)."""
+    data = os.read(read_fd, 65536)
+    assert len(data) % EVENT_SIZE == 0
+    return [
+        INPUT_EVENT.unpack_from(data, offset)[2:]
+        for offset in range(0, len(data), EVENT_SIZE)
+    ]
+
+
+def test_rel_frame_single_write(pipe):
+    """A full frame goes out in one write, terminated by SYN_REPORT."""
+    read_fd, write_fd = pipe
+    writer = FrameWriter(write_fd)
+
+    writer.rel_frame(3, -4, 1, -1, {0x110: 1})
+
+    assert writer.writes == 1
+    assert _events(read_fd) == [
+        (EV_KEY, 0x110, 1),
+        (EV_REL, REL_X, 3),
+        (EV_REL, REL_Y, -4),
+        (EV_REL, REL_WHEEL, 1),
+        (EV_REL, REL_HWHEEL, -1),
+        (EV_SYN, 0, 0),
+    ]
+
+
+def test_zero_axes_are_skipped(pipe):
+    """Only non-zero axes are emitted."""
+    read_fd, write_fd = pipe
+    FrameWriter(write_fd).rel_frame(dy=7)
+    assert _events(read_fd) == [(EV_REL, REL_Y, 7), (EV_SYN, 0, 0)]
+
+
+def test_buffer_flushes_when_full(pipe):
+    """Overflowing the buffer flushes early instead of dropping events."""
+    read_fd, write_fd = pipe
+    writer = FrameWriter(write_fd, max_events=2)
+    for i in range(5):
+        writer.add(EV_REL, REL_X, i)
+    writer.flush()
+
+    assert writer.writes == 3
+    assert [value for _, _, value in _events(read_fd)] == [0, 1, 2, 3, 4]
+
+
+def test_uinput_mouse_uses_one_write_per_call(pipe):
+    """UinputMouse move/scroll/click each cost a single write."""
+    read_fd, write_fd = pipe
+    ui = MagicMock(fd=write_fd)
+    with (
+        patch("mouse_on_numpad.input.uinput_mouse.os.path.exists", return_value=True),
+        patch("mouse_on_numpad.input.uinput_mouse.os.access", return_value=True),
+        patch("mouse_on_numpad.input.uinput_mouse.UInput", return_value=ui),
+    ):
+        from mouse_on_numpad.input.uinput_mouse import UinputMouse
+
+        mouse = UinputMouse()
+
+    mouse.move(5, 6)
+    mouse.scroll(0, -2)
+    mouse.click("right")
+    mouse.emit_frame(1, 1, buttons={"left": True})
+
+    assert mouse._frame.writes == 4
+    events = _events(read_fd)
+    assert events[:3] == [(EV_REL, REL_X, 5), (EV_REL, REL_Y, 6), (EV_SYN, 0, 0)]
+    assert (EV_REL, REL_WHEEL, -2) in events
+    assert events.count((EV_SYN, 0, 0)) == 5  # click = press + release frames
+    ui.write.assert_not_called()
+    ui.syn.assert_not_called()
+
+
+def test_hi_res_scroll_synthesizes_legacy_notches(pipe):
+    """Hi-res units add a REL_WHEEL notch every 120 units, per direction."""
+    read_fd, write_fd = pipe
+    ui = MagicMock(fd=write_fd)
+    with (
+        patch("mouse_on_numpad.input.uinput_mouse.os.path.exists", return_value=True),
+        patch("mouse_on_numpad.input.uinput_mouse.os.access", return_value=True),
+        patch("mouse_on_numpad.input.uinput_mouse.UInput", return_value=ui),
+    ):
+        from mouse_on_numpad.input.uinput_mouse import UinputMouse
+
+        mouse = UinputMouse()
+
+    mouse.scroll_hi_res(0, 60)
+    assert _events(read_fd) == [(EV_REL, REL_WHEEL_HI_RES, 60), (EV_SYN, 0, 0)]
+    mouse.scroll_hi_res(0, 70)
+    assert _events(read_fd) == [
+        (EV_REL, REL_WHEEL, 1),
+        (EV_REL, REL_WHEEL_HI_RES, 70),
+        (EV_SYN, 0, 0),
+    ]
+    mouse.scroll_hi_res(0, -100)  # Reversal starts a fresh notch
+    assert _events(read_fd) == [(EV_REL, REL_WHEEL_HI_RES, -100), (EV_SYN, 0, 0)]
+    mouse.scroll(-1, 0)  # Whole notches are mirrored on the hi-res axis
+    assert _events(read_fd) == [
+        (EV_REL, REL_HWHEEL, -1),
+        (EV_REL, REL_HWHEEL_HI_RES, -120),
+        (EV_SYN, 0, 0),
+    ]
+
+
+def test_uinput_mouse_concurrent_writers_keep_frames_whole():
+    """Threads sharing one UinputMouse never lose or interleave events."""
+    read_fd, write_fd = os.pipe()
+    ui = MagicMock(fd=write_fd)
+    with (
+        patch("mouse_on_numpad.input.uinput_mouse.os.path.exists", return_value=True),
+        patch("mouse_on_numpad.input.uinput_mouse.os.access", return_value=True),
+        patch("mouse_on_numpad.input.uinput_mouse.UInput", return_value=ui),
+    ):
+        from mouse_on_numpad.input.uinput_mouse import UinputMouse
+
+        mouse = UinputMouse()
+
+    threads_n, rounds = 4, 200
+    expected = threads_n * rounds * (4 + 3 + 4)  # click, move, press + release
+    data = bytearray()
+
+    def reader():
+        while len(data) < expected * EVENT_SIZE:
+            data.extend(os.read(read_fd, 65536))
+
+    def writer(button):
+        for _ in range(rounds):
+            mouse.click(button)
+            mouse.move(1, -1)
+            mouse.press(button)
+            mouse.release(button)
+
+    drain = threading.Thread(target=reader, daemon=True)
+    drain.start()
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    try:
+        workers = [
+            threading.Thread(target=writer, args=(b,))
+            for b in ("left", "right", "middle", "left")
+        ]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    drain.join(timeout=5)
+    os.close(read_fd)
+    os.close(write_fd)
+
+    events = [
+        INPUT_EVENT.unpack_from(data, offset)[2:]
+        for offset in range(0, len(data), EVENT_SIZE)
+    ]
+    assert len(events) == expected
+    # Every frame is a single key change or a whole motion frame
+    frames, frame = [], []
+    for event in events:
+        frame.append(event)
+        if event[0] == EV_SYN:
+            frames.append(frame)
+            frame = []
+    assert frame == []
+    for f in frames:
+        assert f in (
+            [(EV_REL, REL_X, 1), (EV_REL, REL_Y, -1), (EV_SYN, 0, 0)],
+        ) or (len(f) == 2 and f[0][0] == EV_KEY)
+    # Presses and releases balance: no button is left stuck down
+    for code in {e[1] for e in events if e[0] == EV_KEY}:
+        values = [e[2] for e in events if e[:2] == (EV_KEY, code)]
+        assert values.count(1) == values.count(0)
+
+
+def test_evdev_backend_concurrent_writers_keep_frames_whole():
+    """Threads sharing one EvdevBackend never interleave frames."""
+    from mouse_on_numpad.backends.evdev_backend import EvdevBackend
+
+    read_fd, write_fd = os.pipe()
+    ui = MagicMock(fd=write_fd)
+    with (
+        patch("mouse_on_numpad.backends.evdev_backend.os.path.exists", return_value=True),
+        patch("mouse_on_numpad.backends.evdev_backend.os.access", return_value=True),
+        patch("evdev.UInput", return_value=ui),
+    ):
+        backend = EvdevBackend()
+
+    threads_n, rounds = 4, 200
+    expected = threads_n * rounds * (4 + 3)  # click, move
+    data = bytearray()
+
+    def reader():
+        while len(data) < expected * EVENT_SIZE:
+            data.extend(os.read(read_fd, 65536))
+
+    def writer(button):
+        for _ in range(rounds):
+            backend.click(button)
+            backend.move_mouse_relative(1, -1)
+
+    drain = threading.Thread(target=reader, daemon=True)
+    drain.start()
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible
+    try:
+        workers = [
+            threading.Thread(target=writer, args=(b,))
+            for b in ("left", "right", "middle", "left")
+        ]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    drain.join(timeout=5)
+    os.close(read_fd)
+    os.close(write_fd)
+
+    events = [
+        INPUT_EVENT.unpack_from(data, offset)[2:]
+        for offset in range(0, len(data), EVENT_SIZE)
+    ]
+    assert len(events) == expected
+    frames, frame = [], []
+    for event in events:
+        frame.append(event)
+        if event[0] == EV_SYN:
+            frames.append(frame)
+            frame = []
+    assert frame == []
+    for f in frames:
+        assert f in (
+            [(EV_REL, REL_X, 1), (EV_REL, REL_Y, -1), (EV_SYN, 0, 0)],
+        ) or (len(f) == 2 and f[0][0] == EV_KEY)
@@ -0,0 +1,94 @@
+"""Tests for the stroke-level undo ring buffer."""
+
+from mouse_on_numpad.input.undo_history import StrokeHistory
+
+
+def _stroke(history: StrokeHistory, dx: int, dy: int = 0, start: float = 0.0) -> None:
+    """Record a one-tick stroke."""
+    history.begin(start)
+    history.add(dx, dy, start + 0.1)
+    history.end(start + 0.2)
+
+
+def test_ring_overwrites_oldest_when_full():
+    """Only the newest `capacity` strokes are kept."""
+    history = StrokeHistory(3)
+    for dx in range(1, 6):
+        _stroke(history, dx)
+
+    assert len(history) == 3
+    assert [s.dx for s in history.strokes()] == [3, 4, 5]
+
+
+def test_ring_slots_are_reused():
+    """Appending to a full ring does not grow the backing storage."""
+    history = StrokeHistory(2)
+    ring = history._ring
+    for dx in range(1, 10):
+        _stroke(history, dx)
+    assert history._ring is ring and len(ring) == 2
+
+
+def test_undo_then_redo_order():
+    """Undo pops newest first; redo replays in reverse undo order."""
+    history = StrokeHistory(5)
+    _stroke(history, 1)
+    _stroke(history, 2)
+
+    assert history.undo().dx == 2
+    assert history.undo().dx == 1
+    assert history.undo() is None
+    assert history.redo().dx == 1
+    assert history.redo().dx == 2
+    assert history.redo() is None
+    assert [s.dx for s in history.strokes()] == [1, 2]
+
+
+def test_new_stroke_clears_redo():
+    """Moving after an undo discards the redo stack."""
+    history = StrokeHistory(5)
+    _stroke(history, 1)
+    history.undo()
+    _stroke(history, 9)
+
+    assert history.redo_depth == 0
+    assert history.redo() is None
+
+
+def test_stationary_stroke_not_recorded():
+    """Strokes with zero net displacement are dropped."""
+    history = StrokeHistory(5)
+    history.begin(0.0)
+    history.end(1.0)
+    assert len(history) == 0
+
+
+def test_undo_closes_open_stroke():
+    """Undo during a stroke reverses what has been moved so far."""
+    history = StrokeHistory(5)
+    history.begin(0.0)
+    history.add(4, 2, 0.1)
+
+    record = history.undo()
+    assert (record.dx, record.dy) == (4, 2)
+
+
+def test_set_capacity_keeps_newest():
+    """Shrinking keeps the newest strokes; growing keeps all of them."""
+    history = StrokeHistory(4)
+    for dx in range(1, 5):
+        _stroke(history, dx)
+
+    history.set_capacity(2)
+    assert [s.dx for s in history.strokes()] == [3, 4]
+    history.set_capacity(6)
+    _stroke(history, 5)
+    assert [s.dx for s in history.strokes()] == [3, 4, 5]
+
+
+def test_zero_capacity_disables_history():
+    """max_levels = 0 keeps nothing."""
+    history = StrokeHistory(0)
+    _stroke(history, 3)
+    assert len(history) == 0
+    assert history.undo() is None